@@ -0,0 +1,57 @@
+"""
+Benchmark: module catalog start-up cost
+Compares building the GRE modules in Python, parsing + validating the JSON
+catalog source, and loading its pickle snapshot (what each worker
+process pays on startup), best of REPEATS runs
+Usage: python benchmarks/catalog_loading.py [repeats]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.catalog import DEFAULT_CATALOG_SOURCE, ModuleCatalog
+from data.catalog_loader import load_catalog_modules, snapshot_path_for, write_snapshot
+from data.gre_modules import create_gre_quantitative_modules
+
+
+def best_ms(run, repeats):
+    """Fastest of repeats runs of run(), in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def run_benchmark(repeats):
+    write_snapshot(DEFAULT_CATALOG_SOURCE)
+
+    def python_build():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return create_gre_quantitative_modules()
+
+    loaders = [
+        ("python build", python_build),
+        ("json parse + validate", lambda: load_catalog_modules(DEFAULT_CATALOG_SOURCE, use_snapshot=False)),
+        ("snapshot", lambda: load_catalog_modules(DEFAULT_CATALOG_SOURCE)),
+    ]
+
+    print(f"📈 CATALOG LOADING ({os.path.basename(DEFAULT_CATALOG_SOURCE)}, "
+          f"{os.path.getsize(snapshot_path_for(DEFAULT_CATALOG_SOURCE))} byte snapshot)")
+    print("=" * 50)
+    for label, load in loaders:
+        print(f"{label:>24} | {best_ms(load, repeats):>8.2f} ms")
+    print("-" * 50)
+    name, modules = load_catalog_modules(DEFAULT_CATALOG_SOURCE)
+    print(f"{'+ catalog indexes':>24} | {best_ms(lambda: ModuleCatalog(modules, name), repeats):>8.2f} ms")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,48 @@
+"""
+Benchmark: exact branch-and-bound (with GA fallback) vs the GA alone
+Usage: python benchmarks/exact_solver.py [students]
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+from optimization.exact_solver import ExactSolverGA
+
+
+def run_benchmark(student_count):
+    students = create_synthetic_students(student_count, seed=21)
+
+    print(f"📈 EXACT SOLVER VS GA ({student_count} students)")
+    print("=" * 72)
+    print(f"{'student':>8} | {'candidates':>10} | {'engine':>6} | {'fitness':>7} | {'ms':>6} | "
+          f"{'GA fitness':>10} | {'GA ms':>6}")
+    print("-" * 72)
+    totals = {"exact": [0, 0.0, 0.0], "ga": [0, 0.0, 0.0]}
+    for index, student in enumerate(students):
+        with contextlib.redirect_stdout(io.StringIO()):
+            solver = ExactSolverGA(seed=index)
+            path = solver.evolve(student)
+            ga = LearningPathGA(seed=index)
+            ga_path = ga.evolve(student)
+        ga_ms = ga.run_stats["elapsed_ms"]
+        candidates = solver.run_stats["exact_search"]["candidates"]
+        print(f"{index:>8} | {candidates:>10} | {path.engine:>6} | {path.fitness:>7.4f} | "
+              f"{path.solve_time_ms:>6.0f} | {ga_path.fitness:>10.4f} | {ga_ms:>6.0f}")
+        totals[path.engine][0] += 1
+        totals[path.engine][1] += path.solve_time_ms
+        totals[path.engine][2] += ga_ms
+
+    for engine, (count, solve_ms, ga_ms) in totals.items():
+        if count:
+            print(f"{engine}: {count} students, mean {solve_ms / count:.0f}ms vs GA {ga_ms / count:.0f}ms")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
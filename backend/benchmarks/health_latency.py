@@ -0,0 +1,94 @@
+"""
+Load test: /health latency while path generations are running
+Fires concurrent /generate-path requests (distinct seeds, so the path cache
+never answers them) and polls /health until they finish
+Usage: python benchmarks/health_latency.py [ga_requests] [thread|process]
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+HEALTH_INTERVAL = 0.02
+STUDENT = {
+    "name": "Load Test",
+    "target_score": 160,
+    "available_time_week": 360,
+    "known_concepts": {"integers": 40, "fractions": 80, "ratios": 30, "linear_equations": 55},
+}
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def poll_health(client, stop, latencies):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/health")
+        response.raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(HEALTH_INTERVAL)
+
+
+async def measure(client, ga_requests):
+    latencies = []
+    stop = asyncio.Event()
+    poller = asyncio.create_task(poll_health(client, stop, latencies))
+    start = time.perf_counter()
+    if ga_requests:
+        responses = await asyncio.gather(*[
+            client.post("/generate-path", json=dict(STUDENT, seed=seed)) for seed in range(ga_requests)
+        ])
+        statuses = [response.status_code for response in responses]
+    else:
+        await asyncio.sleep(1.0)
+        statuses = []
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await poller
+    return latencies, statuses, elapsed
+
+
+async def run_benchmark(ga_requests):
+    import main
+    main.ga_executor.max_pending = max(main.ga_executor.max_pending, ga_requests)
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=None) as client:
+        idle, _, _ = await measure(client, 0)
+        loaded, statuses, elapsed = await measure(client, ga_requests)
+    main.ga_executor.shutdown()
+    return main.ga_executor, idle, loaded, statuses, elapsed
+
+
+def report(executor, idle, loaded, statuses, elapsed):
+    print(f"📈 /health LATENCY ({executor.kind} executor, {executor.workers} workers)")
+    print("=" * 60)
+    print(f"{'phase':>22} | {'samples':>7} | {'p50 ms':>7} | {'p99 ms':>7}")
+    print("-" * 60)
+    for name, samples in (("idle", idle), (f"{len(statuses)} GA requests", loaded)):
+        print(f"{name:>22} | {len(samples):>7} | {percentile(samples, 0.5):>7.1f} | {percentile(samples, 0.99):>7.1f}")
+    ok = sum(1 for status in statuses if status == 200)
+    print(f"GA requests: {ok}/{len(statuses)} succeeded in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        os.environ["GA_EXECUTOR"] = sys.argv[2]
+    # GA and module-loading output would drown the results
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        results = asyncio.run(run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50))
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+    report(*results)
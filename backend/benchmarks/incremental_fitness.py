@@ -0,0 +1,96 @@
+"""
+Microbenchmark: incremental (prefix-state) vs full fitness rescoring of mutants
+Usage: python benchmarks/incremental_fitness.py [repeats]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_sample_student
+from optimization.delta_fitness import PathState
+
+PATH_LENGTHS = [10, 20, 40]
+MUTANTS = 500
+
+
+def swap(sequence, modules):
+    i, j = random.sample(range(len(sequence)), 2)
+    sequence[i], sequence[j] = sequence[j], sequence[i]
+
+
+def insert(sequence, modules):
+    unused = [m for m in modules if m not in sequence]
+    sequence.insert(random.randint(0, len(sequence)), random.choice(unused))
+
+
+def remove(sequence, modules):
+    sequence.pop(random.randrange(len(sequence)))
+
+
+def scramble(sequence, modules):
+    start, end = sorted(random.sample(range(len(sequence)), 2))
+    segment = sequence[start:end]
+    random.shuffle(segment)
+    sequence[start:end] = segment
+
+
+MUTATIONS = {"swap": swap, "insert": insert, "remove": remove, "scramble": scramble}
+
+
+def make_mutants(ga, context, length, mutation):
+    mutants = []
+    for _ in range(MUTANTS):
+        parent = PathState(random.sample(ga.modules, length), context)
+        sequence = list(parent.sequence)
+        mutation(sequence, ga.modules)
+        mutants.append((parent, sequence))
+    return mutants
+
+
+def time_full(ga, student, context, mutants, repeats):
+    paths = [ga.LearningPath(sequence) for _, sequence in mutants]
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for path in paths:
+            ga.calculate_fitness(path, student, context)
+    return (time.perf_counter() - start) / (repeats * len(paths))
+
+
+def time_incremental(mutants, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for parent, sequence in mutants:
+            PathState.derive(sequence, parent)
+    return (time.perf_counter() - start) / (repeats * len(mutants))
+
+
+def run_benchmark(repeats):
+    random.seed(0)
+    student = create_sample_student()
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = LearningPathGA()
+    context = ga.build_context(student)
+
+    print(f"📈 MUTANT RESCORING ({MUTANTS} mutants x {repeats} repeats)")
+    print("=" * 66)
+    print(f"{'mutation':>9} | {'length':>6} | {'full us':>8} | {'incremental us':>14} | {'speedup':>7}")
+    print("-" * 66)
+    for name, mutation in MUTATIONS.items():
+        for length in PATH_LENGTHS:
+            mutants = make_mutants(ga, context, length, mutation)
+            full = time_full(ga, student, context, mutants, repeats)
+            incremental = time_incremental(mutants, repeats)
+            print(f"{name:>9} | {length:>6} | {full * 1e6:>8.1f} | {incremental * 1e6:>14.1f} | "
+                  f"{full / incremental:>6.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
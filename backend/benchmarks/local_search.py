@@ -0,0 +1,49 @@
+"""
+Benchmark: memetic local search vs simply running more generations
+Usage: python benchmarks/local_search.py [students]
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+
+CONFIGURATIONS = {
+    "10 generations": {"generations": 10},
+    "10 gens + local search": {"generations": 10, "local_search_iterations": 2000},
+    "100 generations": {"generations": 100},
+}
+
+
+def run_configuration(params, students):
+    fitness = []
+    start = time.perf_counter()
+    for index, student in enumerate(students):
+        with contextlib.redirect_stdout(io.StringIO()):
+            ga = LearningPathGA(population_size=50, seed=index, **params)
+            fitness.append(ga.evolve(student).fitness)
+    elapsed = time.perf_counter() - start
+    return sum(fitness) / len(fitness), elapsed * 1000 / len(students)
+
+
+def run_benchmark(student_count):
+    students = create_synthetic_students(student_count, seed=7)
+
+    print(f"📈 LOCAL SEARCH REFINEMENT ({student_count} students)")
+    print("=" * 60)
+    print(f"{'configuration':>24} | {'mean fitness':>12} | {'ms/student':>10}")
+    print("-" * 60)
+    for name, params in CONFIGURATIONS.items():
+        mean_fitness, ms_per_student = run_configuration(params, students)
+        print(f"{name:>24} | {mean_fitness:>12.4f} | {ms_per_student:>10.1f}")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,56 @@
+"""
+Benchmark: serial vs process-pool population evaluation
+Usage: python benchmarks/parallel_evaluation.py [workers]
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_sample_student
+
+POPULATION_SIZES = [50, 200, 800, 3200]
+REPEATS = 5
+
+
+def random_population(ga, size):
+    return [ga.LearningPath(random.sample(ga.modules, random.randint(8, 20))) for _ in range(size)]
+
+
+def time_evaluation(ga, population, student):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        ga.evaluate_population(population, student)
+    return (time.perf_counter() - start) / REPEATS
+
+
+def run_benchmark(workers):
+    student = create_sample_student()
+    with contextlib.redirect_stdout(io.StringIO()):
+        # No fitness cache: every repeat must score the population again
+        serial_ga = LearningPathGA(fitness_cache_size=0)
+        parallel_ga = LearningPathGA(parallel_workers=workers, fitness_cache_size=0)
+
+    print(f"📈 POPULATION EVALUATION ({workers} workers, {REPEATS} repeats)")
+    print("=" * 60)
+    print(f"{'population':>10} | {'serial ms':>10} | {'parallel ms':>11} | {'speedup':>7}")
+    print("-" * 60)
+    with parallel_ga:
+        # Warm the pool so worker start-up is not billed to the first population
+        parallel_ga.evaluate_population(random_population(parallel_ga, workers), student)
+        for size in POPULATION_SIZES:
+            population = random_population(serial_ga, size)
+            serial = time_evaluation(serial_ga, population, student)
+            parallel = time_evaluation(parallel_ga, population, student)
+            print(f"{size:>10} | {serial * 1000:>10.1f} | {parallel * 1000:>11.1f} | {serial / parallel:>6.2f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1))
@@ -0,0 +1,85 @@
+"""
+Benchmark: memory footprint and throughput of LearningPath populations
+Reports bytes per scored path, bytes per id-only path (as rebuilt from worker
+results and caches), path construction + scoring rate, and GA generations/s
+(rates are the best of REPEATS runs)
+Usage: python benchmarks/path_memory.py [paths] [generations]
+"""
+
+import contextlib
+import gc
+import io
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+
+PATH_LENGTH = 15
+REPEATS = 5
+
+
+def best_rate(run, count):
+    """Highest count/second over REPEATS runs of run()"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def measure_bytes(build):
+    """Bytes still allocated per item after build() returns a list of items"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(items)
+
+
+def run_benchmark(path_count, generations):
+    random.seed(0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = LearningPathGA(fitness_cache_size=0, seed=1)
+    student = create_synthetic_students(1, seed=42)[0]
+    context = ga.build_context(student)
+    sequences = [random.sample(ga.modules, PATH_LENGTH) for _ in range(path_count)]
+    id_sequences = [[module.id for module in sequence] for sequence in sequences]
+
+    def scored_population():
+        paths = [ga.LearningPath(list(sequence)) for sequence in sequences]
+        ga.evaluate_population(paths, student, context)
+        return paths
+
+    def id_only_paths():
+        return [ga.LearningPath.from_ids(ids) for ids in id_sequences]
+
+    scored_bytes = measure_bytes(scored_population)
+    id_bytes = measure_bytes(id_only_paths)
+
+    paths_per_second = best_rate(scored_population, path_count)
+    with contextlib.redirect_stdout(io.StringIO()):
+        generations_per_second = best_rate(lambda: ga.evolve(student, generations=generations), generations)
+
+    print(f"📈 LEARNING PATH MEMORY ({path_count} paths of {PATH_LENGTH} modules)")
+    print("=" * 50)
+    print(f"{'scored path':>28} | {scored_bytes:>9.0f} bytes")
+    print(f"{'id-only path':>28} | {id_bytes:>9.0f} bytes")
+    print(f"{'build + score':>28} | {paths_per_second:>9.0f} paths/s")
+    print(f"{'GA (population 50)':>28} | {generations_per_second:>9.1f} generations/s")
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
@@ -0,0 +1,72 @@
+"""
+Benchmark: random vs topological seeding (with offspring repair)
+Reports how many generations each strategy needs to reach the fitness that
+random seeding ends with
+Usage: python benchmarks/seeding.py [students] [generations]
+"""
+
+import contextlib
+import io
+import os
+import sys
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+
+STRATEGIES = {
+    "random": {"seeding": "random", "repair_offspring": False},
+    "topological": {"seeding": "topological", "repair_offspring": True},
+}
+CHECKPOINTS = [1, 5, 10, 25, 50]
+
+
+def run_strategy(params, student, generations, seed):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = LearningPathGA(population_size=50, generations=generations, seed=seed, **params)
+        ga.evolve(student)
+    return ga.run_stats["best_fitness_history"]
+
+
+def generations_to_reach(history, target):
+    for generation, fitness in enumerate(history, start=1):
+        if fitness >= target - 1e-9:
+            return generation
+    return None
+
+
+def run_benchmark(student_count, generations):
+    students = create_synthetic_students(student_count, seed=42)
+    checkpoints = [c for c in CHECKPOINTS if c <= generations]
+    totals = {name: [0.0] * len(checkpoints) for name in STRATEGIES}
+    reached = {name: [] for name in STRATEGIES}
+
+    for index, student in enumerate(students):
+        histories = {name: run_strategy(params, student, generations, seed=index)
+                     for name, params in STRATEGIES.items()}
+        # Target: the final fitness of the random-seeded baseline
+        target = histories["random"][-1]
+        for name, history in histories.items():
+            for i, checkpoint in enumerate(checkpoints):
+                totals[name][i] += history[min(checkpoint, len(history)) - 1]
+            reached[name].append(generations_to_reach(history, target))
+
+    print(f"📈 SEEDING STRATEGIES ({student_count} students, {generations} generations)")
+    print("=" * 70)
+    header = " | ".join(f"gen {c:>3}" for c in checkpoints)
+    print(f"{'strategy':>12} | {header} | {'gens to target':>14}")
+    print("-" * 70)
+    for name in STRATEGIES:
+        means = " | ".join(f"{total / student_count:>7.3f}" for total in totals[name])
+        hits = [g for g in reached[name] if g is not None]
+        to_target = f"{sum(hits) / len(hits):.1f} ({len(hits)}/{student_count})" if hits else "never"
+        print(f"{name:>12} | {means} | {to_target:>14}")
+
+
+if __name__ == "__main__":
+    run_benchmark(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
@@ -0,0 +1,100 @@
+"""
+Offline GA parameter tuning over a corpus of synthetic student profiles
+Random search over SEARCH_SPACE, scoring each configuration by the fitness
+evaluations it needs to reach every student's target fitness (a long
+reference run's best, minus TARGET_GAP). The best configuration can be
+written as JSON and loaded by the API via GA_PARAMS_FILE (see ga_config.py)
+Usage: python benchmarks/tune_ga_parameters.py [students] [trials] [output.json]
+"""
+
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import sys
+
+# Add the backend directory to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+
+SEARCH_SPACE = {
+    "population_size": [20, 30, 50, 80],
+    "seeding": ["random", "topological"],
+    "repair_offspring": [False, True],
+    "adaptive_operators": [False, True],
+    "deduplicate": [False, True],
+}
+REFERENCE_GENERATIONS = 300
+MAX_GENERATIONS = 200
+TARGET_GAP = 0.005
+MISS_PENALTY = 2  # A run that misses its target costs this many times its evaluations
+
+
+def reference_fitness(student, seed):
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = LearningPathGA(population_size=80, generations=REFERENCE_GENERATIONS, seeding="topological",
+                            repair_offspring=True, local_search_iterations=2000, seed=seed)
+        return ga.evolve(student).fitness
+
+
+def evaluations_to_target(params, student, target, seed):
+    """(evaluations, reached) for one run stopped at the target fitness"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        ga = LearningPathGA(generations=MAX_GENERATIONS, seed=seed, **params)
+        ga.evolve(student, target_fitness=target)
+    return ga.run_stats["evaluations"], ga.run_stats["stop_reason"] == "target_fitness"
+
+
+def candidate_configs(trials, seed=0):
+    configs = [dict(zip(SEARCH_SPACE, values)) for values in itertools.product(*SEARCH_SPACE.values())]
+    if trials < len(configs):
+        configs = random.Random(seed).sample(configs, trials)
+    return configs
+
+
+def tune(student_count, trials):
+    students = create_synthetic_students(student_count, seed=42)
+    targets = [reference_fitness(student, seed=index) - TARGET_GAP for index, student in enumerate(students)]
+
+    results = []
+    for params in candidate_configs(trials):
+        cost = 0
+        hits = 0
+        for index, (student, target) in enumerate(zip(students, targets)):
+            evaluations, reached = evaluations_to_target(params, student, target, seed=index)
+            hits += reached
+            cost += evaluations if reached else evaluations * MISS_PENALTY
+        results.append({"params": params, "mean_evaluations": cost / student_count, "reached": hits})
+    results.sort(key=lambda r: r["mean_evaluations"])
+    return results
+
+
+def report(results, student_count):
+    print(f"📈 GA PARAMETER TUNING ({student_count} students, {len(results)} configurations)")
+    print("=" * 86)
+    print(f"{'population':>10} | {'seeding':>11} | {'repair':>6} | {'adaptive':>8} | {'dedupe':>6} | "
+          f"{'evaluations':>11} | {'reached':>7}")
+    print("-" * 86)
+    for result in results:
+        params = result["params"]
+        print(f"{params['population_size']:>10} | {params['seeding']:>11} | {str(params['repair_offspring']):>6} | "
+              f"{str(params['adaptive_operators']):>8} | {str(params['deduplicate']):>6} | "
+              f"{result['mean_evaluations']:>11.0f} | "
+              f"{result['reached']:>3}/{student_count}")
+
+
+if __name__ == "__main__":
+    student_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    results = tune(student_count, int(sys.argv[2]) if len(sys.argv) > 2 else 12)
+    report(results, student_count)
+
+    if len(sys.argv) > 3:
+        best = results[0]
+        with open(sys.argv[3], "w") as f:
+            json.dump({"params": best["params"], "mean_evaluations": best["mean_evaluations"],
+                       "students": student_count}, f, indent=2)
+        print(f"\n💾 Best parameters written to {sys.argv[3]}")
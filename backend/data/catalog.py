@@ -0,0 +1,284 @@
+"""
+Process-wide module catalogs
+Maps each goal (exam) to a module catalog provider - by default one per
+source in data/catalogs, e.g. gre_quantitative.json loaded via its compiled
+snapshot. Catalogs are loaded on first use, kept in a small LRU and expose
+read-only lookup indexes shared by the GA and the API, including the
+transitive closure of the prerequisite DAG as module bitsets
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from data.catalog_loader import CATALOG_DIR, load_catalog_modules
+from data.concept_registry import ConceptRegistry
+
+DEFAULT_GOAL = "gre_quantitative"
+DEFAULT_CATALOG_SOURCE = os.path.join(CATALOG_DIR, f"{DEFAULT_GOAL}.json")
+CATALOG_SOURCE_EXTENSIONS = (".json", ".yaml", ".yml")
+
+
+class UnknownGoalError(ValueError):
+    """Raised for a goal without a registered catalog"""
+
+    def __init__(self, goal, goals):
+        super().__init__(f"Unknown goal: {goal} (available: {', '.join(goals) or 'none'})")
+        self.goal = goal
+        self.goals = goals
+
+    def __reduce__(self):
+        # Keeps the error intact when it crosses a process pool
+        return (UnknownGoalError, (self.goal, self.goals))
+
+
+def _freeze_groups(groups):
+    return MappingProxyType({key: tuple(values) for key, values in groups.items()})
+
+
+def _prerequisite_closure(modules):
+    """Topological order, depths and ancestor/descendant bitsets of the prerequisite DAG
+
+    Bit i of a bitset stands for modules[i]. Ties in the topological order are
+    broken by catalog order. Prerequisite ids outside the catalog are ignored;
+    a cycle raises ValueError.
+    """
+    bits = {module.id: 1 << i for i, module in enumerate(modules)}
+    prerequisites = {module.id: [p for p in module.prerequisite_ids if p in bits and p != module.id]
+                     for module in modules}
+    indegree = {module_id: len(prereqs) for module_id, prereqs in prerequisites.items()}
+    dependents = {module.id: [] for module in modules}
+    for module_id, prereqs in prerequisites.items():
+        for prereq_id in prereqs:
+            dependents[prereq_id].append(module_id)
+
+    position = {module.id: i for i, module in enumerate(modules)}
+    ready = [module.id for module in modules if indegree[module.id] == 0]
+    order = []
+    while ready:
+        module_id = min(ready, key=position.get)
+        ready.remove(module_id)
+        order.append(module_id)
+        for dependent in dependents[module_id]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+    if len(order) < len(modules):
+        cyclic = sorted(module_id for module_id, count in indegree.items() if count)
+        raise ValueError(f"Prerequisite cycle among modules {cyclic}")
+
+    ancestors, depth = {}, {}
+    for module_id in order:
+        mask = 0
+        for prereq_id in prerequisites[module_id]:
+            mask |= ancestors[prereq_id] | bits[prereq_id]
+        ancestors[module_id] = mask
+        depth[module_id] = max((depth[p] + 1 for p in prerequisites[module_id]), default=0)
+
+    descendants = {}
+    for module_id in reversed(order):
+        mask = 0
+        for dependent in dependents[module_id]:
+            mask |= descendants[dependent] | bits[dependent]
+        descendants[module_id] = mask
+
+    return bits, tuple(order), depth, ancestors, descendants
+
+
+class ModuleCatalog:
+    """Immutable view of a module catalog with precomputed indexes
+
+    - by_id: module id -> Module
+    - by_concept: concept -> modules teaching it
+    - by_topic: topic -> modules in that topic
+    - by_difficulty: difficulty -> modules of that difficulty
+    - prerequisites / dependents: module id -> prerequisite / dependent module ids
+    - topological_order and depth (longest prerequisite chain)
+    - module_bit / ancestors / descendants: module bitsets of the transitive closure,
+      so readiness and missing-ancestor queries are a few integer operations
+    The Module objects are shared and must be treated as read-only.
+    """
+
+    def __init__(self, modules, name="gre_quantitative"):
+        modules = tuple(modules)
+        by_concept, by_topic, by_difficulty, dependents = {}, {}, {}, {}
+        for module in modules:
+            for concept in module.concepts:
+                by_concept.setdefault(concept, []).append(module)
+            for topic in module.topics:
+                by_topic.setdefault(topic, []).append(module)
+            by_difficulty.setdefault(module.difficulty, []).append(module)
+            dependents.setdefault(module.id, [])
+            for prereq_id in module.prerequisite_ids:
+                dependents.setdefault(prereq_id, []).append(module.id)
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "modules", modules)
+        # Attaches concept/prerequisite bitmasks to the modules
+        object.__setattr__(self, "concept_registry", ConceptRegistry.from_modules(modules))
+        object.__setattr__(self, "by_id", MappingProxyType({module.id: module for module in modules}))
+        object.__setattr__(self, "by_concept", _freeze_groups(by_concept))
+        object.__setattr__(self, "by_topic", _freeze_groups(by_topic))
+        object.__setattr__(self, "by_difficulty", _freeze_groups(dict(sorted(by_difficulty.items()))))
+        object.__setattr__(self, "prerequisites", MappingProxyType(
+            {module.id: tuple(module.prerequisite_ids) for module in modules}))
+        object.__setattr__(self, "dependents", _freeze_groups(dependents))
+
+        bits, order, depth, ancestors, descendants = _prerequisite_closure(modules)
+        object.__setattr__(self, "module_bit", MappingProxyType(bits))
+        object.__setattr__(self, "topological_order", order)
+        object.__setattr__(self, "depth", MappingProxyType(depth))
+        object.__setattr__(self, "ancestors", MappingProxyType(ancestors))
+        object.__setattr__(self, "descendants", MappingProxyType(descendants))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ModuleCatalog is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("ModuleCatalog is immutable")
+
+    def get(self, module_id):
+        return self.by_id.get(module_id)
+
+    def modules_for(self, module_ids):
+        """Modules for a list of ids, in order (unknown ids are skipped)"""
+        return [self.by_id[i] for i in module_ids if i in self.by_id]
+
+    # Module bitsets: bit i stands for self.modules[i]
+
+    def mask_of(self, module_ids):
+        """Module bitset for a collection of ids (unknown ids are ignored)"""
+        mask = 0
+        for module_id in module_ids:
+            mask |= self.module_bit.get(module_id, 0)
+        return mask
+
+    def ids_of(self, mask):
+        """Module ids in a bitset, in catalog order"""
+        return [module.id for i, module in enumerate(self.modules) if mask >> i & 1]
+
+    def is_ready(self, module_id, completed_mask):
+        """True if every (transitive) prerequisite module is in completed_mask"""
+        return not self.ancestors[module_id] & ~completed_mask
+
+    def missing_ancestors(self, module_id, completed_mask):
+        """Bitset of prerequisite modules, at any depth, not yet in completed_mask"""
+        return self.ancestors[module_id] & ~completed_mask
+
+    def __len__(self):
+        return len(self.modules)
+
+    def __iter__(self):
+        return iter(self.modules)
+
+    def __repr__(self):
+        return f"ModuleCatalog({self.name}, modules={len(self)})"
+
+
+class CatalogRegistry:
+    """Goal -> module catalog providers, loaded lazily and kept in an LRU
+
+    A provider is a zero-argument callable returning a ModuleCatalog. At most
+    max_loaded catalogs stay loaded; an evicted catalog remains valid for GAs
+    and paths still holding it and is loaded again on its goal's next use.
+    """
+
+    def __init__(self, max_loaded=4):
+        self.max_loaded = max(1, max_loaded)
+        self._providers = {}
+        self._loaded = OrderedDict()
+        # Loads happen under the lock so concurrent requests never load a catalog twice
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def register(self, goal, provider):
+        """Register (or replace) the catalog provider of a goal"""
+        with self._lock:
+            self._providers[goal] = provider
+            self._loaded.pop(goal, None)
+
+    def register_source(self, goal, source):
+        """Register a JSON/YAML catalog source for a goal"""
+        def load():
+            name, modules = load_catalog_modules(source)
+            return ModuleCatalog(modules, name)
+        self.register(goal, load)
+
+    def goals(self):
+        return sorted(self._providers)
+
+    def __contains__(self, goal):
+        return goal in self._providers
+
+    def get(self, goal):
+        """The catalog of a goal, loading it (and evicting the least recently used) if needed"""
+        with self._lock:
+            catalog = self._loaded.get(goal)
+            if catalog is not None:
+                self._loaded.move_to_end(goal)
+                self.hits += 1
+                return catalog
+            if goal not in self._providers:
+                raise UnknownGoalError(goal, self.goals())
+
+            catalog = self._providers[goal]()
+            self.loads += 1
+            self._loaded[goal] = catalog
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+                self.evictions += 1
+            return catalog
+
+    def stats(self):
+        return {
+            "goals": self.goals(),
+            "loaded": list(self._loaded),
+            "max_loaded": self.max_loaded,
+            "hits": self.hits,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
+def discover_catalog_sources(directory=CATALOG_DIR):
+    """goal -> source path for every catalog source in a directory (the file stem is the goal)"""
+    if not os.path.isdir(directory):
+        return {}
+    return {
+        os.path.splitext(filename)[0]: os.path.join(directory, filename)
+        for filename in sorted(os.listdir(directory))
+        if filename.endswith(CATALOG_SOURCE_EXTENSIONS)
+    }
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_catalog_registry():
+    """The shared CatalogRegistry, created on first use in each process
+
+    Every source in data/catalogs (or CATALOG_SOURCE_DIR) is registered under
+    its file stem; MODULE_CATALOG_SOURCE replaces the default goal's source and
+    MAX_LOADED_CATALOGS bounds how many catalogs stay loaded.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = CatalogRegistry(max_loaded=int(os.environ.get("MAX_LOADED_CATALOGS", 4)))
+                sources = discover_catalog_sources(os.environ.get("CATALOG_SOURCE_DIR", CATALOG_DIR))
+                sources[DEFAULT_GOAL] = os.environ.get("MODULE_CATALOG_SOURCE",
+                                                       sources.get(DEFAULT_GOAL, DEFAULT_CATALOG_SOURCE))
+                for goal, source in sources.items():
+                    registry.register_source(goal, source)
+                _registry = registry
+    return _registry
+
+
+def get_module_catalog(goal=None):
+    """The shared ModuleCatalog of a goal (the GRE quantitative one by default)"""
+    return get_catalog_registry().get(goal or DEFAULT_GOAL)
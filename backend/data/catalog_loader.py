@@ -0,0 +1,251 @@
+"""
+Data-driven module catalogs
+Loads modules and their prerequisite module ids from a JSON or YAML source,
+validates the prerequisite graph (dangling ids, cycles) and keeps a compiled
+pickle snapshot next to it, which later processes load instead of
+parsing and validating the source again
+
+Usage:
+  python data/catalog_loader.py export <catalog.json>          # built-in GRE catalog -> JSON
+  python data/catalog_loader.py compile <source> [snapshot]    # validate + write snapshot
+"""
+
+import json
+import os
+import pickle
+import sys
+
+# Add the backend directory to Python path
+current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(current_dir)
+
+from models.module import Module
+
+CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalogs")
+SNAPSHOT_FORMAT = 1
+MAX_MODULE_ID = 65535  # LearningPath stores ids in an array('H')
+
+
+def _is_module_id(value):
+    """True for ints that fit LearningPath's id array (bools are ints in Python, so reject them explicitly)"""
+    return isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= MAX_MODULE_ID
+
+
+class CatalogError(ValueError):
+    """A catalog source that cannot be loaded; problems lists every issue found"""
+
+    def __init__(self, source, problems):
+        self.source = source
+        self.problems = problems
+        super().__init__(f"Invalid catalog {source}: " + "; ".join(problems))
+
+
+def read_catalog_source(path):
+    """Parse a .json, .yaml or .yml catalog source into plain data"""
+    with open(path) as f:
+        if path.endswith((".yaml", ".yml")):
+            # PyYAML is only needed for YAML catalogs
+            try:
+                import yaml
+            except ImportError:
+                raise CatalogError(path, ["PyYAML is required to load YAML catalogs"])
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def _find_cycle(prerequisites):
+    """One prerequisite cycle as a list of ids (first id repeated at the end), or None"""
+    state = {}  # id -> 1 while on the DFS stack, 2 when done
+    for root in prerequisites:
+        if root in state:
+            continue
+        stack = [(root, iter(prerequisites[root]))]
+        path = [root]
+        state[root] = 1
+        while stack:
+            module_id, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                path.pop()
+                state[module_id] = 2
+            elif state.get(child) == 1:
+                return path[path.index(child):] + [child]
+            elif child not in state:
+                state[child] = 1
+                stack.append((child, iter(prerequisites[child])))
+                path.append(child)
+    return None
+
+
+def validate_catalog_data(data, source="<catalog>"):
+    """Check a parsed catalog for missing fields, bad or duplicate ids, dangling prerequisites and cycles"""
+    if not isinstance(data, dict) or not isinstance(data.get("modules"), list):
+        raise CatalogError(source, ["expected an object with a 'modules' list"])
+
+    problems = []
+    prerequisites = {}
+    for index, entry in enumerate(data["modules"]):
+        where = f"module #{index}"
+        if not isinstance(entry, dict):
+            problems.append(f"{where} is not an object")
+            continue
+        module_id = entry.get("id")
+        if not _is_module_id(module_id):
+            problems.append(f"{where} has invalid id {module_id!r}")
+            continue
+        where = f"module {module_id}"
+        if module_id in prerequisites:
+            problems.append(f"duplicate module id {module_id}")
+            continue
+        if not isinstance(entry.get("name"), str):
+            problems.append(f"{where} has missing or invalid name")
+        for field in ("difficulty", "time_estimate"):
+            # Whole numbers only, like Module (bools are ints in Python, so reject them explicitly)
+            if not isinstance(entry.get(field), int) or isinstance(entry.get(field), bool):
+                problems.append(f"{where} has missing or invalid {field} (expected an integer)")
+        for field in ("concepts", "topics"):
+            values = entry.get(field, [])
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                problems.append(f"{where} has invalid {field} (expected a list of strings)")
+        prereq_ids = entry.get("prerequisites", [])
+        if not isinstance(prereq_ids, list) or not all(_is_module_id(p) for p in prereq_ids):
+            problems.append(f"{where} has invalid prerequisites (expected a list of module ids)")
+            prereq_ids = []
+        prerequisites[module_id] = prereq_ids
+
+    for module_id, prereq_ids in prerequisites.items():
+        for prereq_id in prereq_ids:
+            if prereq_id not in prerequisites:
+                problems.append(f"module {module_id} requires unknown module {prereq_id}")
+    if not problems:
+        cycle = _find_cycle(prerequisites)
+        if cycle:
+            problems.append("prerequisite cycle " + " -> ".join(str(i) for i in cycle))
+
+    if problems:
+        raise CatalogError(source, problems)
+
+
+def build_modules(data):
+    """Module objects for validated catalog data, with prerequisites resolved
+
+    Each module gets its prerequisite module ids plus the concepts of those
+    modules as concept prerequisites (same rules as set_prerequisites).
+    """
+    modules = [
+        Module(id=entry["id"], name=entry["name"], difficulty=entry["difficulty"],
+               time_estimate=entry["time_estimate"], concepts=list(entry.get("concepts", [])),
+               topics=list(entry.get("topics", [])))
+        for entry in data["modules"]
+    ]
+    module_dict = {module.id: module for module in modules}
+    for entry in data["modules"]:
+        module = module_dict[entry["id"]]
+        for prereq_id in entry.get("prerequisites", []):
+            module.add_prerequisite_module(prereq_id)
+            for concept in module_dict[prereq_id].concepts:
+                module.add_prerequisite(concept)
+    return modules
+
+
+def snapshot_path_for(source):
+    """Snapshot file for a source: next to it, or in CATALOG_SNAPSHOT_DIR if set"""
+    directory = os.environ.get("CATALOG_SNAPSHOT_DIR") or os.path.dirname(os.path.abspath(source))
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(directory, f"{stem}.snapshot.pickle")
+
+
+def _source_signature(source):
+    stat = os.stat(source)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def write_snapshot(source, snapshot_path=None):
+    """Validate a catalog source and write its compiled snapshot; returns (name, modules)"""
+    snapshot_path = snapshot_path or snapshot_path_for(source)
+    signature = _source_signature(source)
+    data = read_catalog_source(source)
+    validate_catalog_data(data, source)
+    name = data.get("name") or os.path.splitext(os.path.basename(source))[0]
+    modules = build_modules(data)
+
+    payload = {"format": SNAPSHOT_FORMAT, "source_signature": signature, "name": name, "modules": modules}
+    # Write to a temporary file first so readers never see a partial snapshot
+    temporary_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, snapshot_path)
+    return name, modules
+
+
+def read_snapshot(snapshot_path, source=None):
+    """(name, modules) from a snapshot, or None if missing or stale
+
+    Snapshots are trusted local build artifacts (pickle): never load one from
+    an untrusted location.
+    """
+    try:
+        with open(snapshot_path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return None
+    if payload.get("format") != SNAPSHOT_FORMAT:
+        return None
+    if source is not None and payload.get("source_signature") != _source_signature(source):
+        return None
+    return payload["name"], payload["modules"]
+
+
+def load_catalog_modules(source, use_snapshot=True):
+    """(name, modules) for a catalog source, via its snapshot when it is up to date"""
+    if not use_snapshot:
+        data = read_catalog_source(source)
+        validate_catalog_data(data, source)
+        return data.get("name") or os.path.splitext(os.path.basename(source))[0], build_modules(data)
+
+    snapshot_path = snapshot_path_for(source)
+    loaded = read_snapshot(snapshot_path, source)
+    if loaded is not None:
+        return loaded
+    try:
+        return write_snapshot(source, snapshot_path)
+    except OSError as e:
+        # Read-only deployments still work, they just parse the source every time
+        print(f"⚠️  Could not write catalog snapshot {snapshot_path}: {e}")
+        return load_catalog_modules(source, use_snapshot=False)
+
+
+def export_gre_catalog(path):
+    """Write the built-in GRE quantitative catalog as a JSON source, one module per line"""
+    from data.gre_modules import MODULE_PREREQUISITES, create_gre_quantitative_modules
+    modules = create_gre_quantitative_modules()
+    lines = [
+        json.dumps({
+            "id": module.id, "name": module.name, "difficulty": module.difficulty,
+            "time_estimate": module.time_estimate, "concepts": module.concepts, "topics": module.topics,
+            "prerequisites": MODULE_PREREQUISITES.get(module.id, []),
+        })
+        for module in modules
+    ]
+    with open(path, "w") as f:
+        f.write('{\n  "name": "gre_quantitative",\n  "title": "GRE Quantitative Reasoning",\n  "modules": [\n    ')
+        f.write(",\n    ".join(lines))
+        f.write("\n  ]\n}\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[1] not in ("export", "compile"):
+        print(__doc__)
+        sys.exit(1)
+    if sys.argv[1] == "export":
+        export_gre_catalog(sys.argv[2])
+        print(f"✅ GRE quantitative catalog written to {sys.argv[2]}")
+    else:
+        try:
+            name, modules = write_snapshot(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+        except CatalogError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"✅ Catalog '{name}' ({len(modules)} modules) compiled to "
+              f"{sys.argv[3] if len(sys.argv) > 3 else snapshot_path_for(sys.argv[2])}")
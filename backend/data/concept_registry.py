@@ -0,0 +1,75 @@
+"""
+Interned concept registry
+Gives every concept in a module catalog an integer bit position so that
+concept sets can be stored and compared as int bitmasks
+"""
+
+
+def popcount(mask):
+    """Number of concepts in a bitmask"""
+    return mask.bit_count()
+
+
+class ConceptRegistry:
+    def __init__(self, concepts=None):
+        self._index = {}
+        self._names = []
+        for concept in concepts or []:
+            self.intern(concept)
+
+    @classmethod
+    def from_modules(cls, modules):
+        """Build a registry from a module catalog and attach masks to its modules"""
+        registry = cls()
+        for module in modules:
+            for concept in module.concepts:
+                registry.intern(concept)
+            for prereq in module.prerequisites:
+                registry.intern(prereq)
+        registry.index_modules(modules)
+        return registry
+
+    def intern(self, concept):
+        """Return the bit position of a concept, registering it if new"""
+        index = self._index.get(concept)
+        if index is None:
+            index = len(self._names)
+            self._index[concept] = index
+            self._names.append(concept)
+        return index
+
+    def index_of(self, concept):
+        """Bit position of a concept, or None if it is not registered"""
+        return self._index.get(concept)
+
+    def mask_of(self, concepts):
+        """Bitmask for a collection of concepts (unregistered concepts are ignored)"""
+        mask = 0
+        for concept in concepts:
+            index = self._index.get(concept)
+            if index is not None:
+                mask |= 1 << index
+        return mask
+
+    def names_of(self, mask):
+        """Concept names contained in a bitmask, in registration order"""
+        return [name for index, name in enumerate(self._names) if mask >> index & 1]
+
+    def index_modules(self, modules):
+        """Store concept and prerequisite bitmasks on each module"""
+        for module in modules:
+            module.concept_mask = self.mask_of(module.concepts)
+            module.prerequisite_mask = self.mask_of(module.prerequisites)
+
+    @property
+    def names(self):
+        return list(self._names)
+
+    def __contains__(self, concept):
+        return concept in self._index
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"ConceptRegistry(concepts={len(self)})"
@@ -155,6 +155,86 @@ def create_gre_quantitative_modules():
      return modules
  
      
+# Atomic prerequisites - very specific dependencies
+MODULE_PREREQUISITES = {
+    # Arithmetic dependencies
+    2: [1],    # Even/Odd needs Integer properties
+    3: [1],    # Primes needs Integer properties  
+    4: [1],    # Divisibility needs Integer properties
+    5: [1],    # Absolute Value needs Integer properties
+    
+    7: [6],    # Order of Operations needs Basic Operations
+    8: [6, 7], # Signed numbers needs Operations + Order of Operations
+    9: [1, 6], # Properties of 0/1 needs Integers + Operations
+    
+    # Fraction/Decimal dependencies
+    10: [6, 7], # Fractions needs Operations + Order of Operations
+    11: [6, 7], # Decimals needs Operations + Order of Operations  
+    12: [10, 11], # Percentages needs Fractions + Decimals
+    13: [10, 11, 12], # Conversions needs all three
+    
+    # Ratio dependencies
+    14: [10, 12], # Ratios needs Fractions + Percentages
+    15: [14],     # Rates needs Ratios
+    16: [6, 7],   # Unit Conversion needs Operations
+    
+    # Algebra dependencies
+    17: [6, 7],   # Algebraic Expressions needs Arithmetic
+    18: [17],     # Simplifying needs Expressions
+    19: [17, 18], # Evaluating needs Expressions + Simplifying
+    
+    20: [17, 18], # Linear Equations needs Expressions
+    21: [20],     # Systems needs Linear Equations
+    22: [20],     # Inequalities needs Linear Equations
+    23: [18, 20], # Quadratic Equations needs Simplifying + Linear Equations
+    24: [18, 23], # Factoring needs Simplifying + Quadratic Equations
+    
+    25: [20],     # Functions needs Linear Equations
+    26: [18],     # Exponents/Roots needs Simplifying
+    27: [20, 25], # Sequences needs Linear Equations + Functions
+    
+    # Word Problem dependencies
+    28: [17, 20], # Word Problems needs Expressions + Equations
+    29: [15, 28], # Work Problems needs Rates + Word Problems
+    30: [20, 28], # Mixture Problems needs Equations + Word Problems
+    
+    # Statistics dependencies
+    31: [6, 10],  # Mean/Median/Mode needs Operations + Fractions
+    32: [31],     # Range/Quartiles needs Mean/Median/Mode
+    33: [31, 32], # Standard Deviation needs basic stats
+    34: [31, 32], # Percentiles needs basic stats
+    
+    # Counting/Probability dependencies
+    35: [1],      # Sets needs Integers
+    36: [35],     # Combinations needs Sets
+    37: [35],     # Permutations needs Sets
+    38: [31, 35], # Probability needs Stats + Sets
+    39: [38],     # Multiple Events needs basic Probability
+    
+    # Geometry dependencies
+    40: [6, 7],   # Lines/Angles needs basic math
+    41: [40],     # Parallel Lines needs Lines/Angles
+    42: [40],     # Triangles needs Lines/Angles
+    43: [42],     # Pythagorean Theorem needs Triangles
+    44: [40],     # Quadrilaterals needs Lines/Angles
+    45: [40],     # Polygons needs Lines/Angles
+    46: [6, 7],   # Circles needs basic math
+    47: [40, 42, 44, 46], # Area/Perimeter needs all shapes
+    48: [20, 40], # Coordinate Geometry needs Algebra + Geometry
+    49: [47],     # 3D Geometry needs Area/Perimeter
+    50: [47, 48, 49], # Composite Shapes needs all geometry
+    
+    # Data Interpretation dependencies
+    51: [31],     # Tables needs basic stats
+    52: [31, 51], # Graphs needs stats + tables
+    
+    # Strategy dependencies (need comprehensive knowledge)
+    53: list(range(1, 52)), # QC Strategies needs almost everything
+    54: list(range(1, 52)), # Multiple-choice needs almost everything
+    55: list(range(1, 54))  # Time Management needs everything
+}
+
+
 def set_prerequisites(modules):
     """Define the learning dependencies between modules"""
     
@@ -163,85 +243,8 @@ def set_prerequisites(modules):
     """Define precise prerequisite relationships for atomic modules"""
     
     module_dict = {module.id: module for module in modules}
+    prerequisites = MODULE_PREREQUISITES
     
-    # Atomic prerequisites - very specific dependencies
-    prerequisites = {
-        # Arithmetic dependencies
-        2: [1],    # Even/Odd needs Integer properties
-        3: [1],    # Primes needs Integer properties  
-        4: [1],    # Divisibility needs Integer properties
-        5: [1],    # Absolute Value needs Integer properties
-        
-        7: [6],    # Order of Operations needs Basic Operations
-        8: [6, 7], # Signed numbers needs Operations + Order of Operations
-        9: [1, 6], # Properties of 0/1 needs Integers + Operations
-        
-        # Fraction/Decimal dependencies
-        10: [6, 7], # Fractions needs Operations + Order of Operations
-        11: [6, 7], # Decimals needs Operations + Order of Operations  
-        12: [10, 11], # Percentages needs Fractions + Decimals
-        13: [10, 11, 12], # Conversions needs all three
-        
-        # Ratio dependencies
-        14: [10, 12], # Ratios needs Fractions + Percentages
-        15: [14],     # Rates needs Ratios
-        16: [6, 7],   # Unit Conversion needs Operations
-        
-        # Algebra dependencies
-        17: [6, 7],   # Algebraic Expressions needs Arithmetic
-        18: [17],     # Simplifying needs Expressions
-        19: [17, 18], # Evaluating needs Expressions + Simplifying
-        
-        20: [17, 18], # Linear Equations needs Expressions
-        21: [20],     # Systems needs Linear Equations
-        22: [20],     # Inequalities needs Linear Equations
-        23: [18, 20], # Quadratic Equations needs Simplifying + Linear Equations
-        24: [18, 23], # Factoring needs Simplifying + Quadratic Equations
-        
-        25: [20],     # Functions needs Linear Equations
-        26: [18],     # Exponents/Roots needs Simplifying
-        27: [20, 25], # Sequences needs Linear Equations + Functions
-        
-        # Word Problem dependencies
-        28: [17, 20], # Word Problems needs Expressions + Equations
-        29: [15, 28], # Work Problems needs Rates + Word Problems
-        30: [20, 28], # Mixture Problems needs Equations + Word Problems
-        
-        # Statistics dependencies
-        31: [6, 10],  # Mean/Median/Mode needs Operations + Fractions
-        32: [31],     # Range/Quartiles needs Mean/Median/Mode
-        33: [31, 32], # Standard Deviation needs basic stats
-        34: [31, 32], # Percentiles needs basic stats
-        
-        # Counting/Probability dependencies
-        35: [1],      # Sets needs Integers
-        36: [35],     # Combinations needs Sets
-        37: [35],     # Permutations needs Sets
-        38: [31, 35], # Probability needs Stats + Sets
-        39: [38],     # Multiple Events needs basic Probability
-        
-        # Geometry dependencies
-        40: [6, 7],   # Lines/Angles needs basic math
-        41: [40],     # Parallel Lines needs Lines/Angles
-        42: [40],     # Triangles needs Lines/Angles
-        43: [42],     # Pythagorean Theorem needs Triangles
-        44: [40],     # Quadrilaterals needs Lines/Angles
-        45: [40],     # Polygons needs Lines/Angles
-        46: [6, 7],   # Circles needs basic math
-        47: [40, 42, 44, 46], # Area/Perimeter needs all shapes
-        48: [20, 40], # Coordinate Geometry needs Algebra + Geometry
-        49: [47],     # 3D Geometry needs Area/Perimeter
-        50: [47, 48, 49], # Composite Shapes needs all geometry
-        
-        # Data Interpretation dependencies
-        51: [31],     # Tables needs basic stats
-        52: [31, 51], # Graphs needs stats + tables
-        
-        # Strategy dependencies (need comprehensive knowledge)
-        53: list(range(1, 52)), # QC Strategies needs almost everything
-        54: list(range(1, 52)), # Multiple-choice needs almost everything
-        55: list(range(1, 54))  # Time Management needs everything
-    }
     # Apply prerequisites
     for module_id, prereq_ids in prerequisites.items():
         for prereq_id in prereq_ids:
@@ -264,6 +267,9 @@ def set_prerequisites(modules):
             if prereq_id not in module_dict:
                 print(f"ERROR: Prerequisite module ID {prereq_id} not found!")
                 continue
+            
+            # Keep the module-level edge for prerequisite-graph algorithms
+            module_dict[module_id].add_prerequisite_module(prereq_id)
                 
             # Add concept prerequisites from the prerequisite modules
             prereq_module = module_dict[prereq_id]
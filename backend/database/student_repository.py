@@ -104,6 +104,13 @@ class StudentRepository:
         paths = self.learning_paths.find({'student_id': student_id}).sort('created_at', -1)
         return list(paths)
     
+    def get_latest_learning_path(self, student_id):
+        """Get the most recently generated learning path for a student"""
+        if not self.learning_paths:
+            return None
+            
+        return self.learning_paths.find_one({'student_id': student_id}, sort=[('created_at', -1)])
+    
     def update_student_progress(self, student_id, completed_module_id, performance_score):
         """Update student progress after module completion"""
         if not self.students:
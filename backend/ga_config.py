@@ -0,0 +1,51 @@
+"""
+Shared GA parameters for the API and the roadmap generator
+Defaults can be overridden by a JSON file of tuned parameters (as written by
+benchmarks/tune_ga_parameters.py), named by the GA_PARAMS_FILE environment variable
+"""
+
+import json
+import os
+
+GA_DEFAULTS = {
+    "population_size": 50,
+    "generations": 100,
+    "mutation_rate": 0.1,
+}
+
+# Largest GA a client may request (background jobs run up to 10x the synchronous defaults)
+MAX_POPULATION_SIZE = 10 * GA_DEFAULTS["population_size"]
+MAX_GENERATIONS = 10 * GA_DEFAULTS["generations"]
+
+# Re-plans are short warm-started runs and must always finish within a budget
+MAX_REPLAN_GENERATIONS = GA_DEFAULTS["generations"]
+MAX_REPLAN_TIME_BUDGET_MS = 10000
+
+# LearningPathGA arguments a tuned parameter file may set
+TUNABLE_PARAMS = ("population_size", "generations", "mutation_rate", "seeding",
+                  "repair_offspring", "adaptive_operators", "deduplicate", "restart_diversity")
+
+_loaded_params = None
+
+
+def load_tuned_params(path):
+    """Tunable parameters from a JSON file ({"params": {...}} or a flat dict)"""
+    with open(path) as f:
+        data = json.load(f)
+    params = data.get("params", data)
+    unknown = set(params) - set(TUNABLE_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown GA parameters in {path}: {', '.join(sorted(unknown))}")
+    return params
+
+
+def ga_params(**overrides):
+    """GA constructor arguments: defaults, then GA_PARAMS_FILE, then overrides"""
+    global _loaded_params
+    if _loaded_params is None:
+        _loaded_params = dict(GA_DEFAULTS)
+        params_file = os.environ.get("GA_PARAMS_FILE")
+        if params_file:
+            _loaded_params.update(load_tuned_params(params_file))
+            print(f"⚙️  Using tuned GA parameters from {params_file}")
+    return dict(_loaded_params, **overrides)
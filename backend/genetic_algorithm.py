@@ -7,30 +7,169 @@ import random
 import math
 import sys
 import os
+import time
+import weakref
+from array import array
 
 # Add the backend directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
 from models.student import Student
-from data.gre_modules import create_gre_quantitative_modules
+from data.catalog import DEFAULT_GOAL, get_module_catalog
+from data.concept_registry import popcount
+from optimization.fitness_cache import FitnessCache
+from optimization.evaluation_context import EvaluationContext
+from optimization.seeding import random_topological_path, repair_order
+from optimization.delta_fitness import PathState, local_search
+from optimization.operator_selection import MUTATION_OPERATORS, AdaptiveOperatorSelector, pick_operator
+from optimization.diversity import DiversityMeter
+
+def derive_seed(seed, index):
+    """Independent, reproducible seed for sub-run index of a seeded run"""
+    return random.Random(f"{seed}:{index}").getrandbits(32)
 
 class LearningPathGA:
-    def __init__(self, population_size=50, generations=100, mutation_rate=0.1):
+    FITNESS_BACKENDS = ("scalar", "vectorized", "incremental")
+    SEEDING_STRATEGIES = ("random", "topological")
+
+    def __init__(self, population_size=50, generations=100, mutation_rate=0.1, fitness_backend="scalar",
+                 parallel_workers=None, fitness_cache_size=10000, seeding="random", repair_offspring=False,
+                 local_search_iterations=0, local_search_time_ms=None, adaptive_operators=False,
+                 deduplicate=False, restart_diversity=None, track_diversity=False, goal=None, seed=None):
         self.population_size = population_size
         self.generations = generations
+        # Private RNG used by every operator; with a seed each evolve() run is reproducible
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.mutation_rate = mutation_rate
-        self.modules = create_gre_quantitative_modules()
+
+        if fitness_backend not in self.FITNESS_BACKENDS:
+            raise ValueError(f"Unknown fitness backend: {fitness_backend}")
+        self.fitness_backend = fitness_backend
+        self.fitness_engine = None
+
+        # Opt-in process pool for scoring offspring batches (created on first use)
+        self.parallel_workers = parallel_workers
+        self.parallel_evaluator = None
+
+        # Per-run fitness memoization keyed by module-id tuples (0/None disables it)
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size else None
+        self._cache_profile = None
+        self.run_stats = {}
+
+        # Modules, concept bitmasks and indexes of the goal's catalog are shared per
+        # process; build_context() switches to each student's goal
+        self.goal = None
+        self.catalog = None
+        self.select_catalog(goal or DEFAULT_GOAL)
+
+        # "topological" seeds prerequisite-respecting paths; repair_offspring restores
+        # prerequisite order after crossover and mutation
+        if seeding not in self.SEEDING_STRATEGIES:
+            raise ValueError(f"Unknown seeding strategy: {seeding}")
+        self.seeding = seeding
+        self.repair_offspring = repair_offspring
+
+        # Optional memetic refinement of the final best path (0 iterations disables it)
+        self.local_search_iterations = local_search_iterations
+        self.local_search_time_ms = local_search_time_ms
+        
+        # Adaptive mutation operator probabilities, credited by offspring improvement
+        self.adaptive_operators = adaptive_operators
+        self.operator_selector = AdaptiveOperatorSelector() if adaptive_operators else None
+        
+        # Paths actually scored (cache hits excluded) during the current run
+        self.evaluations = 0
+        
+        # Diversity control: deduplicate replaces clone offspring with fresh topological
+        # paths; restart_diversity restarts all but the elite when the mean pairwise
+        # path distance drops below it; track_diversity records it every generation
+        self.deduplicate = deduplicate
+        self.restart_diversity = restart_diversity
+        self.track_diversity = track_diversity
+        self.duplicates_replaced = 0
         
     class LearningPath:
-        """Represents a candidate learning path (chromosome)"""
+        """Represents a candidate learning path (chromosome)
+        
+        A path built from modules keeps that list and derives its ids on demand;
+        a path built with from_ids() holds only a compact array('H') of ids and
+        materializes its module list from the catalog on first access (workers,
+        caches and islands pass paths around as ids). Attributes are fixed by __slots__,
+        so results attached later (stop_reason, engine, objectives, ...) need a
+        slot here; unset ones read through getattr(path, name, default).
+        """
+        __slots__ = (
+            "_ids", "_modules", "_catalog", "fitness", "total_time", "_key", "_hash", "parent_path", "_state",
+            "concepts_covered", "weak_areas_covered", "stopped_at_generation", "stop_reason", "engine",
+            "solve_time_ms", "local_search_stats", "mutation_operator", "objectives", "rank", "crowding",
+        )
+        
         def __init__(self, module_sequence):
-            self.module_sequence = module_sequence  # Ordered list of modules
+            self._modules = module_sequence  # Ordered list of modules (treat as immutable)
+            self._catalog = None
+            self._ids = None
             self.fitness = 0  # How good this path is
             self.total_time = sum(module.time_estimate for module in module_sequence) if module_sequence else 0
+            self._key = None
+            self._hash = None
+            self.parent_path = None  # Path this one was derived from (incremental backend only)
+            self._state = None  # PathState with per-prefix totals (incremental backend only)
+        
+        @classmethod
+        def from_ids(cls, module_ids, catalog=None):
+            """Path holding only module ids; modules are looked up when first needed"""
+            path = cls.__new__(cls)
+            path._modules = None
+            path._catalog = catalog or get_module_catalog()
+            path._ids = array('H', module_ids)
+            by_id = path._catalog.by_id
+            path.fitness = 0
+            path.total_time = sum(by_id[i].time_estimate for i in path._ids)
+            path._key = None
+            path._hash = None
+            path.parent_path = None
+            path._state = None
+            return path
+        
+        @property
+        def module_sequence(self):
+            if self._modules is None:
+                by_id = self._catalog.by_id
+                self._modules = [by_id[i] for i in self._ids]
+            return self._modules
+        
+        @property
+        def ids(self):
+            """Module ids as an array('H')"""
+            if self._ids is None:
+                self._ids = array('H', self.key)
+            return self._ids
+        
+        @property
+        def key(self):
+            """Tuple of module ids, built once per path"""
+            if self._key is None:
+                if self._modules is not None:
+                    self._key = tuple(module.id for module in self._modules)
+                else:
+                    self._key = tuple(self._ids)
+                self._hash = hash(self._key)
+            return self._key
+        
+        def __hash__(self):
+            if self._hash is None:
+                self.key
+            return self._hash
+        
+        def __eq__(self, other):
+            if not isinstance(other, LearningPathGA.LearningPath):
+                return NotImplemented
+            return hash(self) == hash(other) and self.key == other.key
             
         def __len__(self):
-            return len(self.module_sequence)
+            return len(self._modules if self._modules is not None else self._ids)
         
         def __getitem__(self, index):
             return self.module_sequence[index]
@@ -38,28 +177,66 @@ class LearningPathGA:
         def __repr__(self):
             return f"Path(fitness={self.fitness:.3f}, modules={len(self)}, time={self.total_time}min)"
     
-    def create_initial_population(self, student):
+    def select_catalog(self, goal):
+        """Use the module catalog of a goal (loaded on first use); an empty goal keeps the current one"""
+        if not goal or goal == self.goal:
+            return
+        catalog = get_module_catalog(goal)
+        self.goal = goal
+        if catalog is self.catalog:
+            return
+        self.catalog = catalog
+        self.modules = list(catalog.modules)
+        self.concept_registry = catalog.concept_registry
+        if self.fitness_backend == "vectorized":
+            # NumPy is only needed for the batched backend
+            from optimization.vectorized_fitness import VectorizedFitnessEngine
+            self.fitness_engine = VectorizedFitnessEngine(self.modules, self.concept_registry)
+        # Cached fitness values are keyed by module ids, which other catalogs reuse
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+            self._cache_profile = None
+
+    def build_context(self, student, excluded_ids=()):
+        """Snapshot everything the GA operators need about a student (once per run)
+
+        Switches to the catalog of the student's goal first.
+        """
+        self.select_catalog(student.goal)
+        return EvaluationContext.build(
+            student, self.modules, self.concept_registry, self._get_all_required_concepts(student),
+            excluded_ids=excluded_ids
+        )
+    
+    def create_initial_population(self, student, context=None):
         """Create initial random population of learning paths"""
-        population = []
+        context = context or self.build_context(student)
+        return [self.random_path(student, context) for _ in range(self.population_size)]
+    
+    def random_path(self, student, context=None, topological=None):
+        """One random path; topological=None follows the seeding strategy"""
+        context = context or self.build_context(student)
+        if topological is None:
+            topological = self.seeding == "topological"
         
-        for _ in range(self.population_size):
-            # Filter modules based on student's current knowledge
-            available_modules = self.get_available_modules(student)
-            
-            if not available_modules:
-                print("❌ No available modules for student. Using all modules.")
-                available_modules = self.modules.copy()
-            
-            # Create path of appropriate length based on student's available time
-            max_path_length = self._calculate_optimal_path_length(student, available_modules)
-            path_length = min(max_path_length, len(available_modules))
-            
-            # Create random path
-            random_path = random.sample(available_modules, path_length)
-            path = self.LearningPath(random_path)
-            population.append(path)
-            
-        return population
+        # Filter modules based on student's current knowledge
+        available_modules = self.get_available_modules(student, context)
+        
+        if not available_modules:
+            print("❌ No available modules for student. Using all modules.")
+            available_modules = self.modules.copy()
+        
+        # Create path of appropriate length based on student's available time
+        max_path_length = self._calculate_optimal_path_length(student, available_modules)
+        path_length = min(max_path_length, len(available_modules))
+        
+        if topological:
+            random_path = random_topological_path(
+                available_modules, path_length, context.known_mask, context.weak_mask, rng=self.rng
+            )
+        else:
+            random_path = self.rng.sample(available_modules, path_length)
+        return self.LearningPath(random_path)
     
     def _calculate_optimal_path_length(self, student, available_modules):
         """Calculate optimal number of modules based on student's available time"""
@@ -70,70 +247,42 @@ class LearningPathGA:
         optimal_length = max(5, min(20, student.available_time_week // avg_module_time))
         return int(optimal_length)
     
-    def get_available_modules(self, student):
-        """Get modules that are appropriate for the student's current level"""
-        available_modules = []
+    def get_available_modules(self, student, context=None):
+        """Get modules that are appropriate based on comprehensive assessment"""
+        context = context or self.build_context(student)
         
-        for module in self.modules:
-            # Check if student is ready for this module (prerequisites satisfied)
-            readiness = student.calculate_readiness(module)
-            
-            # More sophisticated availability based on assessment data
-            if readiness >= 40:  # Lower threshold since we have real data
-                # Bonus: prioritize modules that address weak areas
-                addresses_weak_areas = any(
-                    concept in student.get_weak_concepts(50) 
-                    for concept in module.concepts
-                )
-                
-                if addresses_weak_areas:
-                    # These modules get priority - insert at beginning
-                    available_modules.insert(0, module)
-                else:
-                    # Check if module only covers strong areas (potential penalty)
-                    only_strong_areas = all(
-                        concept in student.get_strong_concepts(70)
-                        for concept in module.concepts
-                    )
-                    if not only_strong_areas:
-                        available_modules.append(module)
+        # Prioritize modules that address weak areas, then mixed or new concepts
+        available_modules = list(context.weak_area_modules) + list(context.mixed_modules)
+        
+        # Low priority - occasional easy review modules
+        available_modules.extend(module for module in context.review_modules if self.rng.random() < 0.3)
         
         # If no modules are available, return easier modules
         if not available_modules:
-            available_modules = [module for module in self.modules 
-                               if module.difficulty <= 2]
+            available_modules = list(context.fallback_modules)
         
         return available_modules
     
-    def _get_all_required_concepts(self, student):
-        """Get ALL concepts required for comprehensive GRE preparation"""
-        # For comprehensive learning, include all concepts from all modules
-        all_concepts = set()
-        for module in self.modules:
-            all_concepts.update(module.concepts)
-        return list(all_concepts)
-    
-    # In backend/genetic_algorithm.py - ENHANCE THE GENETIC ALGORITHM
-
-    def calculate_fitness(self, path, student):
+    def calculate_fitness(self, path, student, context=None):
         """Enhanced fitness function using comprehensive assessment data"""
         if not path.module_sequence:
             return 0
         
         fitness = 0
         total_time = 0
-        concepts_covered = set()
-        weak_concepts_covered = set()
-        strong_concepts_reviewed = set()
     
-        # Get student's comprehensive knowledge profile from 20-question assessment
-        weak_concepts = student.get_weak_concepts(threshold=50)
-        strong_concepts = student.get_strong_concepts(threshold=70)
-        all_required_concepts = self._get_all_required_concepts(student)
+        # Student's knowledge profile from the assessment, precomputed once per run
+        context = context or self.build_context(student)
+        weak_concepts = context.weak_concepts
+        all_required_concepts = context.required_concepts
+        weak_mask = context.weak_mask
+        strong_mask = context.strong_mask
     
-        # Track progression through the path
-        learned_concepts = set(student.known_concepts.keys())
+        # Track progression through the path as concept bitmasks
+        learned_mask = context.known_mask
+        covered_mask = 0
         prerequisite_violations = 0
+        max_possible_violations = 0
         difficulty_changes = 0
         weak_area_focus = 0
     
@@ -141,34 +290,30 @@ class LearningPathGA:
             total_time += module.time_estimate
 
         # Track concept coverage
-            for concept in module.concepts:
-                concepts_covered.add(concept)
-                if concept in weak_concepts:
-                    weak_concepts_covered.add(concept)
-                    weak_area_focus += 1  # Bonus for addressing weak areas
-                if concept in strong_concepts:
-                    strong_concepts_reviewed.add(concept)
-        
-            # Check prerequisite violations
-            for prereq in module.prerequisites:
-                if prereq not in learned_concepts:
-                    prerequisite_violations += 1
-                    # Extra penalty if student is particularly weak in this prerequisite
-                    if prereq in student.known_concepts and student.known_concepts[prereq] < 30:
-                        prerequisite_violations += 1
+            covered_mask |= module.concept_mask
+            weak_area_focus += popcount(module.concept_mask & weak_mask)  # Bonus for addressing weak areas
+        
+            # Check prerequisite violations. Assessed concepts start out in learned_mask,
+            # so a missing prerequisite is never also a critically weak known concept.
+            prerequisite_violations += popcount(module.prerequisite_mask & ~learned_mask)
+            max_possible_violations += popcount(module.prerequisite_mask)
         
         # Update learned concepts for next module
-            learned_concepts.update(module.concepts)
+            learned_mask |= module.concept_mask
         
         # Track difficulty progression (smooth progression is better)
             if i > 0:
                 prev_difficulty = path[i-1].difficulty
                 current_difficulty = module.difficulty
                 difficulty_changes += abs(current_difficulty - prev_difficulty)
+        
+        concepts_covered = popcount(covered_mask)
+        weak_concepts_covered = popcount(covered_mask & weak_mask)
+        strong_concepts_reviewed = popcount(covered_mask & strong_mask)
     
     # 1. WEAK AREA COVERAGE (30% weight) - HIGHEST PRIORITY
         if weak_concepts:
-            weak_area_coverage = len(weak_concepts_covered) / len(weak_concepts)
+            weak_area_coverage = weak_concepts_covered / len(weak_concepts)
             weak_area_bonus = weak_area_focus / len(path.module_sequence) * 0.1
         else:
             weak_area_coverage = 1.0
@@ -178,7 +323,7 @@ class LearningPathGA:
     
     # 2. COMPREHENSIVE COVERAGE (25% weight) - Cover all required concepts
         if all_required_concepts:
-            required_coverage = len(concepts_covered & set(all_required_concepts)) / len(all_required_concepts)
+            required_coverage = popcount(covered_mask & context.required_mask) / len(all_required_concepts)
         else:
             required_coverage = 1.0
         
@@ -194,7 +339,6 @@ class LearningPathGA:
         fitness += time_fitness * 0.15
     
     # 4. PREREQUISITE COMPLIANCE (12% weight)
-        max_possible_violations = sum(len(module.prerequisites) for module in path.module_sequence)
         if max_possible_violations > 0:
             prereq_fitness = 1 - (prerequisite_violations / max_possible_violations)
         else:
@@ -213,206 +357,119 @@ class LearningPathGA:
     
     # 6. EFFICIENT REVIEW (8% weight) - Avoid unnecessary review of strong areas
         if path.module_sequence:
-            review_penalty = len(strong_concepts_reviewed) / (len(concepts_covered) + 1)
+            review_penalty = strong_concepts_reviewed / (concepts_covered + 1)
             fitness += (1 - review_penalty) * 0.08
     
     # Ensure fitness is between 0 and 1
         path.fitness = max(0, min(1, fitness))
         path.total_time = total_time
-        path.concepts_covered = len(concepts_covered)
-        path.weak_areas_covered = f"{len(weak_concepts_covered)}/{len(weak_concepts)}" if weak_concepts else "0/0"
+        path.concepts_covered = concepts_covered
+        path.weak_areas_covered = f"{weak_concepts_covered}/{len(weak_concepts)}" if weak_concepts else "0/0"
     
         return path.fitness
 
-    def get_available_modules(self, student):
-        """Get modules that are appropriate based on comprehensive assessment"""
-        available_modules = []
+    def evaluate_population(self, paths, student, context=None):
+        """Score a batch of paths, reusing cached results for already-seen sequences"""
+        context = context or self.build_context(student)
+        if self.fitness_cache is None:
+            return self._score_paths(paths, student, context)
+        
+        # Cached results belong to one student profile; any other profile starts a new run
+        if context.profile != self._cache_profile:
+            self.fitness_cache.clear()
+            self._cache_profile = context.profile
+        
+        pending = {}
+        for path in paths:
+            if path.key in pending:
+                pending[path.key].append(path)
+                continue
+            cached = self.fitness_cache.get(path.key)
+            if cached is None:
+                pending[path.key] = [path]
+            else:
+                self._apply_fitness_result(path, cached)
+        
+        if pending:
+            unique_paths = [duplicates[0] for duplicates in pending.values()]
+            self._score_paths(unique_paths, student, context)
+            for path in unique_paths:
+                result = (path.fitness, path.total_time,
+                          getattr(path, 'concepts_covered', None), getattr(path, 'weak_areas_covered', None))
+                self.fitness_cache.put(path.key, result)
+                for duplicate in pending[path.key][1:]:
+                    self._apply_fitness_result(duplicate, result)
+        
+        return [path.fitness for path in paths]
     
-    # Get detailed knowledge profile from 20-question assessment
-        weak_concepts = student.get_weak_concepts(50)
-        strong_concepts = student.get_strong_concepts(70)
+    def _apply_fitness_result(self, path, result):
+        path.parent_path = None
+        if not len(path):
+            return
+        path.fitness, path.total_time, concepts_covered, weak_areas_covered = result
+        if concepts_covered is not None:
+            path.concepts_covered = concepts_covered
+            path.weak_areas_covered = weak_areas_covered
     
-        for module in self.modules:
-        # Calculate readiness based on prerequisites
-           readiness = student.calculate_readiness(module)
-        
-        # More sophisticated availability logic
-        if readiness >= 30:  # Lower threshold to allow more modules
-            # Prioritize modules that address weak areas
-            addresses_weak_areas = any(concept in weak_concepts for concept in module.concepts)
-            
-            # Penalize modules that only cover strong areas (unless for review)
-            only_strong_areas = all(concept in strong_concepts for concept in module.concepts)
-        
-            if addresses_weak_areas:
-                # High priority - insert at beginning
-                available_modules.insert(0, module)
-            elif not only_strong_areas:
-                # Medium priority - modules with mixed or new concepts
-                available_modules.append(module)
-            elif module.difficulty <= 2 and random.random() < 0.3:
-                # Low priority - occasional easy review modules
-                available_modules.append(module)
-    
-    # If no modules are available, return easier modules
-        if not available_modules:
-            available_modules = [module for module in self.modules if module.difficulty <= 2]
+    def _score_paths(self, paths, student, context):
+        """Score a batch of paths with the configured fitness backend"""
+        self.evaluations += len(paths)
+        if self.parallel_workers:
+            if self.parallel_evaluator is None:
+                from optimization.parallel_evaluation import ParallelEvaluator
+                self.parallel_evaluator = ParallelEvaluator(self.parallel_workers, self.fitness_backend)
+                # A GA dropped without close() must not leak its worker processes
+                self._evaluator_finalizer = weakref.finalize(self, self.parallel_evaluator.shutdown)
+            # Workers score from scratch; don't ship (or keep alive) each path's ancestor chain
+            for path in paths:
+                path.parent_path = None
+            return self.parallel_evaluator.evaluate(paths, student)
+        if self.fitness_engine is not None:
+            return [float(f) for f in self.fitness_engine.evaluate(paths, context)]
+        if self.fitness_backend == "incremental":
+            return [self._score_incremental(path, context) for path in paths]
+        return [self.calculate_fitness(path, student, context) for path in paths]
     
-        print(f"   Available modules: {len(available_modules)} (based on {len(weak_concepts)} weak areas)")
-        return available_modules
-        """Enhanced fitness function that values comprehensive coverage"""
+    def _score_incremental(self, path, context):
+        """Score a path from the prefix state of the nearest scored ancestor"""
+        parent = path.parent_path
+        while parent is not None and parent._state is None:
+            parent = parent.parent_path
+        path.parent_path = None
         if not path.module_sequence:
-           return 0
+            return 0
         
-        fitness = 0
-        total_time = 0
-        concepts_covered = set()
-    
-        # Get ALL concepts from all modules
-        all_required_concepts = self._get_all_required_concepts(student)
-    
-        for module in path.module_sequence:
-          total_time += module.time_estimate
-          concepts_covered.update(module.concepts)
-    
-        # 1. Comprehensive Coverage Fitness (30% weight)
-        if all_required_concepts:
-            coverage_ratio = len(concepts_covered) / len(all_required_concepts)
-        else:
-            coverage_ratio = 0
-        fitness += coverage_ratio * 0.3
-    
-        # 2. Weak Area Coverage (25% weight)
-        weak_concepts = student.get_weak_concepts(50)
-        if weak_concepts:
-           weak_coverage = len([c for c in weak_concepts if c in concepts_covered]) / len(weak_concepts)
-        else:
-           weak_coverage = 1.0
-        fitness += weak_coverage * 0.25
-    
-        # 3. Time Fitness (20% weight)
-        time_ratio = total_time / student.available_time_week if student.available_time_week > 0 else 1
-        if time_ratio <= 1:
-           time_fitness = 1 - (1 - time_ratio) * 0.3
+        if parent is not None and parent._state.context is context:
+            state = PathState.derive(path.module_sequence, parent._state)
         else:
-           time_fitness = 1 / time_ratio
-        fitness += time_fitness * 0.2
+            state = PathState(path.module_sequence, context)
+        
+        path._state = state
+        path.fitness = state.fitness
+        path.total_time = state.total_time
+        path.concepts_covered = popcount(state.covered_mask)
+        weak_count = len(context.weak_concepts)
+        path.weak_areas_covered = f"{popcount(state.covered_mask & context.weak_mask)}/{weak_count}" if weak_count else "0/0"
+        return path.fitness
     
-        # 4. Difficulty Progression (15% weight)
-        progression_score = self.calculate_progression_score(path)
-        fitness += progression_score * 0.15
+    def _derived_path(self, module_sequence, parent):
+        """New LearningPath that remembers its parent when scoring incrementally"""
+        path = self.LearningPath(module_sequence)
+        if self.fitness_backend == "incremental":
+            path.parent_path = parent
+        return path
     
-        # 5. Prerequisite Compliance (10% weight)
-        prereq_score = self.calculate_prerequisite_score(path, student)
-        fitness += prereq_score * 0.1
+    def close(self):
+        """Release the worker pool used by parallel evaluation"""
+        if self.parallel_evaluator is not None:
+            self._evaluator_finalizer()  # Shuts the pool down (once)
+            self.parallel_evaluator = None
     
-        path.fitness = max(0, min(1, fitness))
-        path.total_time = total_time
-        path.concepts_covered = len(concepts_covered)
-        path.total_concepts = len(all_required_concepts)
+    def __enter__(self):
+        return self
     
-        return path.fitness
-        """Enhanced fitness function using real assessment data"""
-        if not path.module_sequence:
-            return 0
-            
-        fitness = 0
-        total_time = 0
-        concepts_covered = set()
-        weak_concepts_covered = set()
-        strong_concepts_reviewed = set()
-        
-        # Get student's knowledge profile
-        weak_concepts = student.get_weak_concepts(threshold=50)
-        strong_concepts = student.get_strong_concepts(threshold=70)
-        all_required_concepts = self._get_all_required_concepts(student)
-        
-        # Track progression through the path
-        learned_concepts = set(student.known_concepts.keys())
-        prerequisite_violations = 0
-        difficulty_changes = 0
-        
-        for i, module in enumerate(path.module_sequence):
-            total_time += module.time_estimate
-            
-            # Track concept coverage
-            for concept in module.concepts:
-                concepts_covered.add(concept)
-                if concept in weak_concepts:
-                    weak_concepts_covered.add(concept)
-                if concept in strong_concepts:
-                    strong_concepts_reviewed.add(concept)
-            
-            # Check prerequisite violations
-            for prereq in module.prerequisites:
-                if prereq not in learned_concepts:
-                    prerequisite_violations += 1
-                    # Extra penalty if student is particularly weak in this prerequisite
-                    if prereq in student.known_concepts and student.known_concepts[prereq] < 30:
-                        prerequisite_violations += 1  # Double penalty for critical gaps
-            
-            # Update learned concepts for next module
-            learned_concepts.update(module.concepts)
-            
-            # Track difficulty progression
-            if i > 0:
-                prev_difficulty = path[i-1].difficulty
-                current_difficulty = module.difficulty
-                difficulty_changes += abs(current_difficulty - prev_difficulty)
-        
-        # 1. Weak Area Coverage Fitness (40% weight) - HIGHEST PRIORITY
-        if weak_concepts:
-            weak_area_coverage = len(weak_concepts_covered) / len(weak_concepts)
-        else:
-            weak_area_coverage = 1.0  # Max score if no weak areas
-            
-        fitness += weak_area_coverage * 0.4
-        
-        # 2. Required Concept Coverage Fitness (20% weight)
-        if all_required_concepts:
-            required_coverage = len(concepts_covered & set(all_required_concepts)) / len(all_required_concepts)
-        else:
-            required_coverage = 1.0
-            
-        fitness += required_coverage * 0.2
-        
-        # 3. Time Fitness (15% weight) - respect student's available time
-        time_ratio = total_time / student.available_time_week if student.available_time_week > 0 else 1
-        if time_ratio <= 1:  # Within or under available time
-            time_fitness = 1 - (1 - time_ratio) * 0.5  # Small penalty for underutilization
-        else:  # Over available time
-            time_fitness = 1 / time_ratio  # Heavy penalty for exceeding
-            
-        fitness += time_fitness * 0.15
-        
-        # 4. Prerequisite Fitness (10% weight)
-        max_possible_violations = sum(len(module.prerequisites) for module in path.module_sequence)
-        if max_possible_violations > 0:
-            prereq_fitness = 1 - (prerequisite_violations / max_possible_violations)
-        else:
-            prereq_fitness = 1.0
-            
-        fitness += prereq_fitness * 0.1
-        
-        # 5. Difficulty Progression Fitness (8% weight)
-        if len(path.module_sequence) > 1:
-            avg_difficulty_change = difficulty_changes / (len(path.module_sequence) - 1)
-            progression_fitness = 1.0 / (1 + avg_difficulty_change)
-        else:
-            progression_fitness = 1.0
-            
-        fitness += progression_fitness * 0.08
-        
-        # 6. Unnecessary Review Penalty (7% weight)
-        if path.module_sequence:
-            review_penalty = len(strong_concepts_reviewed) / (len(concepts_covered) + 1)
-            fitness += (1 - review_penalty) * 0.07
-        
-        # Ensure fitness is between 0 and 1
-        path.fitness = max(0, min(1, fitness))
-        path.total_time = total_time
-        
-        return path.fitness
+    def __exit__(self, *exc_info):
+        self.close()
     
     def _get_all_required_concepts(self, student):
         """Get all concepts required to achieve student's target score"""
@@ -443,26 +500,28 @@ class LearningPathGA:
     def select_parent(self, population):
         """Select a parent using tournament selection"""
         tournament_size = min(5, len(population))
-        tournament = random.sample(population, tournament_size)
+        tournament = self.rng.sample(population, tournament_size)
         tournament.sort(key=lambda x: x.fitness, reverse=True)
         return tournament[0]
     
     def crossover(self, parent1, parent2):
         """Create a child path by combining two parents"""
         if len(parent1) < 2 or len(parent2) < 2:
-            return self.LearningPath(parent1.module_sequence.copy())  # No crossover possible
+            return self._derived_path(parent1.module_sequence.copy(), parent1)  # No crossover possible
             
         # Use ordered crossover to preserve module relationships
         child_sequence = self._ordered_crossover(parent1, parent2)
         
-        return self.LearningPath(child_sequence)
+        # The child's leading modules usually come from parent2 in order
+        return self._derived_path(child_sequence, parent2)
     
     def _ordered_crossover(self, parent1, parent2):
         """Ordered crossover that preserves prerequisite relationships"""
+        parent1, parent2 = parent1.module_sequence, parent2.module_sequence
         size = min(len(parent1), len(parent2))
         
         # Select random crossover points
-        start, end = sorted(random.sample(range(size), 2))
+        start, end = sorted(self.rng.sample(range(size), 2))
         
         # Initialize child with None values
         child = [None] * size
@@ -488,121 +547,396 @@ class LearningPathGA:
         
         return child
     
-    def mutate(self, path, student):
-        """Enhanced mutation with multiple mutation types"""
+    def mutate(self, path, student, context=None):
+        """Enhanced mutation with multiple mutation types
+        
+        The operator is drawn from the fixed bands of MUTATION_OPERATORS (swap 40%,
+        add 25%, remove 20%, scramble 15%), or from the adaptive selector's current
+        probabilities when adaptive_operators is on. The returned path carries the
+        drawn operator in mutation_operator; that operator gets the credit even
+        when the path was too short for it and a fallback was applied.
+        """
         new_sequence = path.module_sequence.copy()
         
         if not new_sequence:
             return path
         
-        mutation_type = random.random()
+        operator = self._draw_mutation_operator()
+        applied = self._applicable_operator(operator, len(new_sequence))
+        getattr(self, f"_{applied}_mutation")(new_sequence, student, context)
         
-        # Swap mutation (40% chance)
-        if mutation_type < 0.4 and len(new_sequence) >= 2:
-            i, j = random.sample(range(len(new_sequence)), 2)
-            new_sequence[i], new_sequence[j] = new_sequence[j], new_sequence[i]
-        
-        # Add mutation (25% chance) - add a module that addresses weak areas
-        elif mutation_type < 0.65:
-            available_modules = self.get_available_modules(student)
-            unused_modules = [m for m in available_modules if m not in new_sequence]
-            
-            if unused_modules:
-                # Prefer modules that address weak areas
-                weak_area_modules = [m for m in unused_modules 
-                                   if any(c in student.get_weak_concepts(50) for c in m.concepts)]
-                
-                if weak_area_modules:
-                    new_module = random.choice(weak_area_modules)
-                else:
-                    new_module = random.choice(unused_modules)
-                
-                insert_pos = random.randint(0, len(new_sequence))
-                new_sequence.insert(insert_pos, new_module)
-        
-        # Remove mutation (20% chance) - remove modules that only review strong areas
-        elif mutation_type < 0.85 and len(new_sequence) > 3:
-            # Identify modules that only cover strong concepts
-            strong_concepts = student.get_strong_concepts(70)
-            removable_modules = []
-            
-            for i, module in enumerate(new_sequence):
-                if all(concept in strong_concepts for concept in module.concepts):
-                    removable_modules.append(i)
+        child = self._derived_path(new_sequence, path)
+        child.mutation_operator = operator
+        return child
+    
+    def _draw_mutation_operator(self):
+        if self.operator_selector is not None:
+            return self.operator_selector.choose(self.rng)
+        return pick_operator(MUTATION_OPERATORS, self.rng.random())
+    
+    @staticmethod
+    def _applicable_operator(operator, length):
+        """Operators that need a longer path fall through to the next band"""
+        if operator == "swap" and length < 2:
+            return "add"
+        if operator == "remove" and length <= 3:
+            return "scramble"
+        return operator
+    
+    def _swap_mutation(self, new_sequence, student, context):
+        i, j = self.rng.sample(range(len(new_sequence)), 2)
+        new_sequence[i], new_sequence[j] = new_sequence[j], new_sequence[i]
+    
+    def _add_mutation(self, new_sequence, student, context):
+        """Add a module that addresses weak areas"""
+        context = context or self.build_context(student)
+        available_modules = self.get_available_modules(student, context)
+        used_ids = {m.id for m in new_sequence}
+        unused_modules = [m for m in available_modules if m.id not in used_ids]
+        
+        if unused_modules:
+            # Prefer modules that address weak areas
+            weak_area_modules = [m for m in unused_modules if m.concept_mask & context.weak_mask]
             
-            if removable_modules:
-                remove_index = random.choice(removable_modules)
-                new_sequence.pop(remove_index)
+            if weak_area_modules:
+                new_module = self.rng.choice(weak_area_modules)
             else:
-                # Remove random module if no obvious candidates
-                new_sequence.pop(random.randint(0, len(new_sequence) - 1))
-        
-        # Scramble mutation (15% chance) - shuffle a segment
+                new_module = self.rng.choice(unused_modules)
+            
+            insert_pos = self.rng.randint(0, len(new_sequence))
+            new_sequence.insert(insert_pos, new_module)
+    
+    def _remove_mutation(self, new_sequence, student, context):
+        """Remove a module that only reviews strong areas"""
+        # Identify modules that only cover strong concepts
+        context = context or self.build_context(student)
+        removable_modules = []
+        
+        for i, module in enumerate(new_sequence):
+            if not module.concept_mask & ~context.strong_mask:
+                removable_modules.append(i)
+        
+        if removable_modules:
+            remove_index = self.rng.choice(removable_modules)
+            new_sequence.pop(remove_index)
         else:
-            if len(new_sequence) >= 4:
-                start, end = sorted(random.sample(range(len(new_sequence)), 2))
-                segment = new_sequence[start:end]
-                random.shuffle(segment)
-                new_sequence[start:end] = segment
-        
-        return self.LearningPath(new_sequence)
+            # Remove random module if no obvious candidates
+            new_sequence.pop(self.rng.randint(0, len(new_sequence) - 1))
     
-    def evolve(self, student, initial_path=None):
-        """Main evolution function to generate optimal learning path"""
-        print(f"🧬 Generating learning path for {student.name}...")
-        print(f"   Population: {self.population_size}, Generations: {self.generations}")
-        print(f"   Target Score: {student.target_score}, Available Time: {student.available_time_week}min")
+    def _scramble_mutation(self, new_sequence, student, context):
+        """Shuffle a segment"""
+        if len(new_sequence) >= 4:
+            start, end = sorted(self.rng.sample(range(len(new_sequence)), 2))
+            segment = new_sequence[start:end]
+            self.rng.shuffle(segment)
+            new_sequence[start:end] = segment
+    
+    def repair(self, path):
+        """Restore prerequisite order in a path without changing its modules"""
+        repaired = repair_order(path.module_sequence, self.catalog)
+        if repaired is path.module_sequence:
+            return path
+        return self._derived_path(repaired, path)
+    
+    def refine(self, path, student, context=None, max_iterations=500, time_budget_ms=None):
+        """Improve a path with local search (2-opt, insertion and removal moves)
+        
+        Moves are scored with incremental delta fitness. Returns the improved
+        path (or the original one) with the search stats in local_search_stats.
+        """
+        context = context or self.build_context(student)
+        candidates = context.weak_area_modules + context.mixed_modules + context.review_modules
+        sequence, fitness, stats = local_search(
+            path.module_sequence, context, candidates, max_iterations, time_budget_ms, rng=self.rng
+        )
+        
+        if fitness > path.fitness + 1e-12:
+            path = self.LearningPath(sequence)
+            self.evaluate_population([path], student, context)
+        path.local_search_stats = stats
+        return path
+    
+    def create_scored_population(self, student, initial_path=None, context=None, seed_mutants=0):
+        """Create and evaluate the starting population, optionally seeded with a known path
         
-        # Create initial population
+        With seed_mutants, that many mutants of initial_path are added as well.
+        """
+        context = context or self.build_context(student)
         if initial_path:
             population = [initial_path]
+            population.extend(self.mutate(initial_path, student, context)
+                              for _ in range(min(seed_mutants, self.population_size - 1)))
             # Fill rest with random paths
-            additional_paths = self.create_initial_population(student)
-            population.extend(additional_paths[:self.population_size-1])
+            additional_paths = self.create_initial_population(student, context)
+            population.extend(additional_paths[:self.population_size-len(population)])
         else:
-            population = self.create_initial_population(student)
+            population = self.create_initial_population(student, context)
+        
+        self.evaluate_population(population, student, context)
+        return population
+    
+    def next_generation(self, population, student, context=None):
+        """Breed one generation from a scored population (best individual first)"""
+        # Elitism: keep the best individual
+        population.sort(key=lambda x: x.fitness, reverse=True)
+        new_population = [population[0]]
+        
+        # Create new generation, then score all offspring in one batch
+        context = context or self.build_context(student)
+        offspring = []
+        credits = []  # (operator, better parent's fitness) per child
+        seen = {new_population[0].key}
+        while len(new_population) + len(offspring) < self.population_size:
+            parent1 = self.select_parent(population)
+            parent2 = self.select_parent(population)
+            child = self.crossover(parent1, parent2)
+            child = self.mutate(child, student, context)
+            credits.append((getattr(child, 'mutation_operator', None), max(parent1.fitness, parent2.fitness)))
+            if self.repair_offspring:
+                child = self.repair(child)
+            if self.deduplicate:
+                if child.key in seen:
+                    # A clone would only cost an evaluation: explore a fresh valid path instead
+                    child = self.random_path(student, context, topological=True)
+                    credits[-1] = (None, 0)
+                    self.duplicates_replaced += 1
+                seen.add(child.key)
+            offspring.append(child)
+        
+        self.evaluate_population(offspring, student, context)
+        if self.operator_selector is not None:
+            for child, (operator, parent_fitness) in zip(offspring, credits):
+                if operator is not None:
+                    self.operator_selector.reward(operator, child.fitness - parent_fitness)
+            self.operator_selector.update()
+        new_population.extend(offspring)
+        return new_population
+    
+    def restart_population(self, population, student, context=None):
+        """Keep the best tenth of a population and replace the rest with fresh topological paths"""
+        context = context or self.build_context(student)
+        population.sort(key=lambda x: x.fitness, reverse=True)
+        elite_count = max(1, self.population_size // 10)
+        fresh = [self.random_path(student, context, topological=True)
+                 for _ in range(self.population_size - elite_count)]
+        self.evaluate_population(fresh, student, context)
+        return population[:elite_count] + fresh
+    
+    def evolve(self, student, initial_path=None, stagnation_generations=None, target_fitness=None,
+               time_budget_ms=None, generations=None, seed_mutants=0, excluded_ids=(), on_generation=None):
+        """Main evolution function to generate optimal learning path
+        
+        Optional stopping criteria end the run early:
+          - stagnation_generations: best fitness has not improved for this many generations
+          - target_fitness: best fitness reached this value
+          - time_budget_ms: wall-clock budget for the whole run
+        The returned path carries stopped_at_generation and stop_reason.
+        generations overrides self.generations for this run; seed_mutants and
+        excluded_ids are used by replan(). on_generation, if given, is called
+        after every generation as on_generation(generation, best_fitness, avg_fitness).
+        """
+        generations = generations or self.generations
+        print(f"🧬 Generating learning path for {student.name}...")
+        print(f"   Population: {self.population_size}, Generations: {generations}")
+        print(f"   Target Score: {student.target_score}, Available Time: {student.available_time_week}min")
+        
+        start_time = time.perf_counter()
+        deadline = start_time + time_budget_ms / 1000 if time_budget_ms else None
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        if self.operator_selector is not None:
+            self.operator_selector.reset()
+        self.evaluations = 0
+        self.duplicates_replaced = 0
+        
+        # Student-derived sets are computed once and shared by every operator
+        context = self.build_context(student, excluded_ids)
+        ready_modules = len(context.weak_area_modules) + len(context.mixed_modules)
+        print(f"   Available modules: {ready_modules} (based on {len(context.weak_concepts)} weak areas)")
         
-        # Evaluate initial population
-        for path in population:
-            self.calculate_fitness(path, student)
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+            self._cache_profile = context.profile
+        
+        population = self.create_scored_population(student, initial_path, context, seed_mutants)
         
         best_fitness_history = []
+        diversity_history = []
+        diversity_meter = DiversityMeter()
+        restarts = 0
+        best_so_far = max(p.fitness for p in population)
+        generations_without_improvement = 0
+        generation = 0
+        stop_reason = "completed"
         
         # Evolution loop
-        for generation in range(self.generations):
-            new_population = []
-            
-            # Elitism: keep the best individual
-            population.sort(key=lambda x: x.fitness, reverse=True)
-            new_population.append(population[0])
+        while generation < generations:
+            if target_fitness is not None and best_so_far >= target_fitness:
+                stop_reason = "target_fitness"
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                stop_reason = "time_budget"
+                break
             
-            # Create new generation
-            while len(new_population) < self.population_size:
-                parent1 = self.select_parent(population)
-                parent2 = self.select_parent(population)
-                child = self.crossover(parent1, parent2)
-                child = self.mutate(child, student)
-                self.calculate_fitness(child, student)
-                new_population.append(child)
-            
-            population = new_population
+            population = self.next_generation(population, student, context)
+            generation += 1
             
             # Track best fitness
             best_fitness = population[0].fitness
             best_fitness_history.append(best_fitness)
             
-            # Print progress every 10 generations
-            if (generation + 1) % 10 == 0:
+            generation_best = max(p.fitness for p in population)
+            
+            if self.track_diversity or self.restart_diversity:
+                diversity = diversity_meter.measure(population)
+                if self.track_diversity:
+                    diversity_history.append(diversity)
+                if self.restart_diversity and diversity["mean_distance"] < self.restart_diversity:
+                    print(f"   Generation {generation}: diversity collapsed "
+                          f"({diversity['mean_distance']:.3f}) - restarting population")
+                    population = self.restart_population(population, student, context)
+                    restarts += 1
+            
+            # Print progress every 10 generations, report every generation to on_generation
+            if generation % 10 == 0 or on_generation:
                 avg_fitness = sum(p.fitness for p in population) / len(population)
-                print(f"   Generation {generation + 1}: Best = {best_fitness:.3f}, Avg = {avg_fitness:.3f}")
+                if generation % 10 == 0:
+                    print(f"   Generation {generation}: Best = {best_fitness:.3f}, Avg = {avg_fitness:.3f}")
+                if on_generation:
+                    on_generation(generation, generation_best, avg_fitness)
+            
+            if generation_best > best_so_far + 1e-9:
+                best_so_far = generation_best
+                generations_without_improvement = 0
+            else:
+                generations_without_improvement += 1
+                if stagnation_generations and generations_without_improvement >= stagnation_generations:
+                    stop_reason = "stagnation"
+                    break
         
         # Return the best path
         population.sort(key=lambda x: x.fitness, reverse=True)
         best_path = population[0]
+        if self.local_search_iterations:
+            best_path = self.refine(best_path, student, context, self.local_search_iterations,
+                                    self.local_search_time_ms)
+            ls_stats = best_path.local_search_stats
+            print(f"   Local search: {ls_stats['start_fitness']:.3f} -> {ls_stats['final_fitness']:.3f} "
+                  f"({ls_stats['improvements']} improvements, {ls_stats['evaluations']} moves)")
+        best_path.stopped_at_generation = generation
+        best_path.stop_reason = stop_reason
+        
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.run_stats = {
+            "generations_run": generation,
+            "stop_reason": stop_reason,
+            "elapsed_ms": elapsed_ms,
+            "best_fitness_history": best_fitness_history,
+            "evaluations": self.evaluations,
+            "diversity": diversity_meter.measure(population),
+        }
+        if self.track_diversity:
+            self.run_stats["diversity_history"] = diversity_history
+        if self.deduplicate:
+            self.run_stats["duplicates_replaced"] = self.duplicates_replaced
+        if self.restart_diversity:
+            self.run_stats["restarts"] = restarts
+        if self.operator_selector is not None:
+            operator_stats = self.operator_selector.stats()
+            self.run_stats["operators"] = operator_stats
+            print("   Operator probabilities: " + ", ".join(
+                f"{name} {probability:.0%}" for name, probability in operator_stats["probabilities"].items()))
+        if self.local_search_iterations:
+            self.run_stats["local_search"] = best_path.local_search_stats
+        if stop_reason != "completed":
+            print(f"   Stopped early at generation {generation} ({stop_reason}, {elapsed_ms:.0f}ms)")
+        
+        if self.fitness_cache is not None:
+            cache_stats = self.fitness_cache.stats()
+            self.run_stats["fitness_cache"] = cache_stats
+            print(f"   Fitness cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.1%} hit rate)")
         
         print(f"✅ Evolution completed! Best path fitness: {best_path.fitness:.3f}")
         return best_path
     
+    def replan(self, student, previous_module_ids, generations=20, time_budget_ms=None, seed_fraction=0.5):
+        """Warm-start a short evolution from a student's previous path
+        
+        Completed modules are dropped from the previous path and kept out of new
+        ones; what remains, plus mutants of it, seeds the population.
+        """
+        completed = set(student.completed_modules)
+        self.select_catalog(student.goal)
+        remaining = self.catalog.modules_for(i for i in previous_module_ids if i not in completed)
+        print(f"♻️  Re-planning for {student.name}: {len(remaining)}/{len(previous_module_ids)} "
+              f"previous modules still to do")
+        
+        initial_path = self.LearningPath(remaining) if remaining else None
+        seed_mutants = int(self.population_size * seed_fraction) if remaining else 0
+        return self.evolve(student, initial_path=initial_path, time_budget_ms=time_budget_ms,
+                           generations=generations, seed_mutants=seed_mutants, excluded_ids=completed)
+    
+    def evolve_many(self, students, workers=None, **evolve_kwargs):
+        """Evolve a path for every student, yielding (index, best_path) as each one finishes
+        
+        With more than one worker the students are spread across a process pool
+        whose workers each load the catalog once; otherwise they run in order on
+        this instance. evolve_kwargs are passed through to evolve(), and
+        self.run_stats holds the stats of the last student yielded. Seeded runs
+        give every student the seed from student_seed(), so results do not depend
+        on the worker count or on the student's position in the cohort.
+        """
+        students = list(students)
+        workers = min(workers or os.cpu_count() or 1, len(students))
+        
+        if workers <= 1:
+            base_seed = self.seed
+            try:
+                for index, student in enumerate(students):
+                    if base_seed is not None:
+                        self.reseed(self.student_seed(student, base_seed))
+                    yield index, self.evolve(student, **evolve_kwargs)
+            finally:
+                if base_seed is not None:
+                    self.reseed(base_seed)
+            return
+        
+        from optimization.batch_evolution import evolve_in_pool
+        for index, best_path, run_stats in evolve_in_pool(self, students, workers, evolve_kwargs):
+            self.run_stats = run_stats
+            yield index, best_path
+    
+    def student_seed(self, student, base_seed=None):
+        """Seed of a student's run within a seeded cohort, derived from its profile fingerprint"""
+        from services.path_cache import profile_fingerprint
+        return derive_seed(self.seed if base_seed is None else base_seed, profile_fingerprint(student, {}))
+    
+    def reseed(self, seed):
+        """Use a new seed for this GA's RNG (and every later evolve() run)"""
+        self.seed = seed
+        self.rng.seed(seed)
+    
+    def worker_params(self):
+        """Constructor arguments for an equivalent GA in a worker process"""
+        return {
+            "population_size": self.population_size,
+            "generations": self.generations,
+            "mutation_rate": self.mutation_rate,
+            "fitness_backend": self.fitness_backend,
+            "fitness_cache_size": self.fitness_cache.max_size if self.fitness_cache is not None else 0,
+            "seeding": self.seeding,
+            "repair_offspring": self.repair_offspring,
+            "local_search_iterations": self.local_search_iterations,
+            "local_search_time_ms": self.local_search_time_ms,
+            "adaptive_operators": self.adaptive_operators,
+            "deduplicate": self.deduplicate,
+            "restart_diversity": self.restart_diversity,
+            "track_diversity": self.track_diversity,
+            "goal": self.goal,
+            "seed": self.seed,
+        }
+    
     def display_path(self, path, student):
         """Display the generated learning path in a readable format"""
         print(f"\n🎯 PERSONALIZED LEARNING PATH FOR {student.name}")
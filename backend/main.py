@@ -8,16 +8,76 @@ import os
 import uvicorn
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import asyncio
+import json
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, field_validator, model_validator
 from typing import Dict, List, Optional, Any
 
-from genetic_algorithm import LearningPathGA
+from genetic_algorithm import LearningPathGA, derive_seed
+from ga_config import (
+    MAX_GENERATIONS, MAX_POPULATION_SIZE, MAX_REPLAN_GENERATIONS, MAX_REPLAN_TIME_BUDGET_MS,
+    ga_params as default_ga_params,
+)
 from models.student import Student
-from data.gre_modules import create_gre_quantitative_modules
+from data.catalog import DEFAULT_GOAL, UnknownGoalError, get_catalog_registry, get_module_catalog
+from services.path_cache import PathCache, profile_fingerprint
+from services.ga_executor import (GAExecutor, ExecutorSaturated, evolve_path, evolve_with_progress, replan_path,
+                                  evolve_pareto)
+from optimization.nsga2 import OBJECTIVES, check_weights, select_from_front
+from services.jobs import JobManager, JobQueueFull
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    ga_executor.shutdown()
+
+app = FastAPI(title="Learning Path Generator API", version="1.0.0", lifespan=lifespan)
+
+_repository = None
+
+# Generated paths shared by near-identical profiles (PATH_CACHE_DIR enables the disk tier)
+path_cache = PathCache(max_size=1024, ttl_seconds=3600, disk_dir=os.environ.get("PATH_CACHE_DIR"))
+
+# GA runs happen off the event loop in a bounded pool (GA_EXECUTOR=thread|process)
+ga_executor = GAExecutor(
+    kind=os.environ.get("GA_EXECUTOR", "process"),
+    workers=int(os.environ["GA_WORKERS"]) if os.environ.get("GA_WORKERS") else None,
+    max_pending=int(os.environ.get("GA_MAX_PENDING", 64))
+)
+
+# Long generations run as background jobs (JOB_WORKERS worker threads)
+job_manager = JobManager(workers=int(os.environ.get("JOB_WORKERS", 2)))
+
+def _saturated_response(error: ExecutorSaturated) -> HTTPException:
+    """503 telling the client when to retry a rejected GA run"""
+    return HTTPException(
+        status_code=503,
+        detail=f"Path generation is busy ({error.pending} runs pending), please retry",
+        headers={"Retry-After": str(error.retry_after)}
+    )
+
+# Engines accepted by the path generation endpoints (see services.ga_executor.evolve_path)
+GA_ENGINES = ("ga", "auto")
 
-app = FastAPI(title="Learning Path Generator API", version="1.0.0")
+# Recent Pareto fronts, so clients can pick other trade-offs without re-running the GA
+MAX_PARETO_FRONTS = 256
+_pareto_fronts = OrderedDict()
+
+def _get_repository():
+    """Connect to the student database on first use"""
+    global _repository
+    if _repository is None:
+        from database.student_repository import get_database_connection
+        _repository = get_database_connection()
+    return _repository
 
 # Enable CORS for frontend development
 app.add_middleware(
@@ -42,7 +102,49 @@ class StudentRequest(BaseModel):
     known_concepts: Dict[str, float]  # {"algebra": 75, "geometry": 45}
     preferred_difficulty_pace: str = "medium"
     learning_style: str = "balanced"
-    goal: str = "gre_quantitative"
+    goal: str = DEFAULT_GOAL  # Selects the module catalog
+    time_budget_ms: Optional[int] = None  # Latency budget for the GA run
+    seed: Optional[int] = None  # Fixed seed makes the generated path reproducible
+    engine: str = "ga"  # "auto" solves small candidate sets exactly, falling back to the GA
+
+class BatchStudentRequest(BaseModel):
+    students: List[StudentRequest]
+    seed: Optional[int] = None  # Base seed for students without a seed of their own
+
+class GenerationJobRequest(StudentRequest):
+    # Default to the shared GA parameters; bounded so one job cannot hold an executor slot indefinitely
+    population_size: Optional[int] = Field(None, gt=0, le=MAX_POPULATION_SIZE)
+    generations: Optional[int] = Field(None, gt=0, le=MAX_GENERATIONS)
+
+class ParetoRequest(StudentRequest):
+    weights: Optional[Dict[str, float]] = None  # Objective weights for the returned point
+
+    @field_validator("weights")
+    @classmethod
+    def _known_objectives(cls, weights):
+        return check_weights(weights) if weights else weights
+
+    @model_validator(mode="after")
+    def _reject_unsupported_options(self):
+        # NSGA-II always runs the full generation count and has no exact engine
+        if self.time_budget_ms is not None:
+            raise ValueError("time_budget_ms is not supported for Pareto fronts")
+        if self.engine != "ga":
+            raise ValueError(f"engine {self.engine!r} is not supported for Pareto fronts")
+        return self
+
+class ParetoSelectRequest(BaseModel):
+    weights: Dict[str, float]
+
+    @field_validator("weights")
+    @classmethod
+    def _known_objectives(cls, weights):
+        return check_weights(weights)
+
+class ReplanRequest(BaseModel):
+    # Short warm-started run instead of a full 100 generations; the budget is required, not optional
+    generations: int = Field(20, gt=0, le=MAX_REPLAN_GENERATIONS)
+    time_budget_ms: int = Field(2000, gt=0, le=MAX_REPLAN_TIME_BUDGET_MS)
 
 class ModuleResponse(BaseModel):
     id: int
@@ -62,6 +164,22 @@ class LearningPathResponse(BaseModel):
     weak_areas_covered: str
     estimated_weeks: int
     modules: List[ModuleResponse]
+    generations_run: Optional[int] = None
+    stop_reason: Optional[str] = None
+    engine: Optional[str] = None
+    solve_time_ms: Optional[float] = None
+
+class ParetoPointResponse(BaseModel):
+    index: int
+    objectives: Dict[str, float]
+    fitness_score: float
+    total_time: int
+    module_ids: List[int]
+
+class ParetoFrontResponse(BaseModel):
+    front_id: str
+    selected: LearningPathResponse
+    front: List[ParetoPointResponse]
 
 class StudentProfileResponse(BaseModel):
     name: str
@@ -72,84 +190,339 @@ class StudentProfileResponse(BaseModel):
     weak_areas: List[str]
     overall_proficiency: float
 
+def _catalog_or_400(goal: str):
+    """Module catalog of a goal (loaded on first use); unknown goals are a client error"""
+    try:
+        return get_module_catalog(goal)
+    except UnknownGoalError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/")
 async def root():
     return {"message": "Learning Path Generator API", "status": "running"}
 
+def _student_from_request(student_data: StudentRequest) -> Student:
+    """Build a Student from an API request"""
+    # Create student object with correct constructor
+    student = Student(
+        name=student_data.name,
+        goal=student_data.goal,
+        target_score=student_data.target_score
+    )
+    
+    # Set student attributes
+    student.known_concepts = student_data.known_concepts
+    student.available_time_week = student_data.available_time_week
+    student.preferred_difficulty_pace = student_data.preferred_difficulty_pace
+    student.learning_style = student_data.learning_style
+    return student
+
+def _build_path_response(student: Student, best_path) -> LearningPathResponse:
+    """Convert an evolved path into the API response for a student"""
+    # Prepare response - FIXED: Use module_sequence instead of modules
+    module_responses = []
+    for module in best_path.module_sequence:  # CHANGED: module_sequence instead of modules
+        readiness = student.calculate_readiness(module)
+        module_responses.append(ModuleResponse(
+            id=module.id,  # CHANGED: Direct access to id
+            name=module.name,
+            difficulty=module.difficulty,
+            time_estimate=module.time_estimate,
+            concepts=module.concepts,
+            prerequisites=getattr(module, 'prerequisites', []),
+            readiness=readiness
+        ))
+    
+    # Calculate weak areas coverage
+    weak_areas = student.get_weak_concepts(50)
+    weak_covered = sum(1 for area in weak_areas 
+                      if any(area in module.concepts for module in best_path.module_sequence))  # CHANGED
+    weak_coverage = f"{weak_covered}/{len(weak_areas)}"
+    
+    # Calculate estimated weeks
+    total_time = sum(module.time_estimate for module in best_path.module_sequence)  # CHANGED
+    weekly_time = student.available_time_week
+    estimated_weeks = max(1, total_time // weekly_time) if weekly_time > 0 else 1
+    
+    return LearningPathResponse(
+        student_name=student.name,
+        target_score=student.target_score,
+        total_modules=len(best_path.module_sequence),  # CHANGED
+        total_time=total_time,
+        fitness_score=getattr(best_path, 'fitness', 0.8),
+        weak_areas_covered=weak_coverage,
+        estimated_weeks=estimated_weeks,
+        modules=module_responses,
+        generations_run=getattr(best_path, 'stopped_at_generation', None),
+        stop_reason=getattr(best_path, 'stop_reason', None),
+        engine=getattr(best_path, 'engine', None),
+        solve_time_ms=getattr(best_path, 'solve_time_ms', None)
+    )
+
 @app.post("/generate-path", response_model=LearningPathResponse)
 async def generate_learning_path(student_data: StudentRequest):
     """Generate a personalized learning path using Genetic Algorithm"""
     try:
-        # Create student object with correct constructor
-        student = Student(
-            name=student_data.name,
-            goal=student_data.goal,
-            target_score=student_data.target_score
-        )
-        
-        # Set student attributes
-        student.known_concepts = student_data.known_concepts
-        student.available_time_week = student_data.available_time_week
-        student.preferred_difficulty_pace = student_data.preferred_difficulty_pace
-        student.learning_style = student_data.learning_style
+        student = _student_from_request(student_data)
         
         print(f"🎯 Generating path for {student.name}, target: {student.target_score}")
         print(f"📊 Known concepts: {len(student.known_concepts)}")
         print(f"⏰ Available time: {student.available_time_week} min/week")
         
-        # Generate learning path - FIXED: Use your actual GA interface
-        ga = LearningPathGA(
-            population_size=50, 
-            generations=100,
-            mutation_rate=0.1
+        catalog = _catalog_or_400(student_data.goal)
+        ga_params = default_ga_params(seed=student_data.seed)
+        if student_data.engine not in GA_ENGINES:
+            raise HTTPException(status_code=400, detail=f"Unknown engine: {student_data.engine}")
+        cache_key = profile_fingerprint(
+            student_data, dict(ga_params, time_budget_ms=student_data.time_budget_ms, engine=student_data.engine)
         )
+        cached = path_cache.get(cache_key)
+        if cached:
+            print(f"⚡ Path cache hit for {student.name}")
+            best_path = LearningPathGA.LearningPath.from_ids(cached["module_ids"], catalog)
+            best_path.fitness = cached["fitness"]
+            best_path.stopped_at_generation = cached["generations_run"]
+            best_path.stop_reason = cached["stop_reason"]
+            best_path.engine = cached.get("engine")
+            return _build_path_response(student, best_path)
         
-        best_path = ga.evolve(student)
+        # Generate learning path in the GA pool so the event loop keeps serving requests
+        best_path = await ga_executor.run(
+            evolve_path, ga_params, student, {"time_budget_ms": student_data.time_budget_ms}, student_data.engine
+        )
         
         if not best_path:
             raise HTTPException(status_code=500, detail="Failed to generate learning path")
         
-        # Prepare response - FIXED: Use module_sequence instead of modules
-        module_responses = []
-        for module in best_path.module_sequence:  # CHANGED: module_sequence instead of modules
-            readiness = student.calculate_readiness(module)
-            module_responses.append(ModuleResponse(
-                id=module.id,  # CHANGED: Direct access to id
-                name=module.name,
-                difficulty=module.difficulty,
-                time_estimate=module.time_estimate,
-                concepts=module.concepts,
-                prerequisites=getattr(module, 'prerequisites', []),
-                readiness=readiness
-            ))
+        path_cache.put(cache_key, {
+            "module_ids": list(best_path.key),
+            "fitness": best_path.fitness,
+            "generations_run": best_path.stopped_at_generation,
+            "stop_reason": best_path.stop_reason,
+            "engine": getattr(best_path, 'engine', None),
+        })
+        return _build_path_response(student, best_path)
         
-        # Calculate weak areas coverage
-        weak_areas = student.get_weak_concepts(50)
-        weak_covered = sum(1 for area in weak_areas 
-                          if any(area in module.concepts for module in best_path.module_sequence))  # CHANGED
-        weak_coverage = f"{weak_covered}/{len(weak_areas)}"
+    except ExecutorSaturated as e:
+        raise _saturated_response(e)
+    except HTTPException:
+        raise
+    except Exception as e:
+        import traceback
+        print(f"❌ Error generating path: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error generating path: {str(e)}")
+
+# Executor runs one cohort may hold at once, and the wait before retrying a full executor
+BATCH_RETRY_SECONDS = 0.5
+
+def _batch_slots():
+    """Two runs per executor worker, but never more than half of the executor's queue"""
+    return max(1, min(2 * ga_executor.workers, ga_executor.max_pending // 2))
+
+@app.post("/generate-paths/batch")
+async def generate_learning_paths_batch(batch: BatchStudentRequest):
+    """Generate paths for a whole cohort, streamed as NDJSON in completion order
+
+    Every student is one run on the shared GA executor with its own seed,
+    engine and time budget. Cohorts of any size are accepted: at most
+    BATCH_SLOTS of their runs are in the executor at a time, so other callers
+    keep room in its queue. 503 only when the executor is already full.
+    """
+    for student_data in batch.students:
+        _catalog_or_400(student_data.goal)
+        if student_data.engine not in GA_ENGINES:
+            raise HTTPException(status_code=400, detail=f"Unknown engine: {student_data.engine}")
+    if ga_executor.pending >= ga_executor.max_pending:
+        raise _saturated_response(ExecutorSaturated(ga_executor.pending, ga_executor.retry_after_seconds))
+    students = [_student_from_request(student_data) for student_data in batch.students]
+    slots = asyncio.Semaphore(_batch_slots())
+    print(f"👥 Generating paths for a cohort of {len(students)} students")
+    
+    async def run_student(index):
+        student_data, student = batch.students[index], students[index]
+        seed = student_data.seed
+        if seed is None and batch.seed is not None:
+            # Same per-student seed as LearningPathGA.evolve_many
+            seed = derive_seed(batch.seed, profile_fingerprint(student, {}))
+        try:
+            async with slots:
+                while True:
+                    try:
+                        best_path = await ga_executor.run(
+                            evolve_path, default_ga_params(seed=seed), student,
+                            {"time_budget_ms": student_data.time_budget_ms}, student_data.engine
+                        )
+                        break
+                    except ExecutorSaturated:
+                        # Other callers filled the executor; the cohort is already accepted, so wait
+                        await asyncio.sleep(BATCH_RETRY_SECONDS)
+            return {"index": index, "path": _build_path_response(student, best_path).dict()}
+        except Exception as e:
+            print(f"❌ Error generating batch path {index}: {str(e)}")
+            return {"index": index, "error": f"Error generating path: {str(e)}"}
+    
+    async def stream_results():
+        tasks = [asyncio.ensure_future(run_student(index)) for index in range(len(students))]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield json.dumps(await next_result) + "\n"
+        finally:
+            # Client went away: drop the runs that have not started yet
+            for task in tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+def _run_generation_job(job_data: GenerationJobRequest, report):
+    """Job body: evolve a path on the GA executor, reporting best/avg fitness after every generation"""
+    student = _student_from_request(job_data)
+    ga_params = default_ga_params(seed=job_data.seed)
+    if job_data.population_size:
+        ga_params["population_size"] = job_data.population_size
+    if job_data.generations:
+        ga_params["generations"] = job_data.generations
+    
+    while True:
+        try:
+            best_path = ga_executor.run_with_progress(
+                evolve_with_progress, report, ga_params, student, {"time_budget_ms": job_data.time_budget_ms}
+            )
+            break
+        except ExecutorSaturated as e:
+            # Queued jobs wait for room in the executor instead of failing
+            time.sleep(e.retry_after)
+    return _build_path_response(student, best_path).dict()
+
+def _get_job_or_404(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+@app.post("/jobs/generate-path", status_code=202)
+async def submit_generation_job(job_data: GenerationJobRequest):
+    """Queue a path generation and return its job id immediately"""
+    _catalog_or_400(job_data.goal)
+    try:
+        job = job_manager.submit(_run_generation_job, job_data)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    print(f"📥 Queued path generation job {job.id} for {job_data.name}")
+    return {"job_id": job.id, "status": job.status}
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status, latest progress and (when completed) the generated path of a job"""
+    return _get_job_or_404(job_id).to_dict()
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Server-sent events: one 'progress' event per generation, then 'completed' or 'failed'"""
+    job = _get_job_or_404(job_id)
+    
+    async def event_stream():
+        sent = 0
+        while True:
+            finished = job.finished  # Read before draining so no trailing events are missed
+            events = job.events
+            while sent < len(events):
+                yield f"event: progress\ndata: {json.dumps(events[sent])}\n\n"
+                sent += 1
+            if finished:
+                yield f"event: {job.status}\ndata: {json.dumps(job.to_dict())}\n\n"
+                return
+            await asyncio.sleep(0.25)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+@app.post("/generate-path/pareto", response_model=ParetoFrontResponse)
+async def generate_pareto_front(student_data: ParetoRequest):
+    """Evolve a Pareto front of paths (NSGA-II) and return it with the point chosen by weights"""
+    _catalog_or_400(student_data.goal)
+    try:
+        student = _student_from_request(student_data)
+        ga_params = default_ga_params(seed=student_data.seed)
+        best_path, front = await ga_executor.run(evolve_pareto, ga_params, student, student_data.weights)
         
-        # Calculate estimated weeks
-        total_time = sum(module.time_estimate for module in best_path.module_sequence)  # CHANGED
-        weekly_time = student.available_time_week
-        estimated_weeks = max(1, total_time // weekly_time) if weekly_time > 0 else 1
+        front_id = uuid.uuid4().hex
+        _pareto_fronts[front_id] = (student, front)
+        if len(_pareto_fronts) > MAX_PARETO_FRONTS:
+            _pareto_fronts.popitem(last=False)
         
-        return LearningPathResponse(
-            student_name=student.name,
-            target_score=student.target_score,
-            total_modules=len(best_path.module_sequence),  # CHANGED
-            total_time=total_time,
-            fitness_score=getattr(best_path, 'fitness', 0.8),
-            weak_areas_covered=weak_coverage,
-            estimated_weeks=estimated_weeks,
-            modules=module_responses
+        return ParetoFrontResponse(
+            front_id=front_id,
+            selected=_build_path_response(student, best_path),
+            front=[
+                ParetoPointResponse(
+                    index=index,
+                    objectives=dict(zip(OBJECTIVES, path.objectives)),
+                    fitness_score=path.fitness,
+                    total_time=path.total_time,
+                    module_ids=list(path.key)
+                )
+                for index, path in enumerate(front)
+            ]
         )
         
+    except ExecutorSaturated as e:
+        raise _saturated_response(e)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         import traceback
-        print(f"❌ Error generating path: {str(e)}")
+        print(f"❌ Error generating Pareto front: {str(e)}")
         print(traceback.format_exc())
-        raise HTTPException(status_code=500, detail=f"Error generating path: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating Pareto front: {str(e)}")
+
+@app.post("/pareto/{front_id}/select", response_model=LearningPathResponse)
+async def select_pareto_point(front_id: str, selection: ParetoSelectRequest):
+    """Pick the point of a stored Pareto front that is best under new weights"""
+    if front_id not in _pareto_fronts:
+        raise HTTPException(status_code=404, detail=f"Pareto front not found: {front_id}")
+    student, front = _pareto_fronts[front_id]
+    try:
+        best_path = select_from_front(front, selection.weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _build_path_response(student, best_path)
+
+@app.post("/student/{student_id}/replan", response_model=LearningPathResponse)
+async def replan_learning_path(student_id: str, replan_data: Optional[ReplanRequest] = None):
+    """Re-plan a stored student's path, warm-started from their latest saved path"""
+    replan_data = replan_data or ReplanRequest()
+    try:
+        # pymongo calls block (connect + ping on first use), so keep them off the event loop
+        repository = await run_in_threadpool(_get_repository)
+        student = await run_in_threadpool(repository.load_student, student_id)
+        if not student:
+            raise HTTPException(status_code=404, detail=f"Student not found: {student_id}")
+        # A stored profile may name a goal this server has no catalog for
+        _catalog_or_400(student.goal)
+        
+        latest_path = await run_in_threadpool(repository.get_latest_learning_path, student_id)
+        previous_module_ids = latest_path['module_sequence'] if latest_path else []
+        
+        ga_params = default_ga_params()
+        best_path = await ga_executor.run(
+            replan_path, ga_params, student, previous_module_ids,
+            {"generations": replan_data.generations, "time_budget_ms": replan_data.time_budget_ms}
+        )
+        await run_in_threadpool(repository.save_learning_path, best_path, student_id)
+        
+        return _build_path_response(student, best_path)
+        
+    except ExecutorSaturated as e:
+        raise _saturated_response(e)
+    except HTTPException:
+        raise
+    except UnknownGoalError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        import traceback
+        print(f"❌ Error re-planning path: {str(e)}")
+        print(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error re-planning path: {str(e)}")
 
 @app.get("/student/profile", response_model=StudentProfileResponse)
 async def get_student_profile(name: str, target_score: int):
@@ -202,10 +575,10 @@ async def get_student_profile(name: str, target_score: int):
         raise HTTPException(status_code=500, detail=f"Error analyzing profile: {str(e)}")
 
 @app.get("/modules/list")
-async def list_all_modules():
+async def list_all_modules(goal: str = DEFAULT_GOAL):
     """Get list of all available modules"""
+    modules = _catalog_or_400(goal).modules
     try:
-        modules = create_gre_quantitative_modules()
         
         return {
             "total_modules": len(modules),
@@ -224,6 +597,31 @@ async def list_all_modules():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading modules: {str(e)}")
 
+@app.get("/modules/{module_id}/prerequisites")
+async def get_module_prerequisites(module_id: int, completed: Optional[str] = None, goal: str = DEFAULT_GOAL):
+    """Direct and transitive prerequisites of a module, and what is still missing
+
+    completed is a comma-separated list of completed module ids.
+    """
+    catalog = _catalog_or_400(goal)
+    if module_id not in catalog.by_id:
+        raise HTTPException(status_code=404, detail=f"Module not found: {module_id}")
+    try:
+        completed_ids = [int(i) for i in completed.split(",") if i.strip()] if completed else []
+    except ValueError:
+        raise HTTPException(status_code=400, detail="completed must be a comma-separated list of module ids")
+
+    completed_mask = catalog.mask_of(completed_ids)
+    return {
+        "module_id": module_id,
+        "depth": catalog.depth[module_id],
+        "direct_prerequisites": list(catalog.prerequisites[module_id]),
+        "all_prerequisites": catalog.ids_of(catalog.ancestors[module_id]),
+        "missing_prerequisites": catalog.ids_of(catalog.missing_ancestors(module_id, completed_mask)),
+        "ready": catalog.is_ready(module_id, completed_mask),
+        "unlocks": catalog.ids_of(catalog.descendants[module_id]),
+    }
+
 # In backend/main.py - UPDATE ASSESSMENT PROCESSING
 @app.post("/student/assess")
 async def assess_student_knowledge(known_concepts: Dict[str, float]):
@@ -292,16 +690,29 @@ def generate_recommendations(self, strong_areas, weak_areas, overall_proficiency
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error in assessment: {str(e)}")
 
+@app.get("/catalogs")
+async def list_catalogs():
+    """Goals with a module catalog, and which catalogs are currently loaded"""
+    return get_catalog_registry().stats()
+
+@app.get("/cache/stats")
+async def get_cache_stats():
+    """Hit-rate metrics of the generated-path cache"""
+    return path_cache.stats()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     try:
         # Test if modules can be loaded
-        modules = create_gre_quantitative_modules()
+        modules = get_module_catalog().modules
         return {
             "status": "healthy",
             "modules_loaded": len(modules),
+            "catalogs": get_catalog_registry().stats(),
+            "ga_executor": ga_executor.stats(),
+            "jobs": job_manager.stats(),
             "database": "connected"  # You could add actual DB check here
         }
     except Exception as e:
@@ -309,10 +720,11 @@ async def health_check():
     
 # In backend/main.py - ADD THIS ENDPOINT
 @app.get("/modules/all")
-async def get_all_modules():
-    """Get all 55 GRE quantitative modules with full details"""
+async def get_all_modules(goal: str = DEFAULT_GOAL):
+    """Get all modules of a goal's catalog (the 55 GRE quantitative ones by default) with full details"""
+    catalog = _catalog_or_400(goal)
     try:
-        modules = create_gre_quantitative_modules()
+        modules = catalog.modules
         
         return {
             "total_modules": len(modules),
@@ -325,6 +737,7 @@ async def get_all_modules():
                     "concepts": module.concepts,
                     "prerequisites": module.prerequisites,
                     "topics": module.topics,
+                    "level": catalog.depth[module.id],
                     "description": getattr(module, 'description', f"Master {', '.join(module.concepts)} concepts")
                 }
                 for module in modules
@@ -3,6 +3,10 @@ This test is roughly 3 hours long and consists of about 66 questions on the cont
  '''
  
 class Module :
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ("id", "name", "difficulty", "time_estimate", "concepts", "topics",
+                 "prerequisites", "prerequisite_ids", "concept_mask", "prerequisite_mask")
+    
     def __init__(self, id, name, difficulty, time_estimate, concepts = None, topics = None):
         self.id = id
         self.name = name
@@ -20,11 +24,20 @@ class Module :
             self.topics = topics
             
         self.prerequisites = []
+        self.prerequisite_ids = []  # Module ids this module depends on (prerequisite DAG edges)
+        
+        # Bitmask views of concepts/prerequisites, filled in by ConceptRegistry.index_modules
+        self.concept_mask = 0
+        self.prerequisite_mask = 0
         
     def add_prerequisite(self, concept):
         if concept not in self.prerequisites:
             self.prerequisites.append(concept)
     
+    def add_prerequisite_module(self, module_id):
+        if module_id not in self.prerequisite_ids:
+            self.prerequisite_ids.append(module_id)
+    
     def __str__(self):
         return f"Module({self.id}: {self.name})"
     
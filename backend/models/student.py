@@ -447,6 +447,33 @@ def create_sample_student():
     return student
 
 
+def create_synthetic_students(count, seed=None, concepts=None):
+    """Create randomized student profiles for benchmarks and parameter tuning"""
+    import random
+    rng = random.Random(seed)
+    concepts = concepts or [
+        "integers", "arithmetic_operations", "order_of_operations", "fractions", "decimals",
+        "percentages", "ratios", "algebraic_expressions", "linear_equations", "quadratic_equations",
+        "mean_median_mode", "probability", "triangles", "circles", "coordinate_geometry",
+    ]
+    
+    students = []
+    for i in range(count):
+        student = Student(
+            student_id=f"synthetic-{i}",
+            name=f"Synthetic Student {i}",
+            goal="gre_quantitative",
+            target_score=rng.choice([150, 155, 160, 165, 170])
+        )
+        for concept in rng.sample(concepts, rng.randint(3, len(concepts))):
+            student.add_known_concept(concept, rng.randint(10, 100))
+        student.available_time_week = rng.choice([180, 360, 600, 720])
+        student.preferred_difficulty_pace = rng.choice(["slow", "medium", "fast"])
+        students.append(student)
+    
+    return students
+
+
 # Test the interactive configuration
 if __name__ == "__main__":
     print("🧪 INTERACTIVE STUDENT CONFIGURATION TEST")
@@ -0,0 +1,63 @@
+"""
+Cohort path generation for LearningPathGA
+Students are spread across a process pool; each worker builds the module
+catalog and concept matrices once and reuses them for every student it gets
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Per-process GA shared by every student evolved in this worker
+_batch_ga = None
+
+
+def _init_batch_worker(ga_params):
+    global _batch_ga
+    from genetic_algorithm import LearningPathGA
+    _batch_ga = LearningPathGA(**ga_params)
+
+
+def _evolve_student(student, seed, evolve_kwargs):
+    """Run one full evolve() inside a worker and return the best path as plain data"""
+    _batch_ga.reseed(seed)
+    best_path = _batch_ga.evolve(student, **evolve_kwargs)
+    return {
+        "module_ids": [module.id for module in best_path.module_sequence],
+        "fitness": best_path.fitness,
+        "concepts_covered": getattr(best_path, 'concepts_covered', None),
+        "weak_areas_covered": getattr(best_path, 'weak_areas_covered', None),
+        "stopped_at_generation": best_path.stopped_at_generation,
+        "stop_reason": best_path.stop_reason,
+        "run_stats": _batch_ga.run_stats,
+    }
+
+
+def evolve_in_pool(ga, students, workers, evolve_kwargs):
+    """Yield (index, best_path, run_stats) for each student as its worker finishes"""
+    from data.catalog import get_module_catalog
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_batch_worker,
+        initargs=(ga.worker_params(),),
+    )
+    try:
+        # Seeded runs give every student the same seed as a serial run would
+        seeds = [ga.student_seed(student) if ga.seed is not None else ga.rng.getrandbits(32)
+                 for student in students]
+        futures = {
+            executor.submit(_evolve_student, student, seeds[index], evolve_kwargs): index
+            for index, student in enumerate(students)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            # Workers switch to each student's goal catalog; an empty goal keeps the GA's
+            catalog = get_module_catalog(students[futures[future]].goal or ga.goal)
+            best_path = ga.LearningPath.from_ids(result["module_ids"], catalog)
+            best_path.fitness = result["fitness"]
+            best_path.concepts_covered = result["concepts_covered"]
+            best_path.weak_areas_covered = result["weak_areas_covered"]
+            best_path.stopped_at_generation = result["stopped_at_generation"]
+            best_path.stop_reason = result["stop_reason"]
+            yield futures[future], best_path, result["run_stats"]
+    finally:
+        # Also reached when the consumer stops early (e.g. a client disconnects)
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,315 @@
+"""
+Incremental (delta) fitness for learning paths
+A PathState keeps the running totals of calculate_fitness at every position
+of a path, so a path that differs only from some position onwards is scored
+by reusing the shared prefix and, where possible, the unchanged suffix
+"""
+
+import time
+
+
+def combine_fitness(context, length, total_time, covered_mask, violations, max_violations,
+                    difficulty_changes, weak_focus):
+    """Final fitness from path totals; same weights as LearningPathGA.calculate_fitness"""
+    if not length:
+        return 0
+
+    weak_count = len(context.weak_concepts)
+    if weak_count:
+        fitness = (covered_mask & context.weak_mask).bit_count() / weak_count * 0.3
+        fitness += weak_focus / length * 0.1
+    else:
+        fitness = 0.3
+
+    required_count = len(context.required_concepts)
+    if required_count:
+        fitness += (covered_mask & context.required_mask).bit_count() / required_count * 0.25
+    else:
+        fitness += 0.25
+
+    available_time = context.available_time_week
+    time_ratio = total_time / available_time if available_time > 0 else 1
+    time_fitness = 1 - (time_ratio - 1) * 0.5 if time_ratio <= 1.2 else 1 / time_ratio
+    fitness += time_fitness * 0.15
+
+    fitness += (1 - violations / max_violations if max_violations > 0 else 1.0) * 0.12
+
+    if length > 1:
+        fitness += 1.0 / (1 + difficulty_changes / (length - 1) * 0.5) * 0.10
+    else:
+        fitness += 0.10
+
+    review_penalty = (covered_mask & context.strong_mask).bit_count() / (covered_mask.bit_count() + 1)
+    fitness += (1 - review_penalty) * 0.08
+
+    return max(0, min(1, fitness))
+
+
+def fitness_components(context, length, total_time, covered_mask, violations, max_violations,
+                       difficulty_changes, weak_focus):
+    """The six unweighted fitness objectives of a path (higher is better)
+
+    Weighting them with FITNESS_WEIGHTS gives combine_fitness before clamping;
+    the weak-area focus bonus is folded into the weak-area objective.
+    """
+    if not length:
+        return (0.0,) * len(FITNESS_WEIGHTS)
+
+    weak_count = len(context.weak_concepts)
+    if weak_count:
+        weak = (covered_mask & context.weak_mask).bit_count() / weak_count + weak_focus / length / 3
+    else:
+        weak = 1.0
+
+    required_count = len(context.required_concepts)
+    required = (covered_mask & context.required_mask).bit_count() / required_count if required_count else 1.0
+
+    available_time = context.available_time_week
+    time_ratio = total_time / available_time if available_time > 0 else 1
+    time_fit = 1 - (time_ratio - 1) * 0.5 if time_ratio <= 1.2 else 1 / time_ratio
+
+    prerequisites = 1 - violations / max_violations if max_violations > 0 else 1.0
+    progression = 1.0 / (1 + difficulty_changes / (length - 1) * 0.5) if length > 1 else 1.0
+    review = 1 - (covered_mask & context.strong_mask).bit_count() / (covered_mask.bit_count() + 1)
+
+    return (weak, required, time_fit, prerequisites, progression, review)
+
+
+# Objective names and the weights calculate_fitness applies to them
+FITNESS_WEIGHTS = {
+    "weak_area_coverage": 0.3,
+    "required_coverage": 0.25,
+    "time_fit": 0.15,
+    "prerequisite_compliance": 0.12,
+    "difficulty_progression": 0.10,
+    "review_efficiency": 0.08,
+}
+
+
+class PathState:
+    """Prefix and suffix totals of one module sequence under one EvaluationContext
+
+    Index i of a prefix list holds the totals of modules [0, i); index i of a
+    suffix list holds the totals of modules [i, n) assuming the learned mask
+    the original path has at position i. Prefix lists are built eagerly and can
+    be inherited from a parent path; suffix lists are built on first use.
+    """
+
+    def __init__(self, sequence, context, parent=None, start=0):
+        self.sequence = list(sequence)
+        self.context = context
+        self._suffix = None
+        self._suffix_concepts = None
+
+        if parent is None:
+            start = 0
+            self.learned = [context.known_mask]
+            self.covered = [0]
+            self.prefix = [(0, 0, 0, 0, 0)]
+        else:
+            # Modules before start are shared with the parent, so are their totals
+            self.learned = parent.learned[:start + 1]
+            self.covered = parent.covered[:start + 1]
+            self.prefix = parent.prefix[:start + 1]
+
+        learned = self.learned[start]
+        covered = self.covered[start]
+        total_time, violations, max_violations, difficulty_changes, weak_focus = self.prefix[start]
+        weak_mask = context.weak_mask
+        previous = self.sequence[start - 1] if start > 0 else None
+        for module in self.sequence[start:]:
+            total_time += module.time_estimate
+            weak_focus += (module.concept_mask & weak_mask).bit_count()
+            violations += (module.prerequisite_mask & ~learned).bit_count()
+            max_violations += module.prerequisite_mask.bit_count()
+            if previous is not None:
+                difficulty_changes += abs(module.difficulty - previous.difficulty)
+            learned |= module.concept_mask
+            covered |= module.concept_mask
+            previous = module
+            self.learned.append(learned)
+            self.covered.append(covered)
+            self.prefix.append((total_time, violations, max_violations, difficulty_changes, weak_focus))
+
+        self.fitness = combine_fitness(
+            context, len(self.sequence), total_time, covered, violations, max_violations,
+            difficulty_changes, weak_focus,
+        )
+
+    def objectives(self):
+        """fitness_components() of the whole sequence"""
+        total_time, violations, max_violations, difficulty_changes, weak_focus = self.prefix[-1]
+        return fitness_components(
+            self.context, len(self.sequence), total_time, self.covered[-1], violations, max_violations,
+            difficulty_changes, weak_focus,
+        )
+
+    @classmethod
+    def derive(cls, sequence, parent):
+        """State for a sequence that shares a prefix with a parent path's sequence"""
+        start = 0
+        parent_sequence = parent.sequence
+        limit = min(len(sequence), len(parent_sequence))
+        while start < limit and sequence[start] is parent_sequence[start]:
+            start += 1
+        return cls(sequence, parent.context, parent, start)
+
+    @property
+    def total_time(self):
+        return self.prefix[-1][0]
+
+    @property
+    def covered_mask(self):
+        return self.covered[-1]
+
+    @property
+    def suffix(self):
+        if self._suffix is None:
+            self._build_suffix()
+        return self._suffix
+
+    @property
+    def suffix_concepts(self):
+        if self._suffix_concepts is None:
+            self._build_suffix()
+        return self._suffix_concepts
+
+    def _build_suffix(self):
+        # Suffix totals only depend on the original learned masks, so they are reusable
+        # whenever a changed path reaches the same learned mask at the same module
+        n = len(self.sequence)
+        weak_mask = self.context.weak_mask
+        suffix = [(0, 0, 0, 0, 0)] * (n + 1)
+        suffix_concepts = [0] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            module = self.sequence[i]
+            total_time, violations, max_violations, difficulty_changes, weak_focus = suffix[i + 1]
+            if i + 1 < n:
+                difficulty_changes += abs(self.sequence[i + 1].difficulty - module.difficulty)
+            suffix[i] = (
+                total_time + module.time_estimate,
+                violations + (module.prerequisite_mask & ~self.learned[i]).bit_count(),
+                max_violations + module.prerequisite_mask.bit_count(),
+                difficulty_changes,
+                weak_focus + (module.concept_mask & weak_mask).bit_count(),
+            )
+            suffix_concepts[i] = suffix_concepts[i + 1] | module.concept_mask
+        self._suffix = suffix
+        self._suffix_concepts = suffix_concepts
+
+    def score(self, new_sequence, start, resume_new, resume_old):
+        """Fitness of new_sequence, which equals this sequence before start
+
+        new_sequence[resume_new:] must equal self.sequence[resume_old:]. The
+        changed part is rescored from the stored prefix; the rest is taken from
+        the stored suffix as soon as the learned masks line up again.
+        """
+        context = self.context
+        length = len(new_sequence)
+        learned = self.learned[start]
+        covered = self.covered[start]
+        total_time, violations, max_violations, difficulty_changes, weak_focus = self.prefix[start]
+        previous = new_sequence[start - 1] if start > 0 else None
+
+        for i in range(start, length):
+            if i >= resume_new:
+                old_index = i - resume_new + resume_old
+                if learned == self.learned[old_index]:
+                    s_time, s_violations, s_max, s_changes, s_focus = self.suffix[old_index]
+                    if previous is not None:
+                        difficulty_changes += abs(new_sequence[i].difficulty - previous.difficulty)
+                    return combine_fitness(
+                        context, length, total_time + s_time, covered | self.suffix_concepts[old_index],
+                        violations + s_violations, max_violations + s_max,
+                        difficulty_changes + s_changes, weak_focus + s_focus,
+                    )
+
+            module = new_sequence[i]
+            total_time += module.time_estimate
+            weak_focus += (module.concept_mask & context.weak_mask).bit_count()
+            violations += (module.prerequisite_mask & ~learned).bit_count()
+            max_violations += module.prerequisite_mask.bit_count()
+            if previous is not None:
+                difficulty_changes += abs(module.difficulty - previous.difficulty)
+            learned |= module.concept_mask
+            covered |= module.concept_mask
+            previous = module
+
+        return combine_fitness(context, length, total_time, covered, violations, max_violations,
+                               difficulty_changes, weak_focus)
+
+    # Neighbourhood moves: each returns (new_sequence, fitness)
+
+    def reverse(self, i, j):
+        """2-opt: reverse modules i..j (j = i + 1 is an adjacent swap)"""
+        new_sequence = self.sequence[:i] + self.sequence[i:j + 1][::-1] + self.sequence[j + 1:]
+        return new_sequence, self.score(new_sequence, i, j + 1, j + 1)
+
+    def insert(self, i, module):
+        new_sequence = self.sequence[:i] + [module] + self.sequence[i:]
+        return new_sequence, self.score(new_sequence, i, i + 1, i)
+
+    def remove(self, i):
+        new_sequence = self.sequence[:i] + self.sequence[i + 1:]
+        return new_sequence, self.score(new_sequence, i, i, i + 1)
+
+
+def local_search(sequence, context, candidates, max_iterations=500, time_budget_ms=None,
+                 min_length=4, rng=None):
+    """First-improvement hill climbing over 2-opt, insertion and removal moves
+
+    max_iterations bounds the number of moves evaluated. Stops early at a local
+    optimum (a full neighbourhood without improvement) or when the time budget
+    runs out. Returns (sequence, fitness, stats).
+    """
+    deadline = time.perf_counter() + time_budget_ms / 1000 if time_budget_ms else None
+    state = PathState(sequence, context)
+    start_fitness = state.fitness
+    evaluations = 0
+    improvements = 0
+    stop_reason = "local_optimum"
+
+    while True:
+        in_path = {module.id for module in state.sequence}
+        n = len(state.sequence)
+        moves = [("reverse", i, j) for i in range(n - 1) for j in range(i + 1, n)]
+        moves.extend(("insert", i, module) for module in candidates if module.id not in in_path
+                     for i in range(n + 1))
+        if n > min_length:
+            moves.extend(("remove", i, None) for i in range(n))
+        if rng is not None:
+            rng.shuffle(moves)
+
+        improved = False
+        for move, i, arg in moves:
+            if evaluations >= max_iterations:
+                stop_reason = "iterations"
+                break
+            if deadline is not None and evaluations % 32 == 0 and time.perf_counter() >= deadline:
+                stop_reason = "time_budget"
+                break
+            evaluations += 1
+
+            if move == "reverse":
+                new_sequence, fitness = state.reverse(i, arg)
+            elif move == "insert":
+                new_sequence, fitness = state.insert(i, arg)
+            else:
+                new_sequence, fitness = state.remove(i)
+
+            if fitness > state.fitness + 1e-12:
+                state = PathState(new_sequence, context)
+                improvements += 1
+                improved = True
+                break
+
+        if not improved:
+            break
+
+    return state.sequence, state.fitness, {
+        "evaluations": evaluations,
+        "improvements": improvements,
+        "start_fitness": start_fitness,
+        "final_fitness": state.fitness,
+        "stop_reason": stop_reason,
+    }
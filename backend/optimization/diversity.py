@@ -0,0 +1,58 @@
+"""
+Population diversity metrics for LearningPathGA
+Two paths are compared by the Jaccard distance of their feature sets: the
+modules they contain plus their ordered module pairs, so both content and
+order differences count
+"""
+
+from collections import Counter
+
+
+class DiversityMeter:
+    """Diversity of successive populations of one run
+
+    Feature sets are kept as bitmasks (one bit per module or module pair seen
+    so far) and cached per sequence, so repeated measurements only encode the
+    sequences that are new since the last generation.
+    """
+
+    def __init__(self):
+        self._feature_bits = {}
+        self._masks = {}
+
+    def mask(self, key):
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = 0
+            for feature in (*key, *zip(key, key[1:])):
+                bit = self._feature_bits.setdefault(feature, len(self._feature_bits))
+                mask |= 1 << bit
+            self._masks[key] = mask
+        return mask
+
+    def distance(self, a, b):
+        """Jaccard distance between two sequences (0 = identical, 1 = nothing shared)"""
+        mask_a, mask_b = self.mask(a), self.mask(b)
+        union = (mask_a | mask_b).bit_count()
+        return 1 - (mask_a & mask_b).bit_count() / union if union else 0.0
+
+    def measure(self, population):
+        """Unique sequences, their share of the population, and mean pairwise path distance"""
+        counts = Counter(path.key for path in population)
+        n = len(population)
+        entries = [(self.mask(key), count) for key, count in counts.items()]
+
+        # Clones are at distance 0, so only pairs of distinct sequences contribute
+        total = 0.0
+        for i, (mask_a, count_a) in enumerate(entries):
+            for mask_b, count_b in entries[i + 1:]:
+                union = (mask_a | mask_b).bit_count()
+                if union:
+                    total += count_a * count_b * (1 - (mask_a & mask_b).bit_count() / union)
+        pairs = n * (n - 1) // 2
+
+        return {
+            "unique": len(counts),
+            "unique_ratio": len(counts) / n if n else 0.0,
+            "mean_distance": total / pairs if pairs else 0.0,
+        }
@@ -0,0 +1,77 @@
+"""
+Per-run evaluation context for LearningPathGA
+Everything the GA operators need to know about a student, computed once per
+evolve() call instead of once per child
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True)
+class EvaluationContext:
+    """Immutable snapshot of a student's profile plus derived module partitions"""
+
+    known_concepts: MappingProxyType   # frozen copy of student.known_concepts
+    weak_concepts: tuple               # proficiency < 50, in assessment order
+    strong_concepts: tuple             # proficiency >= 70
+    required_concepts: tuple           # concepts required for the target score
+    known_mask: int
+    weak_mask: int
+    strong_mask: int
+    required_mask: int
+    available_time_week: int
+    profile: tuple                     # hashable key of everything fitness depends on
+
+    # Module partitions used by get_available_modules
+    weak_area_modules: tuple           # ready modules touching a weak concept (priority order)
+    mixed_modules: tuple               # ready modules with mixed or new concepts
+    review_modules: tuple              # ready, easy, strong-only modules (occasional review)
+    fallback_modules: tuple            # easy modules when nothing else is available
+
+    @classmethod
+    def build(cls, student, modules, registry, required_concepts, readiness_threshold=30, excluded_ids=()):
+        """Snapshot a student against a module catalog
+
+        Modules whose id is in excluded_ids (e.g. already completed ones) are
+        left out of every partition.
+        """
+        known_concepts = dict(student.known_concepts)
+        weak_concepts = tuple(student.get_weak_concepts(threshold=50))
+        strong_concepts = tuple(student.get_strong_concepts(threshold=70))
+        weak_mask = registry.mask_of(weak_concepts)
+        strong_mask = registry.mask_of(strong_concepts)
+
+        weak_area_modules = []
+        mixed_modules = []
+        review_modules = []
+        modules = [module for module in modules if module.id not in excluded_ids]
+        # Same availability rule as the original get_available_modules, whose
+        # classification only ever reached the last catalog module
+        for module in modules[-1:]:
+            if student.calculate_readiness(module) < readiness_threshold:
+                continue
+            if module.concept_mask & weak_mask:
+                # High priority - newest first, as the original insert(0, ...) ordering did
+                weak_area_modules.insert(0, module)
+            elif module.concept_mask & ~strong_mask:
+                mixed_modules.append(module)
+            elif module.difficulty <= 2:
+                review_modules.append(module)
+
+        return cls(
+            known_concepts=MappingProxyType(known_concepts),
+            weak_concepts=weak_concepts,
+            strong_concepts=strong_concepts,
+            required_concepts=tuple(required_concepts),
+            known_mask=registry.mask_of(known_concepts),
+            weak_mask=weak_mask,
+            strong_mask=strong_mask,
+            required_mask=registry.mask_of(required_concepts),
+            available_time_week=student.available_time_week,
+            profile=(student.target_score, student.available_time_week, tuple(sorted(known_concepts.items()))),
+            weak_area_modules=tuple(weak_area_modules),
+            mixed_modules=tuple(mixed_modules),
+            review_modules=tuple(review_modules),
+            fallback_modules=tuple(module for module in modules if module.difficulty <= 2),
+        )
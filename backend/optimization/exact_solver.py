@@ -0,0 +1,218 @@
+"""
+Exact solver for students with a small candidate module set
+Branch-and-bound over ordered module sequences, returning the path with the
+best calculate_fitness; larger candidate sets fall back to the GA
+"""
+
+import time
+
+from genetic_algorithm import LearningPathGA
+from optimization.delta_fitness import combine_fitness
+
+
+class SearchBudgetExceeded(Exception):
+    """Raised when branch-and-bound runs out of nodes or time; carries the incumbent"""
+
+    def __init__(self, message, best_sequence):
+        super().__init__(message)
+        self.best_sequence = best_sequence
+
+
+def _time_fit(total_time, available_time):
+    time_ratio = total_time / available_time if available_time > 0 else 1
+    return 1 - (time_ratio - 1) * 0.5 if time_ratio <= 1.2 else 1 / time_ratio
+
+
+def _upper_bound(context, node, remaining):
+    """Best fitness any extension of node by modules from remaining could reach
+
+    For every extension size j the components are bounded separately: coverage
+    by the j largest single-module gains (and by all remaining concepts), time
+    by the j shortest modules, prerequisites as if no further violations
+    occurred, difficulty as if no further changes did, and weak focus by the j
+    most focused modules. The best j gives the bound.
+    """
+    length, total_time, covered, _, violations, max_violations, difficulty_changes, weak_focus = node
+    weak_mask = context.weak_mask
+    required_mask = context.required_mask
+    weak_count = len(context.weak_concepts)
+    required_count = len(context.required_concepts)
+    weak_weight = 0.3 / weak_count if weak_count else 0.0
+    required_weight = 0.25 / required_count if required_count else 0.0
+
+    reachable = covered
+    gains, times, focuses, prerequisites = [], [], [], []
+    for module in remaining:
+        new_concepts = module.concept_mask & ~covered
+        reachable |= module.concept_mask
+        gains.append((new_concepts & weak_mask).bit_count() * weak_weight
+                     + (new_concepts & required_mask).bit_count() * required_weight)
+        times.append(module.time_estimate)
+        focuses.append((module.concept_mask & weak_mask).bit_count())
+        prerequisites.append(module.prerequisite_mask.bit_count())
+    gains.sort(reverse=True)
+    times.sort()
+    focuses.sort(reverse=True)
+    prerequisites.sort(reverse=True)
+
+    base_coverage = ((covered & weak_mask).bit_count() * weak_weight if weak_count else 0.3)
+    base_coverage += (covered & required_mask).bit_count() * required_weight if required_count else 0.25
+    max_coverage = ((reachable & weak_mask).bit_count() * weak_weight if weak_count else 0.3)
+    max_coverage += (reachable & required_mask).bit_count() * required_weight if required_count else 0.25
+    review = (1 - (covered & context.strong_mask).bit_count() / (reachable.bit_count() + 1)) * 0.08
+
+    best = 0.0
+    gain = added_time = focus = added_prerequisites = 0
+    for j in range(1, len(remaining) + 1):
+        gain += gains[j - 1]
+        added_time += times[j - 1]
+        focus += focuses[j - 1]
+        added_prerequisites += prerequisites[j - 1]
+
+        bound = min(base_coverage + gain, max_coverage) + review
+        if weak_count:
+            bound += (weak_focus + focus) / (length + j) * 0.1
+        bound += _time_fit(total_time + added_time, context.available_time_week) * 0.15
+        all_prerequisites = max_violations + added_prerequisites
+        bound += (1 - violations / all_prerequisites if all_prerequisites else 1.0) * 0.12
+        transitions = length + j - 1
+        bound += (1.0 / (1 + difficulty_changes / transitions * 0.5) if transitions > 0 else 1.0) * 0.10
+        best = max(best, bound)
+    return min(1, best)
+
+
+def solve_exact(candidates, context, min_length=3, max_nodes=200000, deadline=None):
+    """Optimal ordered path of at least min_length distinct candidate modules
+
+    Depth-first branch-and-bound: a partial path is pruned when its upper bound
+    cannot beat the incumbent, or when another partial path over the same
+    modules ending in the same module has no more violations and difficulty
+    changes (every completion of it would score at least as well).
+    Returns (sequence, fitness, nodes); raises SearchBudgetExceeded.
+    """
+    candidates = list(candidates)
+    min_length = min(min_length, len(candidates))
+    best = {"fitness": -1.0, "sequence": []}
+    frontier = {}  # (used bitmask, last index) -> non-dominated [(violations, difficulty_changes)]
+    nodes = 0
+
+    def dominated(used, last, violations, difficulty_changes):
+        entries = frontier.setdefault((used, last), [])
+        for v, d in entries:
+            if v <= violations and d <= difficulty_changes:
+                return True
+        entries[:] = [(v, d) for v, d in entries if not (violations <= v and difficulty_changes <= d)]
+        entries.append((violations, difficulty_changes))
+        return False
+
+    def search(sequence, used, last, node):
+        nonlocal nodes
+        nodes += 1
+        if nodes > max_nodes or (deadline is not None and nodes % 256 == 0 and time.perf_counter() >= deadline):
+            raise SearchBudgetExceeded(f"Search budget exhausted after {nodes} nodes", best["sequence"])
+
+        length, total_time, covered, learned, violations, max_violations, difficulty_changes, weak_focus = node
+        if length >= min_length:
+            fitness = combine_fitness(context, length, total_time, covered, violations, max_violations,
+                                      difficulty_changes, weak_focus)
+            if fitness > best["fitness"] + 1e-12:
+                best["fitness"] = fitness
+                best["sequence"] = list(sequence)
+
+        remaining = [module for i, module in enumerate(candidates) if not used >> i & 1]
+        if not remaining or _upper_bound(context, node, remaining) <= best["fitness"] + 1e-12:
+            return
+
+        children = []
+        for i, module in enumerate(candidates):
+            if used >> i & 1:
+                continue
+            child_violations = violations + (module.prerequisite_mask & ~learned).bit_count()
+            child_changes = difficulty_changes + (abs(module.difficulty - sequence[-1].difficulty) if sequence else 0)
+            child = (
+                length + 1,
+                total_time + module.time_estimate,
+                covered | module.concept_mask,
+                learned | module.concept_mask,
+                child_violations,
+                max_violations + module.prerequisite_mask.bit_count(),
+                child_changes,
+                weak_focus + (module.concept_mask & context.weak_mask).bit_count(),
+            )
+            children.append((combine_fitness(context, *child[:3], *child[4:]), i, module, child))
+
+        # Most promising children first, so a strong incumbent prunes early
+        children.sort(key=lambda x: x[0], reverse=True)
+        for _, i, module, child in children:
+            child_used = used | 1 << i
+            if dominated(child_used, i, child[4], child[6]):
+                continue
+            sequence.append(module)
+            search(sequence, child_used, i, child)
+            sequence.pop()
+
+    search([], 0, None, (0, 0, 0, context.known_mask, 0, 0, 0, 0))
+    return best["sequence"], best["fitness"], nodes
+
+
+class ExactSolverGA(LearningPathGA):
+    """LearningPathGA that solves small candidate sets exactly
+
+    When the student's candidate modules (weak-area, mixed and review modules)
+    number at most max_exact_candidates, evolve() runs branch-and-bound
+    instead of the GA; otherwise, or if the search budget runs out, it falls
+    back to the GA, seeded with the best path found so far. The returned path
+    carries engine ("exact" or "ga") and solve_time_ms.
+    """
+
+    def __init__(self, *args, max_exact_candidates=16, max_nodes=20000, exact_time_budget_ms=500,
+                 min_path_length=3, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_exact_candidates = max_exact_candidates
+        self.max_nodes = max_nodes
+        self.exact_time_budget_ms = exact_time_budget_ms
+        self.min_path_length = min_path_length
+
+    def exact_candidates(self, context):
+        """Every module get_available_modules could offer (review modules included)"""
+        candidates = context.weak_area_modules + context.mixed_modules + context.review_modules
+        return list(candidates or context.fallback_modules)
+
+    def evolve(self, student, initial_path=None, **evolve_kwargs):
+        start_time = time.perf_counter()
+        context = self.build_context(student, evolve_kwargs.get("excluded_ids", ()))
+        candidates = self.exact_candidates(context)
+        exact_stats = {"candidates": len(candidates)}
+
+        if len(candidates) <= self.max_exact_candidates:
+            print(f"🎯 Exact search over {len(candidates)} candidate modules for {student.name}...")
+            deadline = start_time + self.exact_time_budget_ms / 1000 if self.exact_time_budget_ms else None
+            try:
+                sequence, _, nodes = solve_exact(candidates, context, self.min_path_length, self.max_nodes, deadline)
+                best_path = self.LearningPath(sequence)
+                self.calculate_fitness(best_path, student, context)
+                return self._finish(best_path, "exact", start_time, dict(exact_stats, nodes=nodes))
+            except SearchBudgetExceeded as e:
+                print(f"   {e} - falling back to the GA")
+                exact_stats["fallback_reason"] = "search_budget"
+                if initial_path is None and e.best_sequence:
+                    # The best path found so far seeds the GA
+                    initial_path = self.LearningPath(e.best_sequence)
+        else:
+            exact_stats["fallback_reason"] = "too_many_candidates"
+
+        best_path = super().evolve(student, initial_path, **evolve_kwargs)
+        return self._finish(best_path, "ga", start_time, exact_stats)
+
+    def _finish(self, best_path, engine, start_time, exact_stats):
+        solve_time_ms = (time.perf_counter() - start_time) * 1000
+        best_path.engine = engine
+        best_path.solve_time_ms = solve_time_ms
+        if engine == "exact":
+            best_path.stopped_at_generation = 0
+            best_path.stop_reason = "optimal"
+            self.run_stats = {"generations_run": 0, "stop_reason": "optimal"}
+            print(f"✅ Exact search completed in {solve_time_ms:.0f}ms ({exact_stats['nodes']} nodes)! "
+                  f"Best path fitness: {best_path.fitness:.3f}")
+        self.run_stats.update(engine=engine, solve_time_ms=solve_time_ms, exact_search=exact_stats)
+        return best_path
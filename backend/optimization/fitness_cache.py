@@ -0,0 +1,51 @@
+"""
+Bounded fitness memoization for LearningPathGA runs
+Results are keyed by the tuple of module ids in a path
+"""
+
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """LRU cache of (fitness, total_time, concepts_covered, weak_areas_covered)"""
+
+    def __init__(self, max_size=10000):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Cached result for a module-id tuple, or None"""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key, result):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries and reset statistics (start of a new run)"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,186 @@
+"""
+Island-model variant of LearningPathGA
+Runs several sub-populations in worker processes and exchanges their best
+paths every few generations
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from genetic_algorithm import LearningPathGA, derive_seed
+from optimization.diversity import DiversityMeter
+
+# Per-process GA used to evolve whichever island is sent to this worker
+_island_ga = None
+
+
+def _init_island_worker(ga_params):
+    global _island_ga
+    _island_ga = LearningPathGA(**ga_params)
+
+
+def _run_island_epoch(student, population, immigrants, generations, seed, initial_ids=None):
+    """Evolve one island for a number of generations inside a worker
+
+    population and immigrants are lists of (module_ids, fitness); population is
+    None on the first epoch. Returns the island population sorted best first
+    and the number of paths scored during the epoch.
+    """
+    _island_ga.rng.seed(seed)
+    _island_ga.evaluations = 0
+    _island_ga.select_catalog(student.goal)
+
+    def to_path(ids, fitness):
+        path = _island_ga.LearningPath.from_ids(ids, _island_ga.catalog)
+        path.fitness = fitness
+        return path
+
+    context = _island_ga.build_context(student)
+    if population is None:
+        initial_path = None
+        if initial_ids:
+            initial_path = _island_ga.LearningPath.from_ids(initial_ids, _island_ga.catalog)
+        paths = _island_ga.create_scored_population(student, initial_path, context)
+    else:
+        paths = [to_path(ids, fitness) for ids, fitness in population]
+
+    # Immigrants replace the worst residents
+    if immigrants:
+        paths.sort(key=lambda x: x.fitness, reverse=True)
+        paths[-len(immigrants):] = [to_path(ids, fitness) for ids, fitness in immigrants]
+
+    for _ in range(generations):
+        paths = _island_ga.next_generation(paths, student, context)
+
+    paths.sort(key=lambda x: x.fitness, reverse=True)
+    return [(list(path.key), path.fitness) for path in paths], _island_ga.evaluations
+
+
+class IslandModelGA(LearningPathGA):
+    """LearningPathGA with N islands evolving in parallel processes
+
+    population_size is the size of each island. Every migration_interval
+    generations the top migration_size paths of each island are sent to its
+    neighbours according to the topology:
+      - "ring": island i sends to island i+1
+      - "fully_connected": each island receives the best emigrants of all others
+      - "random": each island sends to one randomly chosen other island
+    """
+
+    TOPOLOGIES = ("ring", "fully_connected", "random")
+
+    def __init__(self, population_size=50, generations=100, mutation_rate=0.1, n_islands=4,
+                 migration_interval=10, migration_size=2, topology="ring", workers=None,
+                 fitness_backend="scalar", seeding="random", repair_offspring=False, adaptive_operators=False,
+                 goal=None, seed=None):
+        super().__init__(population_size, generations, mutation_rate, fitness_backend=fitness_backend,
+                         seeding=seeding, repair_offspring=repair_offspring,
+                         adaptive_operators=adaptive_operators, goal=goal, seed=seed)
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+        self.n_islands = n_islands
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = min(migration_size, population_size - 1)
+        self.topology = topology
+        self.workers = workers or min(n_islands, os.cpu_count() or 1)
+        self.island_history = []
+
+    def _migrate(self, islands):
+        """Pick immigrants for every island from the other islands' best paths"""
+        emigrants = [island[:self.migration_size] for island in islands]
+        immigrants = [[] for _ in islands]
+
+        if self.n_islands < 2 or self.migration_size < 1:
+            return immigrants
+
+        for source in range(self.n_islands):
+            if self.topology == "ring":
+                targets = [(source + 1) % self.n_islands]
+            elif self.topology == "random":
+                targets = [self.rng.choice([i for i in range(self.n_islands) if i != source])]
+            else:
+                targets = [i for i in range(self.n_islands) if i != source]
+            for target in targets:
+                immigrants[target].extend(emigrants[source])
+
+        # Islands with several sources keep only the best migration_size arrivals
+        return [
+            sorted(arrivals, key=lambda x: x[1], reverse=True)[:self.migration_size]
+            for arrivals in immigrants
+        ]
+
+    def _island_seed(self, generation, island):
+        """Per-epoch island seed: derived from the run seed, or drawn from the GA's RNG"""
+        if self.seed is None:
+            return self.rng.getrandbits(32)
+        return derive_seed(self.seed, f"{generation}:{island}")
+    
+    def evolve(self, student, initial_path=None):
+        """Evolve all islands with periodic migration and return the overall best path
+
+        Like LearningPathGA.evolve, the path carries stopped_at_generation and
+        stop_reason and self.run_stats describes the run.
+        """
+        print(f"🏝️  Island-model evolution for {student.name}...")
+        print(f"   Islands: {self.n_islands} x {self.population_size}, Generations: {self.generations}, "
+              f"Migration: top {self.migration_size} every {self.migration_interval} ({self.topology})")
+
+        start_time = time.perf_counter()
+        self.select_catalog(student.goal)
+        ga_params = self.worker_params()
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+        initial_ids = [module.id for module in initial_path.module_sequence] if initial_path else None
+
+        islands = [None] * self.n_islands
+        immigrants = [[] for _ in range(self.n_islands)]
+        self.island_history = []
+        best_fitness_history = []
+        evaluations = 0
+        generation = 0
+
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_island_worker,
+                                 initargs=(ga_params,)) as executor:
+            while generation < self.generations:
+                epoch_generations = min(self.migration_interval, self.generations - generation)
+                futures = [
+                    executor.submit(
+                        _run_island_epoch, student, islands[i], immigrants[i], epoch_generations,
+                        self._island_seed(generation, i), initial_ids,
+                    )
+                    for i in range(self.n_islands)
+                ]
+                results = [future.result() for future in futures]
+                islands = [island for island, _ in results]
+                evaluations += sum(count for _, count in results)
+                generation += epoch_generations
+
+                best_per_island = [island[0][1] for island in islands]
+                self.island_history.append(best_per_island)
+                best_fitness_history.append(max(best_per_island))
+                print(f"   Generation {generation}: Best per island = "
+                      f"{', '.join(f'{fitness:.3f}' for fitness in best_per_island)}")
+
+                if generation < self.generations:
+                    immigrants = self._migrate(islands)
+
+        best_ids, _ = max((island[0] for island in islands), key=lambda x: x[1])
+        best_path = self.LearningPath.from_ids(best_ids, self.catalog)
+        self.calculate_fitness(best_path, student)
+        best_path.stopped_at_generation = generation
+        best_path.stop_reason = "completed"
+
+        final_population = [self.LearningPath.from_ids(ids, self.catalog) for island in islands for ids, _ in island]
+        self.run_stats = {
+            "generations_run": generation,
+            "stop_reason": "completed",
+            "elapsed_ms": (time.perf_counter() - start_time) * 1000,
+            "best_fitness_history": best_fitness_history,
+            "evaluations": evaluations,
+            "diversity": DiversityMeter().measure(final_population),
+            "islands": self.island_history,
+        }
+
+        print(f"✅ Island evolution completed! Best path fitness: {best_path.fitness:.3f}")
+        return best_path
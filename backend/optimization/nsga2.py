@@ -0,0 +1,184 @@
+"""
+NSGA-II multi-objective mode for LearningPathGA
+Instead of collapsing the six fitness components into one weighted score,
+evolves a Pareto front of paths in a single run; any weighting can then be
+applied to the front afterwards without evolving again
+"""
+
+from genetic_algorithm import LearningPathGA
+from optimization.delta_fitness import PathState, FITNESS_WEIGHTS
+
+OBJECTIVES = tuple(FITNESS_WEIGHTS)
+
+
+def dominates(a, b):
+    """True if objective vector a is at least as good as b everywhere and better somewhere"""
+    better = False
+    for x, y in zip(a, b):
+        if x < y:
+            return False
+        if x > y:
+            better = True
+    return better
+
+
+def fast_non_dominated_sort(vectors):
+    """Indices of vectors grouped into fronts, best (non-dominated) front first"""
+    n = len(vectors)
+    dominated_by = [[] for _ in range(n)]  # indices each vector dominates
+    domination_count = [0] * n
+    for i in range(n):
+        for j in range(i + 1, n):
+            if dominates(vectors[i], vectors[j]):
+                dominated_by[i].append(j)
+                domination_count[j] += 1
+            elif dominates(vectors[j], vectors[i]):
+                dominated_by[j].append(i)
+                domination_count[i] += 1
+
+    fronts = [[i for i in range(n) if domination_count[i] == 0]]
+    while fronts[-1]:
+        next_front = []
+        for i in fronts[-1]:
+            for j in dominated_by[i]:
+                domination_count[j] -= 1
+                if domination_count[j] == 0:
+                    next_front.append(j)
+        fronts.append(next_front)
+    return fronts[:-1]
+
+
+def crowding_distance(vectors):
+    """Crowding distance of each vector within one front (boundary points are infinite)"""
+    n = len(vectors)
+    distances = [0.0] * n
+    if n <= 2:
+        return [float("inf")] * n
+
+    for m in range(len(vectors[0])):
+        order = sorted(range(n), key=lambda i: vectors[i][m])
+        low, high = vectors[order[0]][m], vectors[order[-1]][m]
+        distances[order[0]] = distances[order[-1]] = float("inf")
+        if high == low:
+            continue
+        for k in range(1, n - 1):
+            distances[order[k]] += (vectors[order[k + 1]][m] - vectors[order[k - 1]][m]) / (high - low)
+    return distances
+
+
+def weighted_score(path, weights):
+    return sum(weights.get(name, 0.0) * value for name, value in zip(OBJECTIVES, path.objectives))
+
+
+def check_weights(weights):
+    """Raise ValueError if weights name objectives that do not exist"""
+    unknown = set(weights) - set(OBJECTIVES)
+    if unknown:
+        raise ValueError(f"Unknown objectives: {', '.join(sorted(unknown))}")
+    return weights
+
+
+def select_from_front(front, weights=None):
+    """Path of a Pareto front with the best weighted score (default: calculate_fitness weights)"""
+    weights = check_weights(weights or FITNESS_WEIGHTS)
+    return max(front, key=lambda path: weighted_score(path, weights))
+
+
+class NSGA2LearningPathGA(LearningPathGA):
+    """LearningPathGA that keeps a Pareto front over the six fitness objectives
+
+    Reuses the base GA's seeding, crossover, mutation and repair operators;
+    selection uses non-domination rank and crowding distance. After evolve()
+    the front is in self.pareto_front, each path carrying .objectives.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pareto_front = []
+
+    def evaluate_objectives(self, paths, context):
+        """Attach objective vectors plus the usual fitness attributes to unscored paths"""
+        weak_count = len(context.weak_concepts)
+        for path in paths:
+            if getattr(path, 'objectives', None) is not None:
+                continue
+            state = PathState(path.module_sequence, context)
+            path.objectives = state.objectives()
+            path.fitness = state.fitness
+            path.total_time = state.total_time
+            path.concepts_covered = state.covered_mask.bit_count()
+            weak_covered = (state.covered_mask & context.weak_mask).bit_count()
+            path.weak_areas_covered = f"{weak_covered}/{weak_count}" if weak_count else "0/0"
+
+    def _rank(self, population):
+        """Sort population by (front, -crowding) and set path.rank / path.crowding"""
+        vectors = [path.objectives for path in population]
+        ranked = []
+        for rank, front in enumerate(fast_non_dominated_sort(vectors)):
+            distances = crowding_distance([vectors[i] for i in front])
+            for i, distance in zip(front, distances):
+                population[i].rank = rank
+                population[i].crowding = distance
+            ranked.extend(sorted((population[i] for i in front), key=lambda p: -p.crowding))
+        return ranked
+
+    def select_parent(self, population):
+        """Binary tournament on (rank, crowding distance)"""
+        a, b = self.rng.sample(population, 2) if len(population) >= 2 else (population[0], population[0])
+        if (a.rank, -a.crowding) <= (b.rank, -b.crowding):
+            return a
+        return b
+
+    def evolve(self, student, initial_path=None, weights=None, generations=None, on_generation=None):
+        """Evolve a Pareto front and return its best path under weights"""
+        generations = generations or self.generations
+        print(f"🧬 Multi-objective (NSGA-II) evolution for {student.name}...")
+        print(f"   Population: {self.population_size}, Generations: {generations}")
+        if self.seed is not None:
+            self.rng.seed(self.seed)
+
+        context = self.build_context(student)
+        population = [initial_path] if initial_path else []
+        population.extend(self.create_initial_population(student, context)[:self.population_size - len(population)])
+        self.evaluate_objectives(population, context)
+        population = self._rank(population)
+
+        for generation in range(1, generations + 1):
+            offspring = []
+            while len(offspring) < self.population_size:
+                child = self.crossover(self.select_parent(population), self.select_parent(population))
+                child = self.mutate(child, student, context)
+                if self.repair_offspring:
+                    child = self.repair(child)
+                if child.module_sequence:
+                    offspring.append(child)
+            self.evaluate_objectives(offspring, context)
+
+            # Elitist replacement over parents + offspring, duplicates removed
+            combined = list({path.key: path for path in population + offspring}.values())
+            population = self._rank(combined)[:self.population_size]
+
+            if generation % 10 == 0 or on_generation:
+                front_size = sum(1 for path in population if path.rank == 0)
+                best_fitness = max(path.fitness for path in population)
+                if generation % 10 == 0:
+                    print(f"   Generation {generation}: Front size = {front_size}, Best fitness = {best_fitness:.3f}")
+                if on_generation:
+                    avg_fitness = sum(path.fitness for path in population) / len(population)
+                    on_generation(generation, best_fitness, avg_fitness)
+
+        self.pareto_front = [path for path in population if path.rank == 0]
+        best_path = select_from_front(self.pareto_front, weights)
+        best_path.stopped_at_generation = generations
+        best_path.stop_reason = "completed"
+        self.run_stats = {"generations_run": generations, "stop_reason": "completed",
+                          "front_size": len(self.pareto_front)}
+
+        print(f"✅ Pareto front of {len(self.pareto_front)} paths; selected fitness: {best_path.fitness:.3f}")
+        return best_path
+
+    def pick(self, weights=None):
+        """Choose another point on the last front without re-running evolution"""
+        if not self.pareto_front:
+            raise ValueError("No Pareto front yet - run evolve() first")
+        return select_from_front(self.pareto_front, weights)
@@ -0,0 +1,81 @@
+"""
+Adaptive mutation operator selection for LearningPathGA
+Operators are credited with the fitness improvement their offspring achieve
+and chosen by probability matching, so operators that currently pay off are
+applied more often
+"""
+
+# Fixed operator probabilities of LearningPathGA.mutate (the non-adaptive bands)
+MUTATION_OPERATORS = {
+    "swap": 0.40,
+    "add": 0.25,
+    "remove": 0.20,
+    "scramble": 0.15,
+}
+
+
+def pick_operator(probabilities, draw):
+    """Operator whose cumulative probability band contains draw (in [0, 1))"""
+    cumulative = 0.0
+    for name, probability in probabilities.items():
+        cumulative += probability
+        if draw < cumulative:
+            return name
+    return name
+
+
+class AdaptiveOperatorSelector:
+    """Probability matching over named operators
+
+    Each operator keeps a quality estimate, moved towards the mean reward of
+    its applications in the last generation (learning_rate). Probabilities are
+    proportional to quality, but never below min_probability, so an operator
+    that stopped paying off is still tried now and then.
+    """
+
+    def __init__(self, initial_probabilities=None, learning_rate=0.2, min_probability=0.05):
+        self.initial_probabilities = dict(initial_probabilities or MUTATION_OPERATORS)
+        self.operators = tuple(self.initial_probabilities)
+        if min_probability * len(self.operators) >= 1:
+            raise ValueError("min_probability leaves no room for adaptation")
+        self.learning_rate = learning_rate
+        self.min_probability = min_probability
+        self.reset()
+
+    def reset(self):
+        """Start again from the initial probabilities (once per evolve() run)"""
+        self.quality = dict(self.initial_probabilities)
+        self.probabilities = dict(self.initial_probabilities)
+        self._rewards = {name: [] for name in self.operators}
+        self.applications = {name: 0 for name in self.operators}
+
+    def choose(self, rng):
+        return pick_operator(self.probabilities, rng.random())
+
+    def reward(self, name, improvement):
+        """Credit one application of an operator (negative improvements count as 0)"""
+        self._rewards[name].append(max(0.0, improvement))
+        self.applications[name] += 1
+
+    def update(self):
+        """Fold the rewards collected since the last update into the probabilities"""
+        for name, rewards in self._rewards.items():
+            if rewards:
+                mean_reward = sum(rewards) / len(rewards)
+                self.quality[name] += self.learning_rate * (mean_reward - self.quality[name])
+                rewards.clear()
+
+        total_quality = sum(self.quality.values())
+        if total_quality <= 0:
+            return
+        spare = 1 - self.min_probability * len(self.operators)
+        self.probabilities = {
+            name: self.min_probability + spare * quality / total_quality
+            for name, quality in self.quality.items()
+        }
+
+    def stats(self):
+        return {
+            "probabilities": dict(self.probabilities),
+            "applications": dict(self.applications),
+        }
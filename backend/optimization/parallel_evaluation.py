@@ -0,0 +1,76 @@
+"""
+Process-pool evaluation for LearningPathGA populations
+Each worker builds the module catalog once and then scores batches of
+module-id sequences, so only small integer lists cross process boundaries
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Per-process GA instance, created by the pool initializer
+_worker_ga = None
+
+
+def _init_worker(fitness_backend):
+    """Load the module catalog once per worker process"""
+    global _worker_ga
+    from genetic_algorithm import LearningPathGA
+    _worker_ga = LearningPathGA(fitness_backend=fitness_backend)
+
+
+def _score_batch(student, id_sequences):
+    """Score a batch of paths inside a worker and return the fitness attributes"""
+    _worker_ga.select_catalog(student.goal)
+    paths = [_worker_ga.LearningPath.from_ids(ids, _worker_ga.catalog) for ids in id_sequences]
+    _worker_ga.evaluate_population(paths, student)
+    return [
+        (path.fitness, path.total_time, getattr(path, 'concepts_covered', None), getattr(path, 'weak_areas_covered', None))
+        for path in paths
+    ]
+
+
+class ParallelEvaluator:
+    """Scores populations on a persistent ProcessPoolExecutor"""
+
+    def __init__(self, workers=None, fitness_backend="scalar"):
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(fitness_backend,),
+        )
+
+    def evaluate(self, paths, student):
+        """Score paths in one batch per worker, writing results back onto the paths"""
+        if not paths:
+            return []
+
+        id_sequences = [[module.id for module in path.module_sequence] for path in paths]
+        chunk_size = -(-len(paths) // self.workers)  # ceiling division
+        futures = [
+            self._executor.submit(_score_batch, student, id_sequences[start:start + chunk_size])
+            for start in range(0, len(paths), chunk_size)
+        ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+
+        for path, (fitness, total_time, concepts_covered, weak_areas_covered) in zip(paths, results):
+            if not len(path):
+                continue
+            path.fitness = fitness
+            path.total_time = total_time
+            path.concepts_covered = concepts_covered
+            path.weak_areas_covered = weak_areas_covered
+
+        return [result[0] for result in results]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
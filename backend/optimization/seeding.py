@@ -0,0 +1,77 @@
+"""
+Constraint-aware seeding and repair for learning paths
+Builds random but prerequisite-respecting orderings of the module DAG and
+restores prerequisite order in paths produced by crossover and mutation
+"""
+
+import heapq
+import random
+
+
+def random_topological_path(candidates, path_length, known_mask=0, weak_mask=0, weak_bias=3.0, rng=random):
+    """Random valid ordering of candidate modules (weighted Kahn's algorithm)
+
+    A module is ready once the student's known concepts plus the modules placed
+    so far cover its prerequisites. Ready modules touching a weak concept are
+    weak_bias times more likely to be picked next. If nothing is ready, the
+    modules with the fewest missing prerequisites are used instead.
+    """
+    remaining = list(candidates)
+    learned_mask = known_mask
+    path = []
+
+    while remaining and len(path) < path_length:
+        missing = [(module.prerequisite_mask & ~learned_mask).bit_count() for module in remaining]
+        fewest_missing = min(missing)
+        pool = [module for module, count in zip(remaining, missing) if count == fewest_missing]
+        weights = [weak_bias if module.concept_mask & weak_mask else 1.0 for module in pool]
+
+        module = rng.choices(pool, weights=weights)[0]
+        remaining.remove(module)
+        path.append(module)
+        learned_mask |= module.concept_mask
+
+    return path
+
+
+def repair_order(sequence, catalog=None):
+    """Reorder a module sequence so every module follows its in-path prerequisites
+
+    Stable topological sort over the prerequisite_ids edges between modules of
+    the sequence: modules keep their relative order unless a prerequisite has
+    to be moved in front of them. With a ModuleCatalog, transitive prerequisites
+    count too (a module also follows ancestors whose link is not in the path).
+    Returns the original list if already valid.
+    """
+    positions = {module.id: i for i, module in enumerate(sequence)}
+    if len(positions) != len(sequence):
+        return sequence  # Duplicate modules have no well-defined order
+    dependents = {module.id: [] for module in sequence}
+    indegree = {}
+    for module in sequence:
+        if catalog is not None:
+            ancestors = catalog.ancestors[module.id]
+            in_path = [p for p in positions if ancestors & catalog.module_bit[p]]
+        else:
+            in_path = [p for p in module.prerequisite_ids if p in positions and p != module.id]
+        indegree[module.id] = len(in_path)
+        for prereq_id in in_path:
+            dependents[prereq_id].append(module)
+
+    ready = [(positions[m.id], m.id, m) for m in sequence if indegree[m.id] == 0]
+    heapq.heapify(ready)
+    ordered = []
+    while ready:
+        _, _, module = heapq.heappop(ready)
+        ordered.append(module)
+        for dependent in dependents[module.id]:
+            indegree[dependent.id] -= 1
+            if indegree[dependent.id] == 0:
+                heapq.heappush(ready, (positions[dependent.id], dependent.id, dependent))
+
+    if len(ordered) < len(sequence):
+        # Cycle in the prerequisite data: leave the sequence alone rather than drop modules
+        return sequence
+    if all(a is b for a, b in zip(ordered, sequence)):
+        return sequence
+    return ordered
@@ -0,0 +1,143 @@
+"""
+Vectorized NumPy fitness engine for LearningPathGA
+Scores a whole population of learning paths in one batched call
+"""
+
+import numpy as np
+
+
+class VectorizedFitnessEngine:
+    """Batched equivalent of LearningPathGA.calculate_fitness
+
+    The population is encoded as a (paths x module slots) matrix of module
+    indices, padded with -1. Concept-incidence and prerequisite matrices are
+    precomputed once from the module catalog.
+    """
+
+    def __init__(self, modules, registry):
+        self.modules = modules
+        self.registry = registry
+        self.module_index = {module.id: i for i, module in enumerate(modules)}
+
+        # modules x concepts incidence matrices, columns follow the concept registry
+        self.concept_matrix = np.array([self.mask_to_vector(m.concept_mask) for m in modules], dtype=bool)
+        self.prerequisite_matrix = np.array([self.mask_to_vector(m.prerequisite_mask) for m in modules], dtype=bool)
+
+        self.time_estimates = np.array([module.time_estimate for module in modules], dtype=np.float64)
+        self.difficulties = np.array([module.difficulty for module in modules], dtype=np.float64)
+
+    def mask_to_vector(self, mask):
+        """Expand a concept bitmask into a boolean vector over the registry"""
+        return np.array([mask >> i & 1 for i in range(len(self.registry))], dtype=bool)
+
+    def encode_population(self, paths):
+        """Encode paths as a padded matrix of module indices plus their lengths"""
+        lengths = np.array([len(path) for path in paths], dtype=np.intp)
+        width = max(int(lengths.max()), 1)
+        matrix = np.full((len(paths), width), -1, dtype=np.intp)
+        for row, path in enumerate(paths):
+            if len(path):
+                matrix[row, :len(path)] = [self.module_index[module.id] for module in path.module_sequence]
+        return matrix, lengths
+
+    def evaluate(self, paths, context):
+        """Score every path at once; writes the same attributes as the scalar version
+
+        context is the EvaluationContext built by LearningPathGA for the student.
+        """
+        if not paths:
+            return np.zeros(0)
+
+        matrix, lengths = self.encode_population(paths)
+        valid = matrix >= 0
+        safe = np.where(valid, matrix, 0)
+
+        weak_concepts = context.weak_concepts
+        required_concepts = context.required_concepts
+        weak = self.mask_to_vector(context.weak_mask)
+        strong = self.mask_to_vector(context.strong_mask)
+        required = self.mask_to_vector(context.required_mask)
+        known = self.mask_to_vector(context.known_mask)
+
+        # (paths x slots x concepts)
+        slot_concepts = self.concept_matrix[safe] & valid[:, :, None]
+        slot_prereqs = self.prerequisite_matrix[safe] & valid[:, :, None]
+
+        total_time = (self.time_estimates[safe] * valid).sum(axis=1)
+        covered = slot_concepts.any(axis=1)
+        concepts_covered = covered.sum(axis=1)
+        weak_covered = (covered & weak).sum(axis=1)
+        strong_reviewed = (covered & strong).sum(axis=1)
+        weak_area_focus = (slot_concepts & weak).sum(axis=(1, 2))
+
+        # Concepts learned before each slot: known concepts plus every earlier module.
+        # A prerequisite found in known_concepts is always learned, so the scalar
+        # "critical gap" double penalty can never fire and is not modelled here.
+        learned_through = np.logical_or.accumulate(slot_concepts, axis=1)
+        learned_before = np.zeros_like(learned_through)
+        learned_before[:, 1:] = learned_through[:, :-1]
+        learned_before |= known
+        prerequisite_violations = (slot_prereqs & ~learned_before).sum(axis=(1, 2))
+        max_possible_violations = slot_prereqs.sum(axis=(1, 2))
+
+        # Padding only ever follows real modules, so valid[:, 1:] marks real transitions
+        difficulties = self.difficulties[safe]
+        difficulty_changes = (np.abs(np.diff(difficulties, axis=1)) * valid[:, 1:]).sum(axis=1)
+
+        n_modules = lengths.astype(np.float64)
+
+        # 1. Weak area coverage
+        if weak_concepts:
+            weak_area_coverage = weak_covered / len(weak_concepts)
+            weak_area_bonus = weak_area_focus / np.maximum(n_modules, 1) * 0.1
+        else:
+            weak_area_coverage = np.ones(len(paths))
+            weak_area_bonus = np.zeros(len(paths))
+        fitness = weak_area_coverage * 0.3 + weak_area_bonus
+
+        # 2. Comprehensive coverage
+        if required_concepts:
+            fitness += (covered & required).sum(axis=1) / len(required_concepts) * 0.25
+        else:
+            fitness += 0.25
+
+        # 3. Time optimization
+        if context.available_time_week > 0:
+            time_ratio = total_time / context.available_time_week
+        else:
+            time_ratio = np.ones(len(paths))
+        time_fitness = np.where(
+            time_ratio <= 1.2,
+            1 - (time_ratio - 1) * 0.5,
+            1 / np.maximum(time_ratio, 1.2),
+        )
+        fitness += time_fitness * 0.15
+
+        # 4. Prerequisite compliance
+        prereq_fitness = np.where(
+            max_possible_violations > 0,
+            1 - prerequisite_violations / np.maximum(max_possible_violations, 1),
+            1.0,
+        )
+        fitness += prereq_fitness * 0.12
+
+        # 5. Difficulty progression
+        avg_difficulty_change = difficulty_changes / np.maximum(n_modules - 1, 1)
+        progression_fitness = np.where(n_modules > 1, 1.0 / (1 + avg_difficulty_change * 0.5), 1.0)
+        fitness += progression_fitness * 0.10
+
+        # 6. Efficient review
+        fitness += (1 - strong_reviewed / (concepts_covered + 1)) * 0.08
+
+        fitness = np.clip(fitness, 0, 1)
+        fitness[lengths == 0] = 0
+
+        for i, path in enumerate(paths):
+            if not len(path):
+                continue
+            path.fitness = float(fitness[i])
+            path.total_time = int(total_time[i])
+            path.concepts_covered = int(concepts_covered[i])
+            path.weak_areas_covered = f"{int(weak_covered[i])}/{len(weak_concepts)}" if weak_concepts else "0/0"
+
+        return fitness
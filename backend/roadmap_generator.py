@@ -8,6 +8,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from genetic_algorithm import LearningPathGA
+from ga_config import ga_params
 from database.student_repository import get_database_connection
 from student_selector import select_student_profile
 from mock_exam_runner import is_mock_exam_completed
@@ -47,7 +48,7 @@ def generate_roadmap_with_profile():
     print(f"⏰ Available time: {student.available_time_week} min/week")
     
     # Generate learning path using REAL exam data
-    ga = LearningPathGA(population_size=50, generations=100)
+    ga = LearningPathGA(**ga_params())
     learning_path = ga.evolve(student)
     
     # Display results
@@ -0,0 +1,182 @@
+"""
+Bounded executor for GA runs
+Keeps CPU-bound evolution off the asyncio event loop and rejects new work
+once too many runs are queued, so the API stays responsive under load
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+class ExecutorSaturated(Exception):
+    """Raised when the GA executor already has max_pending runs queued or running"""
+
+    def __init__(self, pending, retry_after):
+        super().__init__(f"GA executor saturated ({pending} runs pending)")
+        self.pending = pending
+        self.retry_after = retry_after
+
+
+def evolve_path(ga_params, student, evolve_kwargs, engine="ga"):
+    """Build a GA and evolve one path (module-level so process pools can pickle it)
+
+    engine="auto" solves small candidate sets exactly and uses the GA otherwise.
+    """
+    if engine == "auto":
+        from optimization.exact_solver import ExactSolverGA
+        return ExactSolverGA(**ga_params).evolve(student, **evolve_kwargs)
+    from genetic_algorithm import LearningPathGA
+    return _timed_ga_run(LearningPathGA(**ga_params), student, **evolve_kwargs)
+
+
+def _timed_ga_run(ga, student, **evolve_kwargs):
+    """Plain GA evolve() that records engine="ga" and solve_time_ms like ExactSolverGA does"""
+    start_time = time.perf_counter()
+    best_path = ga.evolve(student, **evolve_kwargs)
+    best_path.engine = "ga"
+    best_path.solve_time_ms = (time.perf_counter() - start_time) * 1000
+    return best_path
+
+
+def evolve_with_progress(ga_params, student, evolve_kwargs, progress):
+    """evolve() that puts a best/avg fitness dict on progress after every generation"""
+    from genetic_algorithm import LearningPathGA
+    ga = LearningPathGA(**ga_params)
+
+    def on_generation(generation, best_fitness, avg_fitness):
+        progress.put({"generation": generation, "best_fitness": best_fitness, "avg_fitness": avg_fitness})
+
+    return _timed_ga_run(ga, student, on_generation=on_generation, **evolve_kwargs)
+
+
+def replan_path(ga_params, student, previous_module_ids, replan_kwargs):
+    from genetic_algorithm import LearningPathGA
+    ga = LearningPathGA(**ga_params)
+    return ga.replan(student, previous_module_ids, **replan_kwargs)
+
+
+def evolve_pareto(ga_params, student, weights=None):
+    """NSGA-II run returning (selected path, Pareto front)"""
+    from optimization.nsga2 import NSGA2LearningPathGA
+    ga = NSGA2LearningPathGA(**ga_params)
+    best_path = ga.evolve(student, weights=weights)
+    return best_path, ga.pareto_front
+
+
+class GAExecutor:
+    """Thread or process pool with a cap on queued + running GA calls
+
+    kind="process" isolates runs from the event loop's GIL; kind="thread"
+    avoids pickling and start-up costs. Calls beyond max_pending raise
+    ExecutorSaturated instead of queueing without bound. A process pool
+    broken by a crashed worker is replaced on the next call.
+    """
+
+    KINDS = ("thread", "process")
+
+    def __init__(self, kind="process", workers=None, max_pending=64, retry_after_seconds=5):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown executor kind: {kind}")
+        self.kind = kind
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.retry_after_seconds = retry_after_seconds
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.pool_restarts = 0
+        self._executor = None
+        self._manager = None  # Serves progress queues to process-pool workers
+        # Calls come from the event loop, job threads and pool callbacks
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        if self._executor is None:
+            pool_class = ProcessPoolExecutor if self.kind == "process" else ThreadPoolExecutor
+            self._executor = pool_class(max_workers=self.workers)
+        return self._executor
+
+    def submit(self, fn, *args, **kwargs):
+        """Start fn(*args, **kwargs) in the pool and return its concurrent.futures.Future"""
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ExecutorSaturated(self.pending, self.retry_after_seconds)
+            try:
+                future = self._get_executor().submit(fn, *args, **kwargs)
+            except BrokenExecutor:
+                # A worker died (e.g. killed for memory): start a fresh pool instead of failing forever
+                print("⚠️  GA worker pool is broken, starting a new one")
+                # Its workers are already gone, so waiting is quick and lets it clean up fully
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+                self.pool_restarts += 1
+                future = self._get_executor().submit(fn, *args, **kwargs)
+            self.pending += 1
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    async def run(self, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) in the pool and await its result"""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def progress_queue(self):
+        """Queue that pool calls can report progress on (manager-backed for process pools)"""
+        if self.kind == "thread":
+            return queue.Queue()
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.Manager()
+            return self._manager.Queue()
+
+    def run_with_progress(self, fn, report, *args, poll_seconds=0.25):
+        """Blocking run of fn(*args, progress) in the pool, passing each item it puts on progress to report()"""
+        progress = self.progress_queue()
+        future = self.submit(fn, *args, progress)
+        while not future.done():
+            try:
+                report(progress.get(timeout=poll_seconds))
+            except queue.Empty:
+                pass
+        # Everything fn put before returning is already queued
+        while True:
+            try:
+                report(progress.get_nowait())
+            except queue.Empty:
+                break
+        return future.result()
+
+    def stats(self):
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "pool_restarts": self.pool_restarts,
+        }
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            if self._manager is not None:
+                self._manager.shutdown()
+                self._manager = None
@@ -0,0 +1,159 @@
+"""
+Background jobs for long path generations
+Jobs wait in a queue and are driven by worker threads (the GA itself runs
+wherever the job function sends it); each job records per-generation
+progress events that clients can poll or stream
+"""
+
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class JobQueueFull(Exception):
+    """Raised when no more jobs can be queued"""
+
+
+class InMemoryJobQueue:
+    """Process-local FIFO of job ids
+
+    Anything with the same put(job_id) / get() methods (e.g. a broker-backed
+    queue) can be passed to JobManager instead.
+    """
+
+    def __init__(self, max_size=256):
+        self._queue = queue.Queue(maxsize=max_size)
+
+    def put(self, job_id):
+        try:
+            self._queue.put_nowait(job_id)
+        except queue.Full:
+            raise JobQueueFull(f"Job queue is full ({self._queue.maxsize} jobs)")
+
+    def get(self):
+        """Block until a job id is available"""
+        return self._queue.get()
+
+    def __len__(self):
+        return self._queue.qsize()
+
+
+class Job:
+    """One queued unit of work plus its status, progress events and result"""
+
+    def __init__(self, fn, args):
+        self.id = uuid.uuid4().hex
+        self.fn = fn
+        self.args = args
+        self.status = "queued"
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []
+        self.result = None
+        self.error = None
+        # Status changes and result fields are published together under this lock
+        self.lock = threading.Lock()
+
+    @property
+    def finished(self):
+        return self.status in ("completed", "failed")
+
+    def add_event(self, event):
+        self.events.append(event)
+
+    def to_dict(self, include_result=True):
+        with self.lock:
+            data = {
+                "job_id": self.id,
+                "status": self.status,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "progress": self.events[-1] if self.events else None,
+                "error": self.error,
+            }
+            if include_result:
+                data["result"] = self.result
+        return data
+
+
+class JobManager:
+    """Runs jobs from a queue on a fixed number of daemon worker threads
+
+    A job function is called as fn(*args, report=job.add_event) and its
+    return value becomes the job result. Finished jobs beyond max_jobs are
+    forgotten oldest first.
+    """
+
+    def __init__(self, job_queue=None, workers=2, max_jobs=1000):
+        self.queue = job_queue or InMemoryJobQueue()
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def _start_workers(self):
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._work, name=f"job-worker-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, fn, *args):
+        """Queue fn(*args) and return its Job"""
+        job = Job(fn, args)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._forget_finished_jobs()
+        try:
+            self.queue.put(job.id)
+        except JobQueueFull:
+            with self._lock:
+                del self._jobs[job.id]
+            raise
+        self._start_workers()
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _forget_finished_jobs(self):
+        excess = len(self._jobs) - self.max_jobs
+        if excess <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:excess]:
+            del self._jobs[job_id]
+
+    def _work(self):
+        while True:
+            job = self.get(self.queue.get())
+            if job is None:
+                continue
+            with job.lock:
+                job.started_at = time.time()
+                job.status = "running"
+            result, error = None, None
+            try:
+                result = job.fn(*job.args, report=job.add_event)
+            except Exception as e:
+                print(f"❌ Job {job.id} failed: {str(e)}")
+                error = str(e)
+            # Readers that see a finished status also see its result and timestamps
+            with job.lock:
+                job.result = result
+                job.error = error
+                job.finished_at = time.time()
+                job.fn = job.args = None
+                job.status = "completed" if error is None else "failed"
+
+    def stats(self):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        counts = {}
+        for job in jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"workers": self.workers, "queued": len(self.queue), "jobs": counts}
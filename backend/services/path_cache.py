@@ -0,0 +1,143 @@
+"""
+Result cache for generated learning paths
+Requests with near-identical student profiles share one GA run: profiles are
+normalized into a fingerprint and the resulting module sequence is cached in
+memory (LRU + TTL) with an optional on-disk tier
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+
+
+def profile_fingerprint(student_data, ga_params, proficiency_step=5, time_bucket_minutes=30):
+    """Hashable key of everything that decides the generated path
+
+    Proficiencies are rounded to proficiency_step points and weekly time to
+    time_bucket_minutes, so profiles that differ only by noise share a key.
+    """
+    concepts = tuple(sorted(
+        (concept, int(round(score / proficiency_step)) * proficiency_step)
+        for concept, score in student_data.known_concepts.items()
+    ))
+    return (
+        student_data.goal,
+        student_data.target_score,
+        student_data.available_time_week // time_bucket_minutes,
+        student_data.preferred_difficulty_pace,
+        concepts,
+        tuple(sorted(ga_params.items())),
+    )
+
+
+class PathCache:
+    """LRU + TTL cache of generated paths, optionally backed by one JSON file per entry
+
+    Entries are plain dicts (module ids, fitness, run info) so responses can
+    be rebuilt for each requesting student.
+    """
+
+    def __init__(self, max_size=1024, ttl_seconds=3600, disk_dir=None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self._entries = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    @staticmethod
+    def _digest(key):
+        return hashlib.sha1(repr(key).encode()).hexdigest()
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{self._digest(key)}.json")
+
+    def get(self, key):
+        """Cached entry for a fingerprint, or None"""
+        now = time.time()
+        item = self._entries.get(key)
+        if item is not None:
+            expires_at, entry = item
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+            del self._entries[key]
+            self.expirations += 1
+
+        if self.disk_dir:
+            entry = self._load_from_disk(key, now)
+            if entry is not None:
+                self.disk_hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key, entry):
+        expires_at = time.time() + self.ttl_seconds
+        self._store_in_memory(key, expires_at, entry)
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(key), "w") as f:
+                    json.dump({"expires_at": expires_at, "entry": entry}, f)
+            except OSError as e:
+                print(f"⚠️  Could not write path cache entry: {e}")
+
+    def _store_in_memory(self, key, expires_at, entry):
+        self._entries[key] = (expires_at, entry)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load_from_disk(self, key, now):
+        path = self._disk_path(key)
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data["expires_at"] <= now:
+            self.expirations += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        # Promote to the memory tier with its original expiry
+        self._store_in_memory(key, data["expires_at"], data["entry"])
+        return data["entry"]
+
+    def clear(self):
+        self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def stats(self):
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "disk_tier": bool(self.disk_dir),
+        }
@@ -0,0 +1,6 @@
+"""Shared pytest setup: make the backend modules importable"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
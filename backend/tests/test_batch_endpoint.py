@@ -0,0 +1,53 @@
+"""
+/generate-paths/batch against a small thread executor
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from services.ga_executor import GAExecutor
+
+
+def quick_ga_params(seed=None):
+    return {"population_size": 8, "generations": 2, "mutation_rate": 0.1, "seed": seed}
+
+
+def student(index):
+    return {
+        "name": f"Student {index}",
+        "target_score": 160,
+        "available_time_week": 300 + 30 * index,
+        "known_concepts": {"algebra": 40.0, "geometry": float(index % 100)},
+    }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    executor = GAExecutor(kind="thread", workers=2, max_pending=4)
+    monkeypatch.setattr(main, "ga_executor", executor)
+    monkeypatch.setattr(main, "default_ga_params", quick_ga_params)
+    yield TestClient(main.app)
+    executor.shutdown()
+
+
+def test_cohort_larger_than_executor_queue(client):
+    cohort_size = 3 * main.ga_executor.max_pending
+    response = client.post("/generate-paths/batch", json={"students": [student(i) for i in range(cohort_size)], "seed": 1})
+
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["index"] for row in rows) == list(range(cohort_size))
+    assert all("path" in row for row in rows)
+    assert main.ga_executor.stats()["rejected"] == 0
+    assert main.ga_executor.pending == 0
+
+
+def test_batch_rejected_only_when_executor_is_full(client):
+    main.ga_executor.pending = main.ga_executor.max_pending
+    response = client.post("/generate-paths/batch", json={"students": [student(0)]})
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
@@ -0,0 +1,38 @@
+"""
+Prerequisite validation and snapshots in data.catalog_loader
+"""
+
+import pytest
+
+from data.catalog_loader import (
+    MAX_MODULE_ID, CatalogError, read_snapshot, validate_catalog_data, write_snapshot,
+)
+
+
+def catalog(*prerequisites):
+    """Two-module catalog where module 2 has the given prerequisite ids"""
+    module = {"name": "Module", "difficulty": 1, "time_estimate": 30, "concepts": ["algebra"]}
+    return {"modules": [dict(module, id=1), dict(module, id=2, prerequisites=list(prerequisites))]}
+
+
+def test_valid_prerequisites_pass():
+    validate_catalog_data(catalog(1), "test")
+
+
+@pytest.mark.parametrize("prereq_id", [True, -1, MAX_MODULE_ID + 1, 99])
+def test_invalid_or_unknown_prerequisite_ids_are_rejected(prereq_id):
+    # True == 1 would otherwise pass as a reference to module 1
+    with pytest.raises(CatalogError):
+        validate_catalog_data(catalog(prereq_id), "test")
+
+
+def test_snapshot_round_trip(tmp_path):
+    source = tmp_path / "catalog.json"
+    source.write_text('{"name": "test", "modules": [{"id": 1, "name": "Module", "difficulty": 1, '
+                      '"time_estimate": 30, "concepts": ["algebra"]}]}')
+    snapshot = tmp_path / "catalog.snapshot.pickle"
+    write_snapshot(str(source), str(snapshot))
+    name, modules = read_snapshot(str(snapshot), str(source))
+    assert name == "test" and [module.id for module in modules] == [1]
+    snapshot.write_bytes(b"")
+    assert read_snapshot(str(snapshot), str(source)) is None
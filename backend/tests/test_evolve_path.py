@@ -0,0 +1,22 @@
+"""
+Engine and timing metadata on paths returned by the executor entry points
+"""
+
+import queue
+
+import pytest
+
+from models.student import create_synthetic_students
+from services.ga_executor import evolve_path, evolve_with_progress
+
+GA_PARAMS = {"population_size": 10, "generations": 3, "seed": 7}
+
+
+@pytest.mark.parametrize("run", [
+    lambda student: evolve_path(GA_PARAMS, student, {}, engine="ga"),
+    lambda student: evolve_with_progress(GA_PARAMS, student, {}, queue.Queue()),
+])
+def test_plain_ga_records_engine_and_solve_time(run):
+    best_path = run(create_synthetic_students(1, seed=1)[0])
+    assert best_path.engine == "ga"
+    assert best_path.solve_time_ms > 0
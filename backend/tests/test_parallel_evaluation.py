@@ -0,0 +1,33 @@
+"""
+Worker-pool lifetime of LearningPathGA(parallel_workers=...)
+"""
+
+import gc
+import multiprocessing
+
+from genetic_algorithm import LearningPathGA
+from models.student import create_synthetic_students
+
+
+def score_once(ga):
+    student = create_synthetic_students(1, seed=1)[0]
+    population = [ga.LearningPath(ga.modules[i:i + 8]) for i in range(0, 40, 8)]
+    ga.evaluate_population(population, student)
+    return population
+
+
+def test_context_manager_releases_pool():
+    with LearningPathGA(parallel_workers=2, fitness_cache_size=0) as ga:
+        assert all(path.fitness > 0 for path in score_once(ga))
+        assert multiprocessing.active_children()
+    assert ga.parallel_evaluator is None
+    assert not multiprocessing.active_children()
+
+
+def test_dropped_ga_releases_pool():
+    ga = LearningPathGA(parallel_workers=2, fitness_cache_size=0)
+    score_once(ga)
+    assert multiprocessing.active_children()
+    del ga
+    gc.collect()
+    assert not multiprocessing.active_children()
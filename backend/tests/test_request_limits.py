@@ -0,0 +1,57 @@
+"""
+Bounds on client-supplied GA settings
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from ga_config import MAX_GENERATIONS, MAX_POPULATION_SIZE, MAX_REPLAN_GENERATIONS, MAX_REPLAN_TIME_BUDGET_MS
+
+STUDENT = {"name": "Student", "target_score": 160, "available_time_week": 300, "known_concepts": {"algebra": 40.0}}
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("population_size", 0),
+    ("population_size", MAX_POPULATION_SIZE + 1),
+    ("generations", -5),
+    ("generations", MAX_GENERATIONS + 1),
+])
+def test_job_rejects_out_of_range_ga_settings(client, field, value):
+    response = client.post("/jobs/generate-path", json=dict(STUDENT, **{field: value}))
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("body", [
+    {"generations": 0},
+    {"generations": MAX_REPLAN_GENERATIONS + 1},
+    {"time_budget_ms": None},
+    {"time_budget_ms": 0},
+    {"time_budget_ms": MAX_REPLAN_TIME_BUDGET_MS + 1},
+])
+def test_replan_rejects_unbounded_runs(client, body):
+    response = client.post("/student/some-student/replan", json=body)
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("extra", [
+    {"weights": {"not_an_objective": 1.0}},
+    {"time_budget_ms": 500},
+    {"engine": "auto"},
+])
+def test_pareto_rejects_bad_options_before_running(client, monkeypatch, extra):
+    submitted = []
+    monkeypatch.setattr(main.ga_executor, "run", lambda *args: submitted.append(args))
+    response = client.post("/generate-path/pareto", json=dict(STUDENT, **extra))
+    assert response.status_code == 422
+    assert not submitted
+
+
+def test_pareto_select_rejects_unknown_objectives(client):
+    response = client.post("/pareto/missing/select", json={"weights": {"not_an_objective": 1.0}})
+    assert response.status_code == 422